@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OverloadedError(Exception):
+    """Raised when a call is rejected because a server's admission queue is full."""
+
+    pass
+
+
+class LatencyStats:
+    """Running count, total and maximum of a latency measured in seconds."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the stats to a dictionary (times in milliseconds)."""
+        return {
+            "count": self.count,
+            "avg_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+class AdmissionController:
+    """Bounds the calls sent to one proxied server at once.
+
+    Up to ``max_concurrency`` calls run concurrently; further calls wait in a
+    FIFO queue of at most ``max_queue`` entries and anything beyond that is
+    rejected immediately with OverloadedError. Time spent queued and time spent
+    executing are recorded separately.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ):
+        """Initializes the controller.
+
+        Args:
+            server_name: Name of the server, used in errors and logs.
+            max_concurrency: Maximum calls in flight (None for unlimited).
+            max_queue: Maximum calls waiting for a slot (None for unlimited).
+                Only applies when max_concurrency is set.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency for server '{server_name}' must be at least 1"
+            )
+        if max_queue is not None and max_queue < 0:
+            raise ValueError(f"max_queue for server '{server_name}' must not be negative")
+        self.server_name = server_name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+        self.queue_wait = LatencyStats()
+        self.execution = LatencyStats()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Holds a concurrency slot for the duration of the block.
+
+        Raises:
+            OverloadedError: If all slots are busy and the queue is full.
+        """
+        enqueued_at = time.monotonic()
+        if self._semaphore is not None:
+            if (
+                self._semaphore.locked()
+                and self.max_queue is not None
+                and self.queued >= self.max_queue
+            ):
+                self.rejected += 1
+                raise OverloadedError(
+                    f"Server '{self.server_name}' is overloaded: "
+                    f"{self.active} calls in flight and {self.queued} queued "
+                    f"(max_concurrency={self.max_concurrency}, max_queue={self.max_queue})."
+                )
+            self.queued += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.queued -= 1
+
+        started_at = time.monotonic()
+        self.queue_wait.record(started_at - enqueued_at)
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.execution.record(time.monotonic() - started_at)
+            if self._semaphore is not None:
+                self._semaphore.release()
+            logger.debug(
+                f"Call to '{self.server_name}' queued {(started_at - enqueued_at) * 1000:.1f}ms, "
+                f"executed {(time.monotonic() - started_at) * 1000:.1f}ms"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns limits, current load and latency breakdown for metadata reporting."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.to_dict(),
+            "execution": self.execution.to_dict(),
+        }
@@ -0,0 +1,367 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp import types
+
+from mcp_gateway.resources import (
+    contents_from_bytes,
+    contents_to_bytes,
+    strip_contents,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default memory budget of the tool result cache (64 MiB)
+DEFAULT_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Default budgets of the resource cache: 64 MiB in memory, 1 GiB on disk
+DEFAULT_RESOURCE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_RESOURCE_CACHE_SPILL_MAX_BYTES = 1024 * 1024 * 1024
+# Resource bodies at least this large are kept on disk instead of in memory
+DEFAULT_RESOURCE_CACHE_SPILL_THRESHOLD = 1024 * 1024
+
+CacheKey = Tuple[str, str, str]
+
+
+def canonicalize_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """Returns a stable string form of tool arguments, independent of key order."""
+    return json.dumps(
+        arguments or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+def tool_call_key(
+    server_name: str, tool_name: str, arguments: Optional[Dict[str, Any]]
+) -> CacheKey:
+    """Identifies a tool call by server, tool and canonicalized arguments."""
+    return server_name, tool_name, canonicalize_arguments(arguments)
+
+
+@dataclass
+class _CacheEntry:
+    result: types.CallToolResult
+    size: int
+    expires_at: float
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class ToolResultCache:
+    """LRU cache of sanitized tool results bounded by their serialized size.
+
+    Only tools with a TTL configured are cached (see ``tool_cache_ttls`` in the
+    server config). Results are stored after the response guardrails ran, so a
+    hit is returned without calling the upstream server or any plugin.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES):
+        """Initializes the cache.
+
+        Args:
+            max_bytes: Upper bound for the total serialized size of cached results.
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._counters: Dict[str, _Counters] = {}
+
+    def _counters_for(self, server_name: str) -> _Counters:
+        counters = self._counters.get(server_name)
+        if counters is None:
+            counters = self._counters[server_name] = _Counters()
+        return counters
+
+    def get(self, key: CacheKey) -> Optional[types.CallToolResult]:
+        """Returns the cached result for a call, or None on a miss or expired entry."""
+        counters = self._counters_for(key[0])
+        entry = self._entries.get(key)
+        if entry is None:
+            counters.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            counters.expirations += 1
+            counters.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        counters.hits += 1
+        return entry.result
+
+    def put(self, key: CacheKey, result: types.CallToolResult, ttl: float) -> None:
+        """Stores a result for ttl seconds, evicting least recently used entries
+        until the cache fits within max_bytes."""
+        size = len(result.model_dump_json(by_alias=True))
+        if size > self.max_bytes:
+            logger.debug(
+                f"Not caching result of {key[0]}/{key[1]}: {size} bytes exceeds cache size."
+            )
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(result, size, time.monotonic() + ttl)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+            self._counters_for(evicted_key[0]).evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+
+    def invalidate(self, server_name: str) -> None:
+        """Drops all cached results of a server."""
+        for key in [key for key in self._entries if key[0] == server_name]:
+            self._remove(key)
+
+    def stats(self, server_name: str) -> Dict[str, Any]:
+        """Returns a server's hit/miss/eviction counters and its cached entry count."""
+        counters = self._counters_for(server_name)
+        return {
+            "hits": counters.hits,
+            "misses": counters.misses,
+            "evictions": counters.evictions,
+            "expirations": counters.expirations,
+            "entries": sum(1 for key in self._entries if key[0] == server_name),
+            "cache_bytes": self.total_bytes,
+            "cache_max_bytes": self.max_bytes,
+        }
+
+
+ResourceKey = Tuple[str, str]
+
+
+@dataclass
+class _Body:
+    """One distinct resource body, shared by every cached item with its digest."""
+
+    size: int
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+    refs: int = 0
+
+
+@dataclass
+class _ResourceEntry:
+    # (item without its content, body digest, mime type) per item of the read
+    items: List[Tuple[Any, str, Optional[str]]]
+    expires_at: float
+    digests: List[str] = field(default_factory=list)
+
+
+class ResourceCache:
+    """LRU cache of sanitized resource reads, keyed by server and URI.
+
+    Each item of a read is stored as its sanitized bytes and MIME type, after
+    the response guardrails ran, so a hit is answered without contacting the
+    upstream server or running any plugin. Bodies are stored once per SHA-256
+    digest however many resources share them. Bodies of at least
+    spill_threshold bytes are written to files in spill_dir rather than kept
+    in memory. Memory and disk usage are bounded separately; the least
+    recently read resources are evicted when either budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_RESOURCE_CACHE_MAX_BYTES,
+        spill_threshold: int = DEFAULT_RESOURCE_CACHE_SPILL_THRESHOLD,
+        spill_max_bytes: int = DEFAULT_RESOURCE_CACHE_SPILL_MAX_BYTES,
+        spill_dir: Optional[str] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_bytes: Upper bound for the bodies kept in memory.
+            spill_threshold: Size from which a body is kept on disk.
+            spill_max_bytes: Upper bound for the bodies kept on disk.
+            spill_dir: Directory in which a private spill directory is
+                created on first use. Defaults to the system temp directory.
+        """
+        self.max_bytes = max_bytes
+        self.spill_threshold = spill_threshold
+        self.spill_max_bytes = spill_max_bytes
+        self.memory_bytes = 0
+        self.spilled_bytes = 0
+        self._spill_parent = spill_dir
+        self._spill_dir: Optional[str] = None
+        self._entries: "OrderedDict[ResourceKey, _ResourceEntry]" = OrderedDict()
+        self._bodies: Dict[str, _Body] = {}
+        self._counters: Dict[str, _Counters] = {}
+
+    def _counters_for(self, server_name: str) -> _Counters:
+        counters = self._counters.get(server_name)
+        if counters is None:
+            counters = self._counters[server_name] = _Counters()
+        return counters
+
+    def _read_body(self, digest: str) -> bytes:
+        body = self._bodies[digest]
+        if body.data is not None:
+            return body.data
+        with open(body.path, "rb") as f:
+            return f.read()
+
+    def get(self, server_name: str, uri: str) -> Optional[types.ReadResourceResult]:
+        """Returns the cached read of a resource, or None on a miss or expired entry."""
+        key = (server_name, uri)
+        counters = self._counters_for(server_name)
+        entry = self._entries.get(key)
+        if entry is None:
+            counters.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            counters.expirations += 1
+            counters.misses += 1
+            return None
+        try:
+            contents = [
+                contents_from_bytes(item, self._read_body(digest), mime_type)
+                for item, digest, mime_type in entry.items
+            ]
+        except OSError as e:
+            logger.warning(f"Dropping cached read of {uri} from '{server_name}': {e}")
+            self._remove(key)
+            counters.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        counters.hits += 1
+        return types.ReadResourceResult(contents=contents)
+
+    def put(
+        self,
+        server_name: str,
+        uri: str,
+        result: types.ReadResourceResult,
+        ttl: float,
+    ) -> None:
+        """Stores a sanitized read for ttl seconds, evicting least recently read
+        resources until both budgets are met."""
+        key = (server_name, uri)
+        if key in self._entries:
+            self._remove(key)
+        items = []
+        bodies = []
+        for item in result.contents:
+            data, mime_type = contents_to_bytes(item)
+            if len(data) >= self.spill_threshold:
+                if len(data) > self.spill_max_bytes:
+                    logger.debug(f"Not caching {uri} of '{server_name}': too large.")
+                    return
+            elif len(data) > self.max_bytes:
+                logger.debug(f"Not caching {uri} of '{server_name}': too large.")
+                return
+            # Only the bytes are kept for the content, not a second copy
+            items.append(
+                (strip_contents(item), hashlib.sha256(data).hexdigest(), mime_type)
+            )
+            bodies.append(data)
+        retained: List[str] = []
+        try:
+            for (_, digest, _), data in zip(items, bodies):
+                self._retain(digest, data)
+                retained.append(digest)
+        except OSError as e:
+            logger.warning(f"Not caching {uri} of '{server_name}': {e}")
+            for digest in retained:
+                self._release(digest)
+            return
+        self._entries[key] = _ResourceEntry(items, time.monotonic() + ttl, retained)
+        while self._entries and (
+            self.memory_bytes > self.max_bytes
+            or self.spilled_bytes > self.spill_max_bytes
+        ):
+            evicted_key = next(iter(self._entries))
+            self._remove(evicted_key)
+            self._counters_for(evicted_key[0]).evictions += 1
+
+    def _retain(self, digest: str, data: bytes) -> None:
+        body = self._bodies.get(digest)
+        if body is None:
+            body = _Body(len(data))
+            if len(data) >= self.spill_threshold:
+                body.path = self._spill(digest, data)
+                self.spilled_bytes += body.size
+            else:
+                body.data = data
+                self.memory_bytes += body.size
+            self._bodies[digest] = body
+        body.refs += 1
+
+    def _spill(self, digest: str, data: bytes) -> str:
+        if self._spill_dir is None:
+            if self._spill_parent:
+                os.makedirs(self._spill_parent, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(
+                prefix="mcp-gateway-resources-", dir=self._spill_parent
+            )
+        path = os.path.join(self._spill_dir, digest)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _release(self, digest: str) -> None:
+        body = self._bodies[digest]
+        body.refs -= 1
+        if body.refs > 0:
+            return
+        del self._bodies[digest]
+        if body.path is None:
+            self.memory_bytes -= body.size
+            return
+        self.spilled_bytes -= body.size
+        try:
+            os.remove(body.path)
+        except OSError as e:
+            logger.debug(f"Failed to remove spilled resource {body.path}: {e}")
+
+    def _remove(self, key: ResourceKey) -> None:
+        entry = self._entries.pop(key)
+        for digest in entry.digests:
+            self._release(digest)
+
+    def invalidate(self, server_name: str, uri: Optional[str] = None) -> None:
+        """Drops the cached read of one resource, or of all a server's resources."""
+        if uri is not None:
+            if (server_name, uri) in self._entries:
+                self._remove((server_name, uri))
+            return
+        for key in [key for key in self._entries if key[0] == server_name]:
+            self._remove(key)
+
+    def close(self) -> None:
+        """Drops every entry and deletes the spill directory."""
+        for key in list(self._entries):
+            self._remove(key)
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def stats(self, server_name: str) -> Dict[str, Any]:
+        """Returns a server's hit/miss/eviction counters and its cached entry count."""
+        counters = self._counters_for(server_name)
+        return {
+            "hits": counters.hits,
+            "misses": counters.misses,
+            "evictions": counters.evictions,
+            "expirations": counters.expirations,
+            "entries": sum(1 for key in self._entries if key[0] == server_name),
+            "memory_bytes": self.memory_bytes,
+            "spilled_bytes": self.spilled_bytes,
+            "cache_max_bytes": self.max_bytes,
+            "spill_max_bytes": self.spill_max_bytes,
+        }
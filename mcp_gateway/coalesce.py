@@ -0,0 +1,74 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A shared call and the number of callers currently waiting on it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its outcome.
+
+    The shared call runs in its own task, so a caller that is cancelled or
+    times out stops waiting without affecting the others. The shared call is
+    only cancelled once every caller waiting on it has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Returns the result of ``call()``, joining an identical call in flight.
+
+        Args:
+            key: Identifies calls that may share a result.
+            call: Starts the call; only invoked if no call with this key is running.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.create_task(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self._finished, key, flight))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last waiter gone: nobody needs the result any more
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finished(self, key: Hashable, flight: _Flight, task: asyncio.Task) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns counters of started and coalesced calls."""
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
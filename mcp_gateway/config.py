@@ -161,3 +161,39 @@ def load_config(mcp_json_path: str) -> Dict[str, Any]:
         )
         logger.warning("Using empty configuration for proxied servers.")
         return {}  # Return empty dict
+
+
+def load_gateway_settings(mcp_json_path: str) -> Dict[str, Any]:
+    """Loads the MCP gateway's own settings.
+
+    Gateway-wide options live in the gateway's entry within the top-level
+    'mcpServers' dict, next to the nested "servers" key (for example
+    "snapshot_dir").
+
+    Args:
+        mcp_json_path: Path to the mcp.json configuration file.
+
+    Returns:
+        The gateway entry without its "servers" key. Returns an empty dictionary
+        if the file or the gateway entry cannot be found or read.
+    """
+    found_path = find_config_file(mcp_json_path) if mcp_json_path else None
+    if not found_path:
+        return {}
+
+    try:
+        with open(found_path, "r") as f:
+            full_config_data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Error reading gateway settings from {found_path}: {e}")
+        return {}
+
+    top_level_mcp_servers = full_config_data.get("mcpServers")
+    if not isinstance(top_level_mcp_servers, dict) or not top_level_mcp_servers:
+        return {}
+
+    gateway_config = next(iter(top_level_mcp_servers.values()))
+    if not isinstance(gateway_config, dict):
+        return {}
+
+    return {key: value for key, value in gateway_config.items() if key != "servers"}
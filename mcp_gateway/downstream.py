@@ -0,0 +1,84 @@
+import functools
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, Iterable
+
+from mcp.server.lowlevel import NotificationOptions
+from mcp.server.lowlevel import Server as LowLevelServer
+from mcp.server.lowlevel.server import request_ctx
+
+logger = logging.getLogger(__name__)
+
+# Capability list kinds that can change at runtime
+LIST_KINDS = ("tools", "prompts", "resources")
+
+
+class DownstreamSessions:
+    """Tracks the client sessions connected to the gateway so they can be notified.
+
+    Every request handler of the gateway's low-level server is wrapped to
+    remember the session it was called from. The gateway also advertises
+    ``listChanged`` support for tools, prompts and resources.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def install(self, server: LowLevelServer) -> None:
+        """Wraps the server's request handlers and initialization options."""
+        for request_type, handler in list(server.request_handlers.items()):
+            server.request_handlers[request_type] = self._tracking(handler)
+
+        create_initialization_options = server.create_initialization_options
+
+        @functools.wraps(create_initialization_options)
+        def with_list_changed(notification_options=None, experimental_capabilities=None):
+            return create_initialization_options(
+                notification_options
+                or NotificationOptions(
+                    prompts_changed=True, resources_changed=True, tools_changed=True
+                ),
+                experimental_capabilities,
+            )
+
+        server.create_initialization_options = with_list_changed
+
+    def _tracking(self, handler: Callable[[Any], Awaitable[Any]]):
+        @functools.wraps(handler)
+        async def tracked(request: Any) -> Any:
+            self.add(request_ctx.get().session)
+            return await handler(request)
+
+        return tracked
+
+    def add(self, session: Any) -> None:
+        """Remembers a client session."""
+        self._sessions.add(session)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def notify_list_changed(self, kinds: Iterable[str]) -> None:
+        """Sends listChanged notifications of the given kinds to every session.
+
+        Sessions that can no longer be written to are forgotten.
+        """
+        requested = set(kinds)
+        kinds = [kind for kind in LIST_KINDS if kind in requested]
+        if not kinds:
+            return
+        for session in list(self._sessions):
+            try:
+                for kind in kinds:
+                    if kind == "tools":
+                        await session.send_tool_list_changed()
+                    elif kind == "prompts":
+                        await session.send_prompt_list_changed()
+                    else:
+                        await session.send_resource_list_changed()
+            except Exception as e:
+                logger.debug(f"Dropping downstream session that failed to notify: {e!r}")
+                self._sessions.discard(session)
+        logger.info(
+            f"Sent {', '.join(kinds)} listChanged to {len(self._sessions)} client sessions."
+        )
@@ -0,0 +1,140 @@
+import base64
+import bisect
+import functools
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from mcp import types
+from mcp.server.lowlevel import Server as LowLevelServer
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.exceptions import McpError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# List requests the gateway paginates: the result field holding the items and
+# the item attribute the pages are ordered by
+PAGINATED_LISTS = {
+    types.ListToolsRequest: ("tools", lambda item: item.name),
+    types.ListPromptsRequest: ("prompts", lambda item: item.name),
+    types.ListResourcesRequest: ("resources", lambda item: str(item.uri)),
+    types.ListResourceTemplatesRequest: (
+        "resourceTemplates",
+        lambda item: item.uriTemplate,
+    ),
+}
+
+
+# Upstream lists fetched by the gateway, by result field: the request type,
+# its method, the result type and the item type
+UPSTREAM_LISTS = {
+    "tools": (types.ListToolsRequest, "tools/list", types.ListToolsResult, types.Tool),
+    "prompts": (
+        types.ListPromptsRequest,
+        "prompts/list",
+        types.ListPromptsResult,
+        types.Prompt,
+    ),
+    "resources": (
+        types.ListResourcesRequest,
+        "resources/list",
+        types.ListResourcesResult,
+        types.Resource,
+    ),
+    "resourceTemplates": (
+        types.ListResourceTemplatesRequest,
+        "resources/templates/list",
+        types.ListResourceTemplatesResult,
+        types.ResourceTemplate,
+    ),
+}
+
+
+def list_request(request_type: type, method: str, cursor: Optional[str]) -> Any:
+    """Builds a list request for the page at cursor."""
+    return types.ClientRequest(request_type(method=method, cursor=cursor))
+
+
+def encode_cursor(last_key: str) -> str:
+    """Returns the opaque cursor of the page following the item with last_key."""
+    return base64.urlsafe_b64encode(last_key.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Returns the key of the last item before the page a cursor points at.
+
+    Raises:
+        McpError: With INVALID_PARAMS if the cursor was not made by the gateway.
+    """
+    try:
+        return base64.b64decode(cursor, altchars=b"-_", validate=True).decode("utf-8")
+    except (ValueError, UnicodeError):
+        raise McpError(
+            types.ErrorData(code=types.INVALID_PARAMS, message="Invalid cursor")
+        )
+
+
+def paginate(
+    items: Sequence[T],
+    key: Callable[[T], str],
+    cursor: Optional[str],
+    page_size: int,
+) -> Tuple[List[T], Optional[str]]:
+    """Returns one page of items in key order, and the cursor of the next one.
+
+    Cursors name the last item returned rather than an offset, so items added
+    or removed between two requests neither shift a client's position nor
+    make it see an item twice.
+
+    Returns:
+        (page, next_cursor), where next_cursor is None on the last page.
+    """
+    ordered = sorted(items, key=key)
+    start = 0
+    if cursor is not None:
+        keys = [key(item) for item in ordered]
+        start = bisect.bisect_right(keys, decode_cursor(cursor))
+    page = ordered[start : start + page_size]
+    if start + page_size >= len(ordered):
+        return page, None
+    return page, encode_cursor(key(page[-1]))
+
+
+def install_pagination(
+    server: LowLevelServer, page_size: Callable[[Any], Optional[int]]
+) -> None:
+    """Paginates the tools, prompts, resources and resource template lists.
+
+    Wraps the server's list handlers so their full results are cut into pages
+    of page_size(lifespan_context) items in key order. A page size of None
+    returns everything in one response, as without pagination.
+    """
+    for request_type, (field_name, key) in PAGINATED_LISTS.items():
+        handler = server.request_handlers.get(request_type)
+        if handler is not None:
+            server.request_handlers[request_type] = _paginated(
+                handler, field_name, key, page_size
+            )
+
+
+def _paginated(
+    handler: Callable[[Any], Awaitable[types.ServerResult]],
+    field_name: str,
+    key: Callable[[Any], str],
+    page_size: Callable[[Any], Optional[int]],
+):
+    @functools.wraps(handler)
+    async def paginated(request: Any) -> types.ServerResult:
+        result = await handler(request)
+        size = page_size(request_ctx.get().lifespan_context)
+        if not size:
+            return result
+        page, next_cursor = paginate(
+            getattr(result.root, field_name), key, request.cursor, size
+        )
+        return types.ServerResult(
+            result.root.model_copy(update={field_name: page, "nextCursor": next_cursor})
+        )
+
+    return paginated
@@ -1,9 +1,19 @@
 import abc
 import logging
+import time
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Where a plugin's synchronous methods run: on the event loop, in a thread
+# pool, or in a pool of processes each holding its own loaded copy of it
+EXECUTION_INLINE = "inline"
+# For CPU-bound plugins such as regex and NLP scanners: inline, each scan
+# would stall every other call on the event loop
+EXECUTION_THREAD = "thread"
+EXECUTION_PROCESS = "process"
+EXECUTION_MODES = (EXECUTION_INLINE, EXECUTION_THREAD, EXECUTION_PROCESS)
+
 
 class PluginContext:
     """Holds contextual information for plugin execution."""
@@ -16,6 +26,7 @@ class PluginContext:
         arguments: Optional[Dict[str, Any]] = None,
         response: Any = None,
         mcp_context: Optional[Any] = None,  # Placeholder for FastMCP Context if needed
+        deadline: Optional[float] = None,  # time.monotonic() value the call must finish by
     ):
         self.server_name = server_name
         self.capability_type = capability_type
@@ -23,6 +34,7 @@ class PluginContext:
         self.arguments = arguments
         self.response = response
         self.mcp_context = mcp_context
+        self.deadline = deadline
         logger.debug(
             f"PluginContext created for {server_name}/{capability_type}/{capability_name}"
         )
@@ -36,7 +48,18 @@ class PluginContext:
             "arguments": self.arguments,
             "response": self.response,
             "mcp_context": self.mcp_context,
+            "deadline": self.deadline,
         }
+
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the call's deadline, or None if it has no deadline.
+
+        Plugins doing expensive checks can use this to shorten or skip them
+        instead of letting the whole call time out.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
     
     def _replace(self, arguments: Dict[str,Any]) -> bool:
         self.arguments = arguments
@@ -54,12 +77,40 @@ class Plugin(abc.ABC):
     plugin_name: str = (
         ""  # Should be set by concrete plugin implementations for easy identification
     )
+    # Guardrails that only return a verdict, never rewritten content, set this
+    # so the PluginManager can run them concurrently with each other, after
+    # the rewriting guardrails.
+    # A detect-only plugin returns what it was given to let it through, and
+    # None (requests) or a replacement (responses) to block it.
+    detect_only: bool = False
+    # Where synchronous process_request/process_response calls run, one of
+    # EXECUTION_MODES; the "execution" plugin setting overrides it.
+    execution_mode: str = EXECUTION_INLINE
 
     @abc.abstractmethod
     def load(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Load plugin configuration."""
         pass
 
+    def close(self) -> None:
+        """Releases what load() acquired; called once when the gateway stops.
+
+        Runs on the same thread as load() and the plugin's synchronous calls.
+        """
+        pass
+
+    def applies_to(
+        self, server_name: str, capability_type: str, capability_name: str
+    ) -> bool:
+        """Whether the plugin processes calls to the given capability.
+
+        Evaluated once per capability when the PluginManager compiles its
+        pipeline, so the answer must not change after the plugin is loaded.
+        Plugins that only care about some capabilities can override this to
+        be skipped entirely for the others.
+        """
+        return True
+
     @abc.abstractmethod
     def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
         """
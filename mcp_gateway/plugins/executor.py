@@ -0,0 +1,200 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+from mcp_gateway.plugins.base import (
+    EXECUTION_PROCESS,
+    EXECUTION_THREAD,
+    Plugin,
+    PluginContext,
+)
+from mcp_gateway.spill import SpilledBody
+
+logger = logging.getLogger(__name__)
+
+# The PluginContext attribute each plugin method works on
+_ATTRIBUTES = {"process_request": "arguments", "process_response": "response"}
+
+# Seconds start() waits for every worker process to start and load the plugin
+WARM_TIMEOUT = 120.0
+
+# The plugin loaded in a process pool worker
+_worker_plugin: Optional[Plugin] = None
+# Held by start()'s warm-up calls until one runs in every worker process
+_warm_barrier: Optional[threading.Barrier] = None
+
+
+class PluginExecutor:
+    """Runs a plugin's synchronous methods off the event loop.
+
+    In thread mode calls go to a thread pool of the given size; a pool of
+    one thread runs every call, and load(), on the same thread, for plugins
+    holding thread-bound state such as SQLite connections. In process
+    mode each worker process creates and loads its own instance of the
+    plugin once, when it starts, and calls are sent to it with a copy of the
+    context; contexts that cannot be sent to another process, such as spilled
+    resource bodies, run in a thread instead.
+    """
+
+    def __init__(
+        self,
+        plugin: Plugin,
+        mode: str,
+        workers: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            plugin: The plugin, loaded already or with load().
+            mode: EXECUTION_THREAD or EXECUTION_PROCESS.
+            workers: Pool size; the concurrent.futures default if None, and
+                one process per CPU in process mode.
+            config: The plugin's config, loaded by every worker process.
+
+        Raises:
+            ValueError: If mode is not a pool mode.
+        """
+        if mode not in (EXECUTION_THREAD, EXECUTION_PROCESS):
+            raise ValueError(f"Plugins cannot be run in '{mode}' pools")
+        self.plugin = plugin
+        self.mode = mode
+        self.workers = workers
+        self.name = plugin.__class__.__name__
+        self._threads = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"plugin-{self.name}"
+        )
+        self._processes: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        if mode == EXECUTION_PROCESS:
+            self.workers = workers or os.cpu_count() or 1
+            # Spawned rather than forked, as the gateway process runs threads
+            context = multiprocessing.get_context("spawn")
+            self._processes = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_load_worker_plugin,
+                initargs=(
+                    type(plugin),
+                    dict(config or {}),
+                    context.Barrier(self.workers),
+                ),
+            )
+
+    def load(self, config: Dict[str, Any]) -> None:
+        """Loads the plugin in this process on a thread of the pool."""
+        self._threads.submit(self.plugin.load, config).result()
+
+    def wrap(self, method: str) -> Callable[[PluginContext], Awaitable[Any]]:
+        """Returns an async function running the plugin's method in the pool."""
+        if self._processes is None:
+            call = getattr(self.plugin, method)
+
+            async def in_thread(context: PluginContext) -> Any:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._threads, call, context)
+
+            return in_thread
+
+        return functools.partial(self._in_process, method)
+
+    async def _in_process(self, method: str, context: PluginContext) -> Any:
+        loop = asyncio.get_running_loop()
+        if not _can_send(context):
+            return await loop.run_in_executor(
+                self._threads, getattr(self.plugin, method), context
+            )
+        # The FastMCP context belongs to this process and is left behind
+        sent = PluginContext(
+            server_name=context.server_name,
+            capability_type=context.capability_type,
+            capability_name=context.capability_name,
+            arguments=context.arguments,
+            response=context.response,
+            deadline=context.deadline,
+        )
+        result, unchanged = await loop.run_in_executor(
+            self._processes, _call_worker_plugin, method, sent
+        )
+        # Plugins letting a value through return the one they were given
+        return getattr(context, _ATTRIBUTES[method]) if unchanged else result
+
+    async def start(self) -> None:
+        """Starts every worker process and loads the plugin in it.
+
+        One warm-up call per worker is submitted, and each blocks on a barrier
+        until all of them are running, so no worker can take two of them.
+        """
+        if self._processes is None:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            pids = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._processes, _warm)
+                    for _ in range(self.workers)
+                )
+            )
+        except threading.BrokenBarrierError:
+            logger.warning(
+                f"Not every worker process of plugin {self.name} started "
+                f"within {WARM_TIMEOUT:g}s; the rest start on first use"
+            )
+            return
+        logger.info(
+            f"Started {len(set(pids))} worker processes for plugin {self.name}"
+        )
+
+    async def close(self) -> None:
+        """Closes the plugin on a thread of the pool, then stops the pools."""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._threads, self.plugin.close)
+        except Exception as e:
+            logger.error(f"Error closing plugin {self.name}: {e}", exc_info=True)
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stops the pools without waiting for calls still running."""
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+
+
+def _can_send(context: PluginContext) -> bool:
+    """Whether a context can be pickled to a worker process."""
+    response = context.response
+    if isinstance(response, tuple):
+        return not any(isinstance(item, SpilledBody) for item in response)
+    return not isinstance(response, SpilledBody)
+
+
+def _load_worker_plugin(
+    plugin_cls: Type[Plugin], config: Dict[str, Any], barrier: threading.Barrier
+) -> None:
+    global _worker_plugin, _warm_barrier
+    _warm_barrier = barrier
+    _worker_plugin = plugin_cls()
+    _worker_plugin.load(config)
+
+
+def _warm() -> int:
+    _warm_barrier.wait(WARM_TIMEOUT)
+    return os.getpid()
+
+
+def _call_worker_plugin(method: str, context: PluginContext) -> Tuple[Any, bool]:
+    """Runs a method of the worker's plugin.
+
+    Returns:
+        (result, unchanged): unchanged is True, and result None, when the
+        plugin returned the value it was given, which is not sent back.
+    """
+    value = getattr(context, _ATTRIBUTES[method])
+    result = getattr(_worker_plugin, method)(context)
+    if result is value:
+        return None, True
+    return result, False
@@ -5,7 +5,8 @@ from typing import Any, Dict, Optional, List, Tuple
 # Removed Presidio imports
 
 from mcp import types
-from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.base import EXECUTION_THREAD, GuardrailPlugin, PluginContext
+from mcp_gateway.spill import SpilledBody, is_text_mime_type, rewrite_text
 
 # Import SanitizationError if needed for response handling
 # from mcp_gateway.sanitizers import SanitizationError
@@ -76,6 +77,7 @@ class BasicGuardrailPlugin(GuardrailPlugin):
     """
 
     plugin_name = "basic"
+    execution_mode = EXECUTION_THREAD
 
     def __init__(self):
         # Removed Presidio-related attributes
@@ -243,6 +245,23 @@ class BasicGuardrailPlugin(GuardrailPlugin):
                 # Not text, return original
                 return content_bytes, mime_type
 
+        # --- Handle spilled Resource Reads (Tuple[SpilledBody, Optional[str]]) ---
+        elif (
+            isinstance(response, tuple)
+            and len(response) == 2
+            and isinstance(response[0], SpilledBody)
+        ):
+            body, mime_type = response
+            if not is_text_mime_type(mime_type):
+                return response
+            # Scan window by window instead of decoding the whole body
+            sanitized_body, changed = rewrite_text(body, self._sanitize_text)
+            if changed:
+                logger.info(
+                    f"Cleaned secrets from spilled text-based resource response for {context.server_name}/{context.capability_name}"
+                )
+            return sanitized_body, mime_type
+
         # --- Handle GetPromptResult ---
         elif isinstance(response, types.GetPromptResult) and response.messages:
             sanitized_messages = []
@@ -30,6 +30,8 @@ class LassoGuardrailPlugin(GuardrailPlugin):
     """
 
     plugin_name = "lasso"
+    # Only classifies content and blocks it, so runs alongside other detectors
+    detect_only = True
 
     def __init__(self):
         self.lasso_api_key: Optional[str] = None
@@ -105,7 +107,10 @@ class LassoGuardrailPlugin(GuardrailPlugin):
         return {"messages": messages}
 
     async def _call_lasso_api(
-        self, headers: Dict[str, str], payload: Dict[str, Any]
+        self,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        timeout: float = 10.0,
     ) -> Dict[str, Any]:
         """Call the Lasso API and return the response."""
         logger.debug(f"Sending request to Lasso API: {payload}")
@@ -117,7 +122,7 @@ class LassoGuardrailPlugin(GuardrailPlugin):
                 url=self.api_base,
                 headers=headers,
                 json=payload,
-                timeout=10.0,
+                timeout=timeout,
             )
             response.raise_for_status()
             res = response.json()
@@ -147,6 +152,11 @@ class LassoGuardrailPlugin(GuardrailPlugin):
             )
             raise LassoGuardrailAPIError(error_message)
 
+    def _api_timeout(self, context: PluginContext) -> float:
+        """Caps the API timeout to what is left of the call's deadline."""
+        remaining = context.remaining_time()
+        return 10.0 if remaining is None else min(10.0, remaining)
+
     def _parse_violated_deputies(self, response: Dict[str, Any]) -> List[str]:
         """Parse the response to extract violated deputies."""
         violated_deputies = []
@@ -247,7 +257,9 @@ class LassoGuardrailPlugin(GuardrailPlugin):
             # Prepare and make API call
             headers = self._prepare_headers()
             payload = self._prepare_payload(messages)
-            response = await self._call_lasso_api(headers, payload)
+            response = await self._call_lasso_api(
+                headers, payload, self._api_timeout(context)
+            )
 
             # Process response
             try:
@@ -296,7 +308,9 @@ class LassoGuardrailPlugin(GuardrailPlugin):
             # Prepare and make API call
             headers = self._prepare_headers()
             payload = self._prepare_payload(messages)
-            response = await self._call_lasso_api(headers, payload)
+            response = await self._call_lasso_api(
+                headers, payload, self._api_timeout(context)
+            )
 
             # Process response
             try:
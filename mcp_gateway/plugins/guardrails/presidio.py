@@ -2,7 +2,8 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from mcp import types
-from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.base import EXECUTION_THREAD, GuardrailPlugin, PluginContext
+from mcp_gateway.spill import SpilledBody, is_text_mime_type, rewrite_text
 from mcp_gateway.plugins.manager import register_plugin
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,11 @@ class PresidioGuardrailPlugin(GuardrailPlugin):
     """
 
     plugin_name = "presidio"
+    execution_mode = EXECUTION_THREAD
+
+    # Bytes of a spilled resource analyzed at a time; below spaCy's default
+    # limit of a million characters per text
+    SCAN_WINDOW = 512 * 1024
 
     def __init__(self):
         self.analyzer = None
@@ -189,6 +195,23 @@ class PresidioGuardrailPlugin(GuardrailPlugin):
             else:
                 return content_bytes, mime_type
 
+        # --- Handle spilled Resource Reads (Tuple[SpilledBody, Optional[str]]) ---
+        elif (
+            isinstance(response, tuple)
+            and len(response) == 2
+            and isinstance(response[0], SpilledBody)
+        ):
+            body, mime_type = response
+            if not is_text_mime_type(mime_type):
+                return response
+            # Scan window by window instead of decoding the whole body
+            sanitized_body, changed = rewrite_text(body, self._pii_anonymizer, self.SCAN_WINDOW)
+            if changed:
+                logger.info(
+                    f"Anonymized PII in spilled text-based resource response for {context.server_name}/{context.capability_name}"
+                )
+            return sanitized_body, mime_type
+
         # --- Handle GetPromptResult ---
         elif isinstance(response, types.GetPromptResult) and response.messages:
             sanitized_messages = []
@@ -1,13 +1,31 @@
+import asyncio
+import functools
 import inspect
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from mcp_gateway.plugins.base import (
+    EXECUTION_INLINE,
+    EXECUTION_THREAD,
     Plugin,
     PluginContext,
     GuardrailPlugin,
     TracingPlugin,
 )
+from mcp_gateway.plugins.executor import PluginExecutor
+from mcp_gateway.plugins.policy import PluginPolicy, load_plugin_policies
+from mcp_gateway.plugins.tracing_queue import TracingQueue
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +44,9 @@ _PLUGIN_NAME_TO_INFO: Dict[str, Dict[str, Any]] = {}
 # Flag to track if plugins have been discovered
 _PLUGINS_DISCOVERED = False
 
+# Most compiled pipelines kept; resource URIs make the set of routes unbounded
+MAX_COMPILED_PIPELINES = 1024
+
 
 def register_plugin(plugin_cls: Type[PluginT]) -> Type[PluginT]:
     """Decorator for registering plugin classes.
@@ -126,6 +147,8 @@ class PluginManager:
         self,
         enabled_types: Optional[List[str]] = None,
         enabled_plugins: Optional[Dict[str, List[str]]] = None,
+        plugin_settings: Optional[Dict[str, Any]] = None,
+        tracing_queue: Optional[TracingQueue] = None,
     ) -> None:
         """Initializes the PluginManager with configured plugins.
 
@@ -135,21 +158,44 @@ class PluginManager:
             enabled_plugins: Dictionary mapping plugin types to lists of plugin names to enable
                           (e.g., {'guardrail': ['basic', 'lasso']}).
                           If a type has an empty list or contains 'all', all plugins of that type are enabled.
+            plugin_settings: The gateway's "plugins" setting, mapping plugin names to their
+                          config and include/exclude rules (see PluginPolicy).
+            tracing_queue: Queue tracing plugins are run from in the background. If None,
+                          they run inline before a request is sent or a response returned.
+
+        Raises:
+            ValueError: If plugin_settings is malformed.
         """
         # Ensure plugins are discovered before initialization
         discover_plugins()
 
         self.enabled_types = enabled_types or []
         self.enabled_plugins = enabled_plugins or {}
+        self.policies = load_plugin_policies(plugin_settings)
+        self.tracing_queue = tracing_queue
 
         # Dictionary to store instantiated plugin objects
         self._plugins: Dict[str, List[Plugin]] = {}
+        # Policies of the loaded plugins that have one
+        self._policies: Dict[Plugin, PluginPolicy] = {}
+        # Pools of the plugins not run inline
+        self._executors: Dict[Plugin, PluginExecutor] = {}
+        # Compiled pipelines by (server, capability type, capability name),
+        # least recently used first
+        self._pipelines: "OrderedDict[Tuple[str, str, str], _Pipeline]" = (
+            OrderedDict()
+        )
 
         # Load enabled plugins
         self._load_plugins()
 
     def _load_plugins(self) -> None:
         """Load and instantiate all enabled plugins from the registry."""
+        self._policies.clear()
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors.clear()
+        self._pipelines.clear()
         if not self.enabled_types:
             logger.info("No plugin types enabled.")
             return
@@ -192,13 +238,44 @@ class PluginManager:
                     )
                     continue
 
+                policy = self.policies.get(plugin_name) or self.policies.get(
+                    plugin_attr_name
+                )
+
                 # Instantiate and load the plugin
                 try:
                     plugin_instance = plugin_cls()
-                    plugin_instance.load({})  # Empty config by default
+                    config = dict(policy.config) if policy else {}
+                    mode = (
+                        policy.execution if policy and policy.execution else None
+                    ) or plugin_instance.execution_mode
+                    workers = policy.workers if policy else None
+                    if (
+                        mode == EXECUTION_INLINE
+                        and plugin_type == TracingPlugin.plugin_type
+                        and self.tracing_queue is not None
+                    ):
+                        # Queued tracing runs off the event loop, always on
+                        # the thread the plugin was loaded on
+                        mode, workers = EXECUTION_THREAD, 1
+                    if mode == EXECUTION_INLINE:
+                        plugin_instance.load(config)
+                    else:
+                        executor = PluginExecutor(
+                            plugin_instance, mode, workers=workers, config=config
+                        )
+                        try:
+                            executor.load(config)
+                        except Exception:
+                            executor.shutdown()
+                            raise
+                        self._executors[plugin_instance] = executor
                     self._plugins[plugin_type].append(plugin_instance)
+                    if policy is not None:
+                        self._policies[plugin_instance] = policy
                     logger.info(
-                        f"Loaded plugin: {plugin_cls.__name__} (type: {plugin_type})"
+                        f"Loaded plugin: {plugin_cls.__name__} "
+                        f"(type: {plugin_type}, execution: {mode})"
                     )
                 except Exception as e:
                     logger.error(
@@ -206,6 +283,18 @@ class PluginManager:
                         exc_info=True,
                     )
 
+        loaded_names = {
+            name
+            for plugins in self._plugins.values()
+            for plugin in plugins
+            for name in (
+                plugin.__class__.__name__.lower(),
+                getattr(plugin, "plugin_name", "").lower(),
+            )
+        }
+        for name in self.policies.keys() - loaded_names:
+            logger.warning(f"Settings given for plugin '{name}', which is not enabled")
+
         # Log summary of loaded plugins
         for p_type, p_list in self._plugins.items():
             if p_type in self.enabled_types:
@@ -222,6 +311,80 @@ class PluginManager:
         """
         return self._plugins.get(plugin_type, [])
 
+    async def start(self) -> None:
+        """Starts the worker processes of plugins run in process pools."""
+        await asyncio.gather(
+            *(executor.start() for executor in self._executors.values())
+        )
+
+    async def close(self) -> None:
+        """Writes the trace events still queued, closes the plugins and stops
+        their pools; call when the gateway stops."""
+        if self.tracing_queue is not None:
+            await self.tracing_queue.close()
+        for plugins in self._plugins.values():
+            for plugin in plugins:
+                executor = self._executors.get(plugin)
+                if executor is not None:
+                    await executor.close()
+                    continue
+                try:
+                    plugin.close()
+                except Exception as e:
+                    logger.error(
+                        f"Error closing plugin {plugin.__class__.__name__}: {e}",
+                        exc_info=True,
+                    )
+
+    def _pipeline(
+        self, server_name: str, capability_type: str, capability_name: str
+    ) -> "_Pipeline":
+        """Returns the compiled pipeline of a route, compiling it on first use.
+
+        Only the MAX_COMPILED_PIPELINES most recently used pipelines are kept.
+        """
+        route = (server_name, capability_type, capability_name)
+        pipeline = self._pipelines.get(route)
+        if pipeline is None:
+            pipeline = self._compile(route)
+            self._pipelines[route] = pipeline
+            if len(self._pipelines) > MAX_COMPILED_PIPELINES:
+                self._pipelines.popitem(last=False)
+        else:
+            self._pipelines.move_to_end(route)
+        return pipeline
+
+    def _applies(self, plugin: Plugin, route: Tuple[str, str, str]) -> bool:
+        """Whether a plugin runs on a route, per its policy and applies_to."""
+        policy = self._policies.get(plugin)
+        if policy is not None and not policy.allows(*route):
+            return False
+        return plugin.applies_to(*route)
+
+    def _compile(self, route: Tuple[str, str, str]) -> "_Pipeline":
+        """Builds the request and response phases of a route.
+
+        Requests go through tracing plugins first, then guardrails; responses
+        go through guardrails first, then tracing plugins. Plugins whose
+        policy or applies_to rejects the route are left out.
+        """
+        tracing = [
+            plugin
+            for plugin in self.get_plugins(TracingPlugin.plugin_type)
+            if self._applies(plugin, route)
+        ]
+        guardrails = [
+            plugin
+            for plugin in self.get_plugins(GuardrailPlugin.plugin_type)
+            if self._applies(plugin, route)
+        ]
+        return _Pipeline(
+            request=_Phase.of(guardrails, tracing, "process_request", self._executors),
+            response=_Phase.of(
+                guardrails, tracing, "process_response", self._executors
+            ),
+        )
+
     async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
         """Processes a request through all relevant plugins.
 
@@ -231,54 +394,19 @@ class PluginManager:
         Returns:
             The modified arguments after all plugins, or None if blocked
         """
-        current_args = context.arguments
+        phase = self._pipeline(
+            context.server_name, context.capability_type, context.capability_name
+        ).request
+        if phase.empty:
+            return context.arguments
 
         # Run Tracing plugins (for monitoring)
-        for plugin in self.get_plugins(TracingPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=current_args,
-                    mcp_context=context.mcp_context,
-                )
-
-                if inspect.iscoroutinefunction(plugin.process_request):
-                    await plugin.process_request(context_for_plugin)
-                else:
-                    plugin.process_request(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in tracing request plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
+        if phase.tracers:
+            await self._trace(phase.tracers, context, "request")
 
         # Run Guardrail plugins (can modify or block)
-        for plugin in self.get_plugins(GuardrailPlugin.plugin_type):
-            if current_args is None:  # If a previous guardrail blocked
-                break
-
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=current_args,
-                    mcp_context=context.mcp_context,
-                )
-
-                if inspect.iscoroutinefunction(plugin.process_request):
-                    current_args = await plugin.process_request(context_for_plugin)
-                else:
-                    current_args = plugin.process_request(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in guardrail request plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
-
-        return current_args
+        arguments, blocked = await self._guard(phase, context, "request")
+        return None if blocked else arguments
 
     async def process_response(self, context: PluginContext) -> Any:
         """Processes a response through all relevant plugins.
@@ -289,50 +417,236 @@ class PluginManager:
         Returns:
             The modified response after all plugins
         """
-        current_response = context.response
+        phase = self._pipeline(
+            context.server_name, context.capability_type, context.capability_name
+        ).response
+        if phase.empty:
+            return context.response
 
-        # Run Guardrail plugins for response (can modify)
-        for plugin in self.get_plugins(GuardrailPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=context.arguments,
-                    response=current_response,
-                    mcp_context=context.mcp_context,
-                )
-
-                if inspect.iscoroutinefunction(plugin.process_response):
-                    current_response = await plugin.process_response(context_for_plugin)
-                else:
-                    current_response = plugin.process_response(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in guardrail response plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
+        # Run Guardrail plugins for response (can modify or block)
+        context.response, _ = await self._guard(phase, context, "response")
 
         # Run Tracing plugins for response (for monitoring)
-        for plugin in self.get_plugins(TracingPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=context.arguments,
-                    response=current_response,
-                    mcp_context=context.mcp_context,
+        if phase.tracers:
+            await self._trace(phase.tracers, context, "response")
+
+        return context.response
+
+    async def _guard(
+        self, phase: "_Phase", context: PluginContext, direction: str
+    ) -> Tuple[Any, bool]:
+        """Runs a phase's guardrails on the context's arguments or response.
+
+        The rewriting guardrails run first, one after another in their
+        configured order, so detectors only ever see content that secrets and
+        PII were already masked from. The detect-only guardrails then run
+        concurrently on the rewritten value; the first to block decides the
+        outcome and cancels the others.
+
+        Returns:
+            (value, blocked): The rewritten value, or the blocking verdict
+            (None for requests) and True.
+        """
+        value, blocked = await self._rewrite(phase.rewriters, context, direction)
+        if blocked or not phase.detectors:
+            return value, blocked
+        if len(phase.detectors) == 1:
+            return await self._detect(phase.detectors[0], context, direction)
+
+        tasks = [
+            asyncio.ensure_future(self._detect(stage, context, direction))
+            for stage in phase.detectors
+        ]
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in tasks:
+                    if task in done and task.result()[1]:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+        return value, False
+
+    async def _detect(
+        self, stage: "_Stage", context: PluginContext, direction: str
+    ) -> Tuple[Any, bool]:
+        """Runs a detect-only guardrail.
+
+        A request is blocked when the plugin returns None, a response when
+        the plugin returns anything other than the response it was given;
+        what it returned then replaces the response. Errors let the value
+        through, as for other guardrails.
+        """
+        value = _value(context, direction)
+        try:
+            result = stage.call(context)
+            if stage.is_async:
+                result = await result
+        except Exception as e:
+            logger.error(
+                f"Error in {stage.plugin_type} {direction} plugin {stage.name}: {e}",
+                exc_info=True,
+            )
+            return value, False
+        if direction == "request":
+            return (None, True) if result is None else (value, False)
+        return (result, True) if result is not value else (value, False)
+
+    async def _rewrite(
+        self, stages: Tuple["_Stage", ...], context: PluginContext, direction: str
+    ) -> Tuple[Any, bool]:
+        """Runs rewriting guardrails in order, each on the previous one's output.
 
-                if inspect.iscoroutinefunction(plugin.process_response):
-                    await plugin.process_response(context_for_plugin)
-                else:
-                    plugin.process_response(context_for_plugin)
+        Returns:
+            (value, blocked): blocked is True once a request guardrail
+            returned None.
+        """
+        attribute = _ATTRIBUTES[direction]
+        for stage in stages:
+            try:
+                result = stage.call(context)
+                if stage.is_async:
+                    result = await result
             except Exception as e:
                 logger.error(
-                    f"Error in tracing response plugin {plugin.__class__.__name__}: {e}",
+                    f"Error in {stage.plugin_type} {direction} plugin {stage.name}: {e}",
                     exc_info=True,
                 )
+                continue
+            if result is None and direction == "request":
+                return None, True
+            setattr(context, attribute, result)
+        return getattr(context, attribute), False
+
+    async def _trace(
+        self, stages: Tuple["_Stage", ...], context: PluginContext, direction: str
+    ) -> None:
+        """Runs tracing plugins, or queues them to run in the background.
+
+        Queued plugins get a copy of the context, as guardrails go on to
+        replace the arguments of the one passed in.
+        """
+        if self.tracing_queue is None:
+            for stage in stages:
+                await self._observe(stage, context, direction)
+            return
+        self.tracing_queue.put(
+            context.server_name,
+            functools.partial(
+                self._observe_all, stages, _copy_context(context), direction
+            ),
+        )
+
+    async def _observe_all(
+        self, stages: Tuple["_Stage", ...], context: PluginContext, direction: str
+    ) -> None:
+        """Runs queued tracing plugins.
+
+        Synchronous plugins loaded by the manager have their own pool thread;
+        any others run in the worker task, on the thread that loaded them.
+        """
+        for stage in stages:
+            await self._observe(stage, context, direction)
+
+    async def _observe(
+        self, stage: "_Stage", context: PluginContext, direction: str
+    ) -> None:
+        """Runs a tracing plugin, ignoring its result."""
+        try:
+            if stage.is_async:
+                await stage.call(context)
+            else:
+                stage.call(context)
+        except Exception as e:
+            logger.error(
+                f"Error in {stage.plugin_type} {direction} plugin {stage.name}: {e}",
+                exc_info=True,
+            )
+
+
+# The PluginContext attribute each direction's plugins work on
+_ATTRIBUTES = {"request": "arguments", "response": "response"}
+
+
+def _value(context: PluginContext, direction: str) -> Any:
+    return getattr(context, _ATTRIBUTES[direction])
+
+
+def _copy_context(context: PluginContext) -> PluginContext:
+    return PluginContext(
+        server_name=context.server_name,
+        capability_type=context.capability_type,
+        capability_name=context.capability_name,
+        arguments=context.arguments,
+        response=context.response,
+        mcp_context=context.mcp_context,
+        deadline=context.deadline,
+    )
+
+
+class _Stage(NamedTuple):
+    """One plugin method of a compiled pipeline."""
+
+    name: str
+    plugin_type: str
+    call: Callable[[PluginContext], Any]
+    is_async: bool
+
+    @classmethod
+    def of(
+        cls, plugin: Plugin, method: str, executor: Optional[PluginExecutor]
+    ) -> "_Stage":
+        call = getattr(plugin, method)
+        is_async = inspect.iscoroutinefunction(call)
+        if executor is not None and not is_async:
+            # Synchronous methods of pooled plugins are awaited in their pool
+            call, is_async = executor.wrap(method), True
+        return cls(
+            name=plugin.__class__.__name__,
+            plugin_type=plugin.plugin_type,
+            call=call,
+            is_async=is_async,
+        )
+
+
+class _Phase(NamedTuple):
+    """The plugin stages run on a route's requests or on its responses."""
+
+    # Detect-only guardrails, run concurrently
+    detectors: Tuple[_Stage, ...]
+    # Rewriting guardrails, run in their configured order
+    rewriters: Tuple[_Stage, ...]
+    # Tracing plugins, which only observe
+    tracers: Tuple[_Stage, ...]
+
+    @classmethod
+    def of(
+        cls,
+        guardrails: List[Plugin],
+        tracing: List[Plugin],
+        method: str,
+        executors: Dict[Plugin, PluginExecutor],
+    ) -> "_Phase":
+        def stage(plugin: Plugin) -> _Stage:
+            return _Stage.of(plugin, method, executors.get(plugin))
+
+        return cls(
+            detectors=tuple(stage(p) for p in guardrails if p.detect_only),
+            rewriters=tuple(stage(p) for p in guardrails if not p.detect_only),
+            tracers=tuple(stage(p) for p in tracing),
+        )
+
+    @property
+    def empty(self) -> bool:
+        return not (self.detectors or self.rewriters or self.tracers)
+
+
+class _Pipeline(NamedTuple):
+    """The plugin phases of one (server, capability type, capability) route."""
 
-        return current_response
+    request: _Phase
+    response: _Phase
@@ -0,0 +1,150 @@
+import fnmatch
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_gateway.plugins.base import EXECUTION_MODES
+
+logger = logging.getLogger(__name__)
+
+# Keys of an include/exclude rule, each matched against one part of the route
+RULE_KEYS = ("server", "capability_type", "name")
+# Keys of a plugin's entry in the "plugins" setting
+POLICY_KEYS = ("config", "include", "exclude", "execution", "workers")
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    """Glob patterns matched against a (server, capability type, name) route.
+
+    A key left out of the rule matches anything; a key given as a list
+    matches if any of its patterns does.
+    """
+
+    server: Tuple[str, ...] = ("*",)
+    capability_type: Tuple[str, ...] = ("*",)
+    name: Tuple[str, ...] = ("*",)
+
+    @classmethod
+    def from_config(cls, rule: Any) -> "RouteRule":
+        """Parses a rule such as {"server": "internal-*", "name": ["a*", "b"]}.
+
+        Raises:
+            ValueError: If the rule is not a dictionary of known keys with
+                string or list of string values.
+        """
+        if not isinstance(rule, dict):
+            raise ValueError(f"Plugin rule must be an object, got {rule!r}")
+        unknown = set(rule) - set(RULE_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown plugin rule keys {sorted(unknown)}, expected {list(RULE_KEYS)}"
+            )
+        patterns = {}
+        for key, value in rule.items():
+            values = [value] if isinstance(value, str) else value
+            if not isinstance(values, list) or not all(
+                isinstance(v, str) for v in values
+            ):
+                raise ValueError(
+                    f"Plugin rule '{key}' must be a pattern or a list of patterns"
+                )
+            patterns[key] = tuple(values)
+        return cls(**patterns)
+
+    def matches(
+        self, server_name: str, capability_type: str, capability_name: str
+    ) -> bool:
+        return (
+            _match_any(server_name, self.server)
+            and _match_any(capability_type, self.capability_type)
+            and _match_any(capability_name, self.name)
+        )
+
+
+@dataclass
+class PluginPolicy:
+    """A plugin's entry in the gateway's "plugins" setting."""
+
+    # Passed to the plugin's load()
+    config: Dict[str, Any] = field(default_factory=dict)
+    # Routes the plugin runs on; all routes when empty
+    include: List[RouteRule] = field(default_factory=list)
+    # Routes the plugin never runs on, even if included
+    exclude: List[RouteRule] = field(default_factory=list)
+    # Overrides the plugin's execution_mode
+    execution: Optional[str] = None
+    # Size of the plugin's thread or process pool
+    workers: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, plugin_name: str, settings: Any) -> "PluginPolicy":
+        """Parses one plugin's settings.
+
+        Raises:
+            ValueError: If the settings are malformed.
+        """
+        if not isinstance(settings, dict):
+            raise ValueError(f"Settings of plugin '{plugin_name}' must be an object")
+        unknown = set(settings) - set(POLICY_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown settings {sorted(unknown)} for plugin '{plugin_name}'"
+            )
+        config = settings.get("config", {})
+        if not isinstance(config, dict):
+            raise ValueError(f"'config' of plugin '{plugin_name}' must be an object")
+        rules = {}
+        for key in ("include", "exclude"):
+            value = settings.get(key, [])
+            if not isinstance(value, list):
+                raise ValueError(
+                    f"'{key}' of plugin '{plugin_name}' must be a list of rules"
+                )
+            rules[key] = [RouteRule.from_config(rule) for rule in value]
+        execution = settings.get("execution")
+        if execution is not None and execution not in EXECUTION_MODES:
+            raise ValueError(
+                f"'execution' of plugin '{plugin_name}' must be one of "
+                f"{list(EXECUTION_MODES)}"
+            )
+        workers = settings.get("workers")
+        if workers is not None and (
+            isinstance(workers, bool) or not isinstance(workers, int) or workers < 1
+        ):
+            raise ValueError(
+                f"'workers' of plugin '{plugin_name}' must be a positive integer"
+            )
+        return cls(config=config, execution=execution, workers=workers, **rules)
+
+    def allows(
+        self, server_name: str, capability_type: str, capability_name: str
+    ) -> bool:
+        """Whether the plugin should run on the given route."""
+        route = (server_name, capability_type, capability_name)
+        if self.include and not any(rule.matches(*route) for rule in self.include):
+            return False
+        return not any(rule.matches(*route) for rule in self.exclude)
+
+
+def load_plugin_policies(settings: Any) -> Dict[str, PluginPolicy]:
+    """Parses the gateway's "plugins" setting into policies by plugin name.
+
+    Plugin names are matched case-insensitively, against either the plugin's
+    class name or its plugin_name, like the names given with --plugin.
+
+    Raises:
+        ValueError: If the setting is malformed.
+    """
+    if not settings:
+        return {}
+    if not isinstance(settings, dict):
+        raise ValueError("The 'plugins' setting must map plugin names to settings")
+    return {
+        name.lower(): PluginPolicy.from_config(name, plugin_settings)
+        for name, plugin_settings in settings.items()
+    }
+
+
+def _match_any(value: str, patterns: Tuple[str, ...]) -> bool:
+    return any(fnmatch.fnmatchcase(value, pattern) for pattern in patterns)
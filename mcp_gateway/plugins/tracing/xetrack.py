@@ -148,6 +148,10 @@ class XetrackTracingPlugin(TracingPlugin):
             f"logs_path={self.logs_path}, logs_stdout={self.logs_stdout}"
         )
 
+    def close(self) -> None:
+        """Drops the tracker, closing its database connection on this thread."""
+        self.tracker = None
+
     def process_request(
         self, context: PluginContext
     ) -> Optional[Dict[str, Any]] | PluginContext:  # type: ignore
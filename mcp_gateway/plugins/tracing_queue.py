@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import random
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Most trace events waiting to be written before the overflow policy applies
+DEFAULT_TRACING_QUEUE_SIZE = 10_000
+# Workers writing trace events; one keeps them in order
+DEFAULT_TRACING_WORKERS = 1
+# Seconds the gateway waits on shutdown for queued trace events to be written
+DEFAULT_TRACING_FLUSH_TIMEOUT = 5.0
+
+# Overflow policies: drop the oldest queued event for the new one, or replace
+# a random queued event so the backlog stays a uniform sample of the overload
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_SAMPLE = "sample"
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_SAMPLE)
+
+# A queued event: the server it belongs to and the coroutine function tracing it
+_Event = Tuple[str, Callable[[], Awaitable[None]]]
+
+
+class TracingQueue:
+    """A bounded queue of trace events written by background workers.
+
+    The PluginManager puts an event on the queue for every traced request and
+    response instead of running the tracing plugins inline, so their writes
+    never delay a call. When the queue is full, the overflow policy decides
+    which event is dropped, and drops are counted per server.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TRACING_QUEUE_SIZE,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        workers: int = DEFAULT_TRACING_WORKERS,
+        flush_timeout: float = DEFAULT_TRACING_FLUSH_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            max_size: Most events waiting to be written.
+            overflow: OVERFLOW_DROP_OLDEST or OVERFLOW_SAMPLE.
+            workers: Number of background workers writing events.
+            flush_timeout: Seconds close() waits for queued events to be written.
+
+        Raises:
+            ValueError: If overflow is not a known policy or a size is not positive.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown tracing overflow policy '{overflow}', "
+                f"expected one of {list(OVERFLOW_POLICIES)}"
+            )
+        if max_size < 1 or workers < 1:
+            raise ValueError("Tracing queue size and workers must be at least 1")
+        self.max_size = max_size
+        self.overflow = overflow
+        self.worker_count = workers
+        self.flush_timeout = flush_timeout
+        self._events: Deque[_Event] = deque()
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._busy = 0
+        self._closed = False
+        self._traced: Dict[str, int] = defaultdict(int)
+        self._dropped: Dict[str, int] = defaultdict(int)
+
+    def put(self, server_name: str, trace: Callable[[], Awaitable[None]]) -> None:
+        """Queues a trace event without waiting; starts the workers on first use.
+
+        Args:
+            server_name: The server the traced call went to, for the counters.
+            trace: Called by a worker to run the tracing plugins on the event.
+        """
+        if self._closed:
+            self._dropped[server_name] += 1
+            return
+        if not self._workers:
+            self._start()
+        event = (server_name, trace)
+        if len(self._events) >= self.max_size:
+            if self.overflow == OVERFLOW_DROP_OLDEST:
+                dropped, _ = self._events.popleft()
+                self._events.append(event)
+            else:
+                index = random.randrange(len(self._events) + 1)
+                if index == len(self._events):
+                    dropped = server_name
+                else:
+                    dropped, _ = self._events[index]
+                    self._events[index] = event
+            self._dropped[dropped] += 1
+        else:
+            self._events.append(event)
+        self._wakeup.set()
+
+    def _start(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"tracing-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+
+    async def _work(self) -> None:
+        while True:
+            if not self._events:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            server_name, trace = self._events.popleft()
+            self._busy += 1
+            try:
+                await trace()
+                self._traced[server_name] += 1
+            except Exception as e:
+                logger.error(f"Error writing trace event for {server_name}: {e}")
+            finally:
+                self._busy -= 1
+
+    @property
+    def pending(self) -> int:
+        """Events queued or being written."""
+        return len(self._events) + self._busy
+
+    async def close(self) -> None:
+        """Writes the queued events, then stops the workers.
+
+        New events are dropped once closing starts. Events still queued after
+        flush_timeout seconds are dropped and counted.
+        """
+        self._closed = True
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._drain(), self.flush_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Dropping {len(self._events)} trace events not written "
+                    f"within {self.flush_timeout}s of shutdown"
+                )
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+        for server_name, _ in self._events:
+            self._dropped[server_name] += 1
+        self._events.clear()
+
+    async def _drain(self) -> None:
+        while self.pending:
+            await asyncio.sleep(0.01)
+
+    def stats(self, server_name: str) -> Dict[str, Any]:
+        """Returns trace event counters of a server and the gateway's backlog."""
+        return {
+            "traced": self._traced.get(server_name, 0),
+            "dropped": self._dropped.get(server_name, 0),
+            "pending": self.pending,
+            "overflow": self.overflow,
+        }
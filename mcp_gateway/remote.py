@@ -0,0 +1,172 @@
+import logging
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import anyio
+import httpx
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import RequestContext, StreamableHTTPTransport
+from mcp.types import JSONRPCRequest
+
+logger = logging.getLogger(__name__)
+
+# Upstream transports for servers configured with a url
+REMOTE_TRANSPORTS = ("streamable-http", "sse")
+
+# Seconds allowed for an HTTP request, and between events on an SSE stream
+DEFAULT_HTTP_TIMEOUT = 30.0
+DEFAULT_SSE_READ_TIMEOUT = 300.0
+
+# Connection pool limits of the HTTP client shared by a server's replicas
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+def is_remote(config: Dict[str, Any]) -> bool:
+    """Whether a server config points at a remote MCP server instead of a command."""
+    return bool(config.get("url"))
+
+
+def remote_transport(config: Dict[str, Any]) -> str:
+    """Returns the transport of a remote server config.
+
+    Raises:
+        ValueError: If the configured transport is not supported.
+    """
+    transport = config.get("transport", "streamable-http")
+    if transport not in REMOTE_TRANSPORTS:
+        raise ValueError(
+            f"Unsupported transport '{transport}', expected one of {REMOTE_TRANSPORTS}"
+        )
+    return transport
+
+
+def create_http_client(config: Dict[str, Any]) -> httpx.AsyncClient:
+    """Creates the pooled keep-alive HTTP client for a remote server.
+
+    Pool limits come from the optional ``http_pool`` entry of the server config
+    (max_connections, max_keepalive_connections and keepalive_expiry).
+    """
+    pool = config.get("http_pool") or {}
+    limits = httpx.Limits(
+        max_connections=int(pool.get("max_connections", DEFAULT_MAX_CONNECTIONS)),
+        max_keepalive_connections=int(
+            pool.get("max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+        ),
+        keepalive_expiry=float(pool.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY)),
+    )
+    timeout = httpx.Timeout(
+        float(config.get("http_timeout", DEFAULT_HTTP_TIMEOUT)),
+        read=float(config.get("sse_read_timeout", DEFAULT_SSE_READ_TIMEOUT)),
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True)
+
+
+class _StreamableHTTPTransport(StreamableHTTPTransport):
+    """Reports a rejected session id as a terminated session.
+
+    mcp's client only does so for HTTP 404. Servers that answer an unknown
+    session with 400 instead would otherwise tear the whole connection down
+    and fail every request in flight, not just the rejected one.
+    """
+
+    async def _handle_post_request(self, ctx: RequestContext) -> None:
+        try:
+            await super()._handle_post_request(ctx)
+        except httpx.HTTPStatusError as e:
+            message = ctx.session_message.message
+            if (
+                self.session_id
+                and e.response.status_code in (400, 404)
+                and isinstance(message.root, JSONRPCRequest)
+            ):
+                await self._send_session_terminated_error(
+                    ctx.read_stream_writer, message.root.id
+                )
+                return
+            raise
+
+
+@asynccontextmanager
+async def streamable_http_connect(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, Any]] = None,
+    timeout: float = DEFAULT_HTTP_TIMEOUT,
+    sse_read_timeout: float = DEFAULT_SSE_READ_TIMEOUT,
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """Opens a streamable HTTP MCP connection over an existing HTTP client.
+
+    Works like mcp's streamablehttp_client, which always creates and closes
+    its own client, so that every replica of a server reuses the same pool of
+    keep-alive connections. The client is left open on exit.
+
+    Yields:
+        The (read_stream, write_stream) pair for a ClientSession.
+    """
+    transport = _StreamableHTTPTransport(
+        url,
+        headers,
+        timedelta(seconds=timeout),
+        timedelta(seconds=sse_read_timeout),
+    )
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async with anyio.create_task_group() as tg:
+        try:
+
+            def start_get_stream() -> None:
+                tg.start_soon(transport.handle_get_stream, client, read_stream_writer)
+
+            tg.start_soon(
+                transport.post_writer,
+                client,
+                write_stream_reader,
+                read_stream_writer,
+                write_stream,
+                start_get_stream,
+                tg,
+            )
+            try:
+                yield read_stream, write_stream
+            finally:
+                if transport.session_id:
+                    await transport.terminate_session(client)
+                tg.cancel_scope.cancel()
+        finally:
+            await read_stream_writer.aclose()
+            await write_stream.aclose()
+
+
+@asynccontextmanager
+async def remote_connect(
+    config: Dict[str, Any], client: Optional[httpx.AsyncClient]
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """Connects to the remote MCP server described by config.
+
+    Args:
+        config: The server config, with ``url`` and optionally ``transport``,
+            ``headers``, ``http_timeout`` and ``sse_read_timeout``.
+        client: Pooled HTTP client used by the streamable HTTP transport.
+
+    Yields:
+        The (read_stream, write_stream) pair for a ClientSession.
+    """
+    url = config["url"]
+    headers = config.get("headers")
+    timeout = float(config.get("http_timeout", DEFAULT_HTTP_TIMEOUT))
+    sse_read_timeout = float(config.get("sse_read_timeout", DEFAULT_SSE_READ_TIMEOUT))
+    if remote_transport(config) == "sse":
+        # mcp's SSE client keeps one client open for the life of the stream
+        async with sse_client(url, headers, timeout, sse_read_timeout) as streams:
+            yield streams
+    else:
+        if client is None:
+            raise ValueError("A streamable HTTP connection needs an HTTP client")
+        async with streamable_http_connect(
+            client, url, headers, timeout, sse_read_timeout
+        ) as streams:
+            yield streams
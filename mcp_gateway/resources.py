@@ -0,0 +1,171 @@
+import base64
+import logging
+from typing import Dict, Generic, Optional, Tuple, TypeVar, Union
+
+from mcp import types
+from mcp.shared.exceptions import McpError
+from pydantic import AnyUrl
+
+from mcp_gateway.spill import DEFAULT_SPILL_THRESHOLD, SpilledBody
+
+logger = logging.getLogger(__name__)
+
+# Proxied resources are exposed as mcp-gateway://<server>/<upstream uri>
+GATEWAY_URI_PREFIX = "mcp-gateway://"
+
+# MCP error code for a resource that does not exist
+RESOURCE_NOT_FOUND = -32002
+
+# MIME type assumed for text contents that do not declare one, so text
+# guardrails still inspect them
+DEFAULT_TEXT_MIME_TYPE = "text/plain"
+
+T = TypeVar("T")
+
+
+def gateway_uri(server_name: str, uri: str) -> str:
+    """Namespaces an upstream resource URI (or URI template) under the gateway."""
+    return f"{GATEWAY_URI_PREFIX}{server_name}/{uri}"
+
+
+def split_gateway_uri(uri: str) -> Optional[Tuple[str, str]]:
+    """Splits a gateway resource URI into the server name and the upstream URI.
+
+    Returns:
+        (server_name, upstream_uri), or None if uri is not a gateway URI.
+    """
+    if not uri.startswith(GATEWAY_URI_PREFIX):
+        return None
+    server_name, separator, upstream_uri = uri[len(GATEWAY_URI_PREFIX) :].partition(
+        "/"
+    )
+    if not server_name or not separator or not upstream_uri:
+        return None
+    return server_name, upstream_uri
+
+
+class ResourceRouter(Generic[T]):
+    """Routes gateway resource URIs to the server that owns them.
+
+    The server name is the fixed-position prefix of every gateway URI, so a
+    read is routed with one string split and one dict lookup however many
+    servers and resources there are.
+    """
+
+    def __init__(self, servers: Dict[str, T]):
+        """Initializes the router.
+
+        Args:
+            servers: Proxied servers by name. Kept by reference, so servers
+                added or removed later are routed accordingly.
+        """
+        self._servers = servers
+
+    def route(self, uri: str) -> Tuple[T, str]:
+        """Returns the server owning a gateway resource URI and its upstream URI.
+
+        Raises:
+            McpError: With RESOURCE_NOT_FOUND if no proxied server owns uri.
+        """
+        parts = split_gateway_uri(uri)
+        server = self._servers.get(parts[0]) if parts else None
+        if server is None:
+            raise McpError(
+                types.ErrorData(
+                    code=RESOURCE_NOT_FOUND, message=f"Resource not found: {uri}"
+                )
+            )
+        return server, parts[1]
+
+
+def namespace_resource(server_name: str, resource: types.Resource) -> types.Resource:
+    """Returns a copy of an upstream resource as exposed by the gateway."""
+    return resource.model_copy(
+        update={
+            "uri": AnyUrl(gateway_uri(server_name, str(resource.uri))),
+            "name": f"{server_name}_{resource.name}",
+        }
+    )
+
+
+def namespace_resource_template(
+    server_name: str, template: types.ResourceTemplate
+) -> types.ResourceTemplate:
+    """Returns a copy of an upstream resource template as exposed by the gateway."""
+    return template.model_copy(
+        update={
+            "uriTemplate": gateway_uri(server_name, template.uriTemplate),
+            "name": f"{server_name}_{template.name}",
+        }
+    )
+
+
+def contents_to_bytes(
+    contents: types.TextResourceContents | types.BlobResourceContents,
+) -> Tuple[bytes, Optional[str]]:
+    """Converts one item of a resource read into the (bytes, mime_type) pair
+    guardrail plugins inspect."""
+    if isinstance(contents, types.BlobResourceContents):
+        return base64.b64decode(contents.blob), contents.mimeType
+    return (
+        contents.text.encode("utf-8"),
+        contents.mimeType or DEFAULT_TEXT_MIME_TYPE,
+    )
+
+
+def contents_to_body(
+    contents: types.TextResourceContents | types.BlobResourceContents,
+    spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+) -> Tuple[Union[bytes, SpilledBody], Optional[str]]:
+    """Like contents_to_bytes, but spills content of at least spill_threshold
+    bytes to a memory-mapped temp file instead of copying it into memory."""
+    if isinstance(contents, types.BlobResourceContents):
+        if len(contents.blob) // 4 * 3 >= spill_threshold:
+            return SpilledBody.from_base64(contents.blob), contents.mimeType
+    elif len(contents.text) >= spill_threshold:
+        return (
+            SpilledBody.from_text(contents.text),
+            contents.mimeType or DEFAULT_TEXT_MIME_TYPE,
+        )
+    return contents_to_bytes(contents)
+
+
+def strip_contents(
+    contents: types.TextResourceContents | types.BlobResourceContents,
+) -> types.TextResourceContents | types.BlobResourceContents:
+    """Returns a copy of a resource read item without its content, to be
+    rebuilt later with contents_from_bytes."""
+    field = "blob" if isinstance(contents, types.BlobResourceContents) else "text"
+    return contents.model_copy(update={field: ""})
+
+
+def contents_from_bytes(
+    original: types.TextResourceContents | types.BlobResourceContents,
+    data: Union[bytes, SpilledBody],
+    mime_type: Optional[str],
+    uri: Optional[str] = None,
+) -> types.TextResourceContents | types.BlobResourceContents:
+    """Rebuilds a resource read item from (possibly sanitized) bytes.
+
+    Args:
+        original: The item the bytes were taken from, which decides whether
+            the result is text or blob contents.
+        data: The item's content, in memory or spilled.
+        mime_type: The item's MIME type.
+        uri: URI to report instead of the original item's.
+    """
+    update: Dict[str, object] = {"uri": AnyUrl(uri) if uri else original.uri}
+    if isinstance(original, types.BlobResourceContents):
+        if isinstance(data, SpilledBody):
+            update["blob"] = data.read_base64()
+        else:
+            update["blob"] = base64.b64encode(data).decode("ascii")
+        update["mimeType"] = mime_type
+    else:
+        if isinstance(data, SpilledBody):
+            update["text"] = data.read_text()
+        else:
+            update["text"] = data.decode("utf-8", errors="replace")
+        if original.mimeType is not None or mime_type != DEFAULT_TEXT_MIME_TYPE:
+            update["mimeType"] = mime_type
+    return original.model_copy(update=update)
@@ -1,10 +1,11 @@
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 from mcp import types
 
 # Import PluginManager and PluginContext
 from mcp_gateway.plugins.manager import PluginManager
 from mcp_gateway.plugins.base import PluginContext
+from mcp_gateway.spill import SpilledBody
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ async def sanitize_request(
     mcp_context: Optional[
         Any
     ] = None,  # Pass MCP context if available/needed by plugins
+    deadline: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
     """Runs request plugins for a capability call.
 
@@ -38,6 +40,7 @@ async def sanitize_request(
         name: The name of the capability.
         arguments: The arguments for the capability call.
         mcp_context: Optional MCP context.
+        deadline: Optional time.monotonic() value the whole call must finish by.
 
     Returns:
         The sanitized arguments dictionary, or None if the request was blocked by a plugin.
@@ -49,6 +52,7 @@ async def sanitize_request(
         capability_name=name,
         arguments=arguments,
         mcp_context=mcp_context,
+        deadline=deadline,
     )
     try:
         sanitized_args = await plugin_manager.process_request(context)
@@ -78,6 +82,7 @@ async def sanitize_response(
         Dict[str, Any]
     ] = None,  # Provide request args for context
     mcp_context: Optional[Any] = None,
+    deadline: Optional[float] = None,
 ) -> Any:
     """Runs response plugins for a capability call result.
 
@@ -89,6 +94,7 @@ async def sanitize_response(
         response: The response data received from the proxied server.
         request_arguments: Original arguments for the request (context for plugins).
         mcp_context: Optional MCP context.
+        deadline: Optional time.monotonic() value the whole call must finish by.
 
 
     Returns:
@@ -102,6 +108,7 @@ async def sanitize_response(
         arguments=request_arguments,  # Pass original request args
         response=response,
         mcp_context=mcp_context,
+        deadline=deadline,
     )
     try:
         sanitized_response = await plugin_manager.process_response(context)
@@ -139,11 +146,14 @@ async def sanitize_resource_read(
     plugin_manager: PluginManager,
     server_name: str,
     uri: str,  # Use URI as the 'name' for resources
-    content: bytes,
+    content: Union[bytes, SpilledBody],
     mime_type: Optional[str],
     mcp_context: Optional[Any] = None,
-) -> Tuple[bytes, Optional[str]]:
-    """Runs response plugins specifically for resource reads."""
+) -> Tuple[Union[bytes, SpilledBody], Optional[str]]:
+    """Runs response plugins specifically for resource reads.
+
+    Large bodies are passed to the plugins as a SpilledBody instead of bytes.
+    """
     logger.debug(f"Sanitizing resource read for {server_name} resource {uri}")
     # Treat resource read as a 'response' phase
     response = (content, mime_type)
@@ -160,7 +170,7 @@ async def sanitize_resource_read(
     if (
         isinstance(sanitized_response, tuple)
         and len(sanitized_response) == 2
-        and isinstance(sanitized_response[0], bytes)
+        and isinstance(sanitized_response[0], (bytes, SpilledBody))
     ):
         return sanitized_response
     else:
@@ -176,6 +186,7 @@ async def sanitize_tool_call_args(
     tool_name: str,
     arguments: Optional[Dict[str, Any]],
     mcp_context: Optional[Any] = None,
+    deadline: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
     """Runs request plugins specifically for tool calls."""
     logger.info(f"Sanitizing tool call args for {server_name} tool {tool_name}")
@@ -186,6 +197,7 @@ async def sanitize_tool_call_args(
         name=tool_name,
         arguments=arguments,
         mcp_context=mcp_context,
+        deadline=deadline,
     )
 
 
@@ -196,6 +208,7 @@ async def sanitize_tool_call_result(
     result: types.CallToolResult,  # Expecting CallToolResult specifically here
     request_arguments: Optional[Dict[str, Any]] = None,
     mcp_context: Optional[Any] = None,
+    deadline: Optional[float] = None,
 ) -> types.CallToolResult:
     """Runs response plugins specifically for tool call results."""
     logger.info(f"Sanitizing tool call result for {server_name} tool {tool_name}")
@@ -208,6 +221,7 @@ async def sanitize_tool_call_result(
         response=result,
         request_arguments=request_arguments,
         mcp_context=mcp_context,
+        deadline=deadline,
     )
 
     # Ensure the response is still a CallToolResult
@@ -5,14 +5,18 @@ import os
 import json
 import argparse
 import sys
-from contextlib import asynccontextmanager, AsyncExitStack
+import time
+from contextlib import asynccontextmanager, nullcontext
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    Awaitable,
+    Callable,
     Dict,
     AsyncIterator,
     List,
     Optional,
+    Set,
     Tuple,
     get_type_hints,
     get_args,
@@ -20,12 +24,15 @@ from typing import (
 )
 import inspect
 import functools
+import httpx
 
 from mcp.server.fastmcp import FastMCP, Context
-from mcp import ClientSession, StdioServerParameters, types
-from mcp.client.stdio import stdio_client
+from mcp import ClientSession, types
+from mcp.shared.exceptions import McpError
+from pydantic import AnyUrl
 
-from mcp_gateway.config import load_config
+from mcp.server.lowlevel.server import request_ctx
+from mcp_gateway.config import load_config, load_gateway_settings
 from mcp_gateway.sanitizers import (
     SanitizationError,
     sanitize_tool_call_args,
@@ -34,6 +41,49 @@ from mcp_gateway.sanitizers import (
     sanitize_response,
 )
 from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.plugins.tracing_queue import (
+    DEFAULT_TRACING_FLUSH_TIMEOUT,
+    DEFAULT_TRACING_QUEUE_SIZE,
+    DEFAULT_TRACING_WORKERS,
+    OVERFLOW_DROP_OLDEST,
+    TracingQueue,
+)
+from mcp_gateway.admission import AdmissionController, OverloadedError
+from mcp_gateway.cache import (
+    DEFAULT_RESOURCE_CACHE_MAX_BYTES,
+    DEFAULT_RESOURCE_CACHE_SPILL_MAX_BYTES,
+    DEFAULT_RESOURCE_CACHE_SPILL_THRESHOLD,
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    ResourceCache,
+    ToolResultCache,
+    tool_call_key,
+)
+from mcp_gateway.coalesce import SingleFlight
+from mcp_gateway.pagination import UPSTREAM_LISTS, install_pagination, list_request
+from mcp_gateway.downstream import DownstreamSessions
+from mcp_gateway.subscriptions import ResourceSubscriptions
+from mcp_gateway.snapshot import CapabilitySnapshot, CapabilitySnapshotStore
+from mcp_gateway.startup import DEFAULT_STARTUP_TIMEOUT, StartupTracker
+from mcp_gateway.supervisor import CircuitBreaker, CircuitOpenError, ServerSupervisor
+from mcp_gateway.transport import TRANSPORTS, serve_http
+from mcp_gateway.workers import WorkerSupervisor, bind_socket
+from mcp_gateway.remote import create_http_client, is_remote, remote_transport
+from mcp_gateway.resources import (
+    ResourceRouter,
+    contents_from_bytes,
+    contents_to_body,
+    gateway_uri,
+    namespace_resource,
+    namespace_resource_template,
+    strip_contents,
+)
+from mcp_gateway.spill import DEFAULT_SPILL_THRESHOLD, SpilledBody
+from mcp_gateway.upstream import (
+    SESSION_TERMINATED,
+    UpstreamSession,
+    cancel_request,
+    next_request_id,
+)
 
 # --- Global Config for Args ---
 cli_args = None
@@ -46,76 +96,496 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds an on-demand server may sit unused before its processes are stopped
+DEFAULT_IDLE_TIMEOUT = 300.0
+# Most pages fetched for one upstream list, in case a server never stops paging
+MAX_LIST_PAGES = 10_000
+# Most calls a single batch_call_tools request may contain
+DEFAULT_BATCH_MAX_CALLS = 100
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a proxied tool call does not complete within its timeout."""
+
+    def __init__(self, server_name: str, tool_name: str, timeout: float):
+        super().__init__(
+            f"Tool '{server_name}/{tool_name}' did not complete within {timeout:g}s."
+        )
+        self.server_name = server_name
+        self.tool_name = tool_name
+        self.timeout = timeout
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured description of the timeout returned to clients."""
+        return {
+            "error": "timeout",
+            "server": self.server_name,
+            "tool": self.tool_name,
+            "timeout_seconds": self.timeout,
+        }
+
+
+def _parse_pool_size(server_name: str, pool_size: Any) -> Tuple[int, int]:
+    """Normalizes a server's ``pool_size`` setting into a (min, max) pair.
+
+    Accepts an int (fixed size), a {"min": n, "max": m} dict, or None (one replica).
+    """
+    if pool_size is None:
+        return 1, 1
+    if isinstance(pool_size, int):
+        pool_min = pool_max = pool_size
+    elif isinstance(pool_size, dict):
+        pool_min = int(pool_size.get("min", 1))
+        pool_max = int(pool_size.get("max", pool_min))
+    else:
+        raise ValueError(
+            f"Invalid pool_size for server '{server_name}': {pool_size!r}"
+        )
+    if pool_min < 1 or pool_max < pool_min:
+        raise ValueError(
+            f"Invalid pool_size for server '{server_name}': min={pool_min}, max={pool_max}"
+        )
+    return pool_min, pool_max
+
 
 class Server:
-    """Manages the connection and interaction with a single proxied MCP server."""
+    """Manages the connection and interaction with a single proxied MCP server.
+
+    A server owns a pool of identical upstream sessions (see ``pool_size`` in the
+    server config). Capabilities are fetched once from the first replica and
+    shared, while calls are dispatched to the replica with the fewest calls in
+    flight.
+    """
 
     def __init__(self, name: str, config: Dict[str, Any]):
         """Initializes the Proxied Server.
 
         Args:
             name: The unique name identifier for this server.
-            config: The configuration dictionary for this server (command, args, env).
+            config: The configuration dictionary for this server (command, args, env,
+                or url with transport, headers, http_pool, http_timeout and
+                sse_read_timeout for a remote server,
+                and optionally pool_size as an int or {"min": n, "max": m},
+                on_demand, idle_timeout and startup_timeout in seconds,
+                startup_priority (higher starts first),
+                max_concurrency and max_queue,
+                timeout in seconds, tool_timeouts and tool_cache_ttls mapping tool
+                names to seconds, resource_cache_ttl in seconds,
+                resource_spill_threshold in bytes, and coalesce_calls).
         """
         self.name = name
         self.config = config
-        self._session: Optional[ClientSession] = None
-        self._client_cm: Optional[
-            AsyncIterator[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+        self.pool_min, self.pool_max = _parse_pool_size(name, config.get("pool_size"))
+        self.remote = is_remote(config)
+        if self.remote:
+            remote_transport(config)
+        # Keep-alive connection pool shared by the replicas of a remote server
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.on_demand = bool(config.get("on_demand", False))
+        self.idle_timeout = float(config.get("idle_timeout", DEFAULT_IDLE_TIMEOUT))
+        self.startup_timeout = float(
+            config.get("startup_timeout", DEFAULT_STARTUP_TIMEOUT)
+        )
+        self.startup_priority = int(config.get("startup_priority", 0))
+        # Seconds spent in each startup phase, for the startup report
+        self.startup_profile: Dict[str, float] = {}
+        self.timeout = _optional_float(config.get("timeout"))
+        self.tool_timeouts: Dict[str, float] = {
+            tool_name: float(seconds)
+            for tool_name, seconds in (config.get("tool_timeouts") or {}).items()
+        }
+        self.timed_out_calls = 0
+        self.tool_cache_ttls: Dict[str, float] = {
+            tool_name: float(seconds)
+            for tool_name, seconds in (config.get("tool_cache_ttls") or {}).items()
+        }
+        # Seconds sanitized resource reads may be reused, None to not cache them
+        self.resource_cache_ttl = _optional_float(config.get("resource_cache_ttl"))
+        # Resource contents from this size on are spilled to a temp file
+        self.resource_spill_threshold = int(
+            config.get("resource_spill_threshold", DEFAULT_SPILL_THRESHOLD)
+        )
+        self.coalesce_calls = bool(config.get("coalesce_calls", False))
+        self._flights = SingleFlight()
+        self._replicas: List[UpstreamSession] = []
+        self._next_replica_index = 0
+        self._grow_task: Optional[asyncio.Task] = None
+        self._idle_task: Optional[asyncio.Task] = None
+        self._boot_task: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+        self._last_used = time.monotonic()
+        self.circuit = CircuitBreaker(name)
+        self.admission = AdmissionController(
+            name,
+            max_concurrency=_optional_int(config.get("max_concurrency")),
+            max_queue=_optional_int(config.get("max_queue")),
+        )
+        # Set whenever a replica's connection ends unexpectedly
+        self.replica_closed = asyncio.Event()
+        # Called after a listChanged notification caused a re-fetch, with the
+        # capabilities from before the re-fetch and the kinds that were re-fetched
+        self.on_list_changed: Optional[
+            Callable[["Server", CapabilitySnapshot, Set[str]], Awaitable[None]]
         ] = None
+        # Called with the upstream URI of every resources/updated notification
+        self.on_resource_updated: Optional[
+            Callable[["Server", str], Awaitable[Any]]
+        ] = None
+        # Upstream resource URIs subscribed to, and the session holding them
+        self._subscriptions: Set[str] = set()
+        self._subscription_session: Optional[ClientSession] = None
+        self._notify_tasks: Set[asyncio.Task] = set()
+        self._pending_refresh: Set[str] = set()
+        self._refresh_task: Optional[asyncio.Task] = None
         self._server_info: Optional[types.InitializeResult] = None
-        self._exit_stack = AsyncExitStack()
         # Store fetched capabilities for easier access later
         self._tools: List[types.Tool] = []
         self._resources: List[types.Resource] = []
+        self._resource_templates: List[types.ResourceTemplate] = []
         self._prompts: List[types.Prompt] = []
-        logger.info(f"Initialized Proxied Server: {self.name}")
+        logger.info(
+            f"Initialized Proxied Server: {self.name} "
+            f"(pool size {self.pool_min}-{self.pool_max}, on_demand={self.on_demand})"
+        )
 
     @property
     def session(self) -> ClientSession:
-        """Returns the active ClientSession, raising an error if not started."""
-        if self._session is None:
-            raise RuntimeError(f"Server '{self.name}' session not started.")
-        return self._session
+        """Returns the primary replica's ClientSession, raising an error if not started."""
+        for replica in self._replicas:
+            if replica.is_active:
+                return replica.session
+        raise RuntimeError(f"Server '{self.name}' session not started.")
+
+    @property
+    def is_active(self) -> bool:
+        """Whether at least one upstream replica is running."""
+        return any(replica.is_active for replica in self._replicas)
+
+    @property
+    def is_starting(self) -> bool:
+        """Whether a background start (see start_in_background) is still running."""
+        return self._boot_task is not None and not self._boot_task.done()
+
+    @property
+    def replicas(self) -> List[UpstreamSession]:
+        """The upstream sessions currently in the pool."""
+        return list(self._replicas)
+
+    def _new_replica(self) -> UpstreamSession:
+        if self.remote and (self._http_client is None or self._http_client.is_closed):
+            self._http_client = create_http_client(self.config)
+        replica = UpstreamSession(
+            self.name,
+            self.config,
+            self._next_replica_index,
+            on_close=self._on_replica_closed,
+            on_notification=self._on_replica_notification,
+            http_client=self._http_client,
+        )
+        self._next_replica_index += 1
+        return replica
+
+    def _on_replica_closed(self, replica: UpstreamSession) -> None:
+        logger.warning(f"Upstream session '{replica.label}' closed unexpectedly.")
+        self.replica_closed.set()
+
+    def _on_replica_notification(
+        self, replica: UpstreamSession, notification: types.ServerNotification
+    ) -> None:
+        if isinstance(notification.root, types.ToolListChangedNotification):
+            kind = "tools"
+        elif isinstance(notification.root, types.PromptListChangedNotification):
+            kind = "prompts"
+        elif isinstance(notification.root, types.ResourceListChangedNotification):
+            kind = "resources"
+        elif isinstance(notification.root, types.ResourceUpdatedNotification):
+            if self.on_resource_updated is not None:
+                task = asyncio.create_task(
+                    self.on_resource_updated(self, str(notification.root.params.uri))
+                )
+                self._notify_tasks.add(task)
+                task.add_done_callback(self._notify_tasks.discard)
+            return
+        else:
+            return
+        logger.info(f"Upstream session '{replica.label}' reported changed {kind}.")
+        # Replicas run the same server and may all report the same change:
+        # collect the kinds and re-fetch them once.
+        self._pending_refresh.add(kind)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_pending())
+
+    async def _refresh_pending(self) -> None:
+        """Re-fetches the capability lists reported as changed until none are left."""
+        while self._pending_refresh:
+            kinds, self._pending_refresh = self._pending_refresh, set()
+            previous = self.capability_snapshot()
+            try:
+                await self.refresh_capabilities(kinds)
+                if self.on_list_changed is not None:
+                    await self.on_list_changed(self, previous, kinds)
+            except Exception as e:
+                logger.error(
+                    f"Failed to refresh {', '.join(sorted(kinds))} of '{self.name}': {e}",
+                    exc_info=True,
+                )
+
+    async def refresh_capabilities(self, kinds: Set[str]) -> None:
+        """Re-fetches the given capability lists ("tools", "prompts", "resources")
+        from the upstream server, leaving the others untouched."""
+        session = self.session
+        if "tools" in kinds:
+            self._tools = await self._list_all(session, "tools")
+        if "prompts" in kinds:
+            self._prompts = await self._list_all(session, "prompts")
+        if "resources" in kinds:
+            self._resources = await self._list_all(session, "resources")
+            self._resource_templates = await self._list_resource_templates(session)
+        logger.info(
+            f"Refreshed {', '.join(sorted(kinds))} for {self.name}: "
+            f"{len(self._tools)} tools, {len(self._resources)} resources, "
+            f"{len(self._prompts)} prompts."
+        )
 
     async def start(self) -> None:
-        """Starts the underlying MCP server process, establishes a client session,
-        and fetches initial capabilities."""
-        if self._session is not None:
+        """Starts the minimum number of upstream replicas, establishes client sessions,
+        and fetches initial capabilities from the first one."""
+        if self._replicas:
             logger.warning(f"Server '{self.name}' already started.")
             return
 
         logger.info(f"Starting proxied server: {self.name}...")
         try:
-            server_params = StdioServerParameters(
-                command=self.config.get("command", ""),
-                args=self.config.get("args", []),
-                env=self.config.get("env", None),
-            )
-
-            # Use AsyncExitStack to manage the stdio_client context
-            self._client_cm = stdio_client(server_params)
-            read, write = await self._exit_stack.enter_async_context(self._client_cm)
-
-            # Use AsyncExitStack to manage the ClientSession context
-            session_cm = ClientSession(read, write)
-            self._session = await self._exit_stack.enter_async_context(session_cm)
-
-            # Capture and store the InitializeResult
-            self._server_info = await self._session.initialize()
-            logger.info(
-                f"Proxied server '{self.name}' started and initialized successfully."
-            )
+            started = time.monotonic()
+            await self._start_replicas()
+            replicas_started = time.monotonic()
 
             # Fetch and store initial lists of tools, resources, prompts
             await self._fetch_initial_capabilities()
+            fetched = time.monotonic()
+
+            primary = self._replicas[0]
+            self.startup_profile.update(
+                spawn_seconds=primary.spawn_time,
+                initialize_seconds=primary.initialize_time,
+                capabilities_seconds=fetched - replicas_started,
+                start_seconds=fetched - started,
+            )
 
         except Exception as e:
             logger.error(f"Failed to start server '{self.name}': {e}", exc_info=True)
             self._server_info = None  # Ensure server_info is None on failure
-            await self.stop()  # Attempt cleanup if start failed
+            # Only the replicas launched here: wait_for may run start() in a
+            # child task of the boot task, which stop() would cancel
+            await self._stop_replicas()
             raise
 
+    def start_in_background(self, limiter: Optional[asyncio.Semaphore] = None) -> None:
+        """Runs start() in a background task. Calls made before it completes
+        wait for it instead of failing.
+
+        Args:
+            limiter: Startup slots shared with the other servers; start() only
+                runs once one is free.
+        """
+        self._boot_task = asyncio.create_task(
+            self.run_startup(self.start, limiter), name=f"start-{self.name}"
+        )
+
+    async def run_startup(
+        self,
+        start: Callable[[], Awaitable[None]],
+        limiter: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Runs a startup step once a slot in limiter is free.
+
+        The step is bounded by startup_timeout, which does not include the time
+        spent waiting for a slot.
+
+        Raises:
+            asyncio.TimeoutError: If the step exceeds startup_timeout.
+        """
+        queued = time.monotonic()
+        async with limiter if limiter is not None else nullcontext():
+            self.startup_profile["queued_seconds"] = time.monotonic() - queued
+            await asyncio.wait_for(start(), self.startup_timeout)
+
+    async def wait_started(self) -> None:
+        """Waits for a background start to finish, re-raising its error if it failed."""
+        if self._boot_task is not None:
+            await asyncio.shield(self._boot_task)
+
+    async def _start_replicas(self) -> None:
+        """Starts the primary replica, then the rest of the minimum pool."""
+        primary = self._new_replica()
+        self._replicas.append(primary)
+        self._server_info = await primary.start()
+        logger.info(f"Proxied server '{self.name}' started and initialized successfully.")
+
+        # Remaining replicas share the primary's capabilities, so they only need
+        # to complete the initialize handshake.
+        if self.pool_min > 1:
+            extra = [self._new_replica() for _ in range(self.pool_min - 1)]
+            results = await asyncio.gather(
+                *(replica.start() for replica in extra), return_exceptions=True
+            )
+            for replica, result in zip(extra, results):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        f"Failed to start replica '{replica.label}': {result}"
+                    )
+                else:
+                    self._replicas.append(replica)
+            logger.info(
+                f"Proxied server '{self.name}' running {len(self._replicas)} replicas."
+            )
+        await self._sync_subscriptions()
+
+    # --- On-Demand Lifecycle ---
+
+    def capability_snapshot(self) -> CapabilitySnapshot:
+        """Returns the currently known capabilities as a snapshot."""
+        return CapabilitySnapshot(
+            server_info=self._server_info,
+            tools=list(self._tools),
+            resources=list(self._resources),
+            resource_templates=list(self._resource_templates),
+            prompts=list(self._prompts),
+        )
+
+    def apply_snapshot(self, snapshot: CapabilitySnapshot) -> None:
+        """Replaces the cached capabilities with those from a snapshot."""
+        self._server_info = snapshot.server_info
+        self._tools = list(snapshot.tools)
+        self._resources = list(snapshot.resources)
+        self._resource_templates = list(snapshot.resource_templates)
+        self._prompts = list(snapshot.prompts)
+
+    async def prepare_on_demand(self, snapshot_store: CapabilitySnapshotStore) -> None:
+        """Loads capabilities for an on-demand server without keeping it running.
+
+        Uses the persisted snapshot when one matches the current config. Otherwise
+        the server is started once to fetch its capabilities, which are then
+        persisted before the server hibernates.
+        """
+        snapshot = snapshot_store.load(self.name, self.config)
+        if snapshot is not None:
+            self.apply_snapshot(snapshot)
+            logger.info(
+                f"Loaded capability snapshot for on-demand server '{self.name}': "
+                f"{len(self._tools)} tools, {len(self._resources)} resources, "
+                f"{len(self._prompts)} prompts."
+            )
+            return
+
+        logger.info(
+            f"No capability snapshot for on-demand server '{self.name}', fetching once."
+        )
+        await self.start()
+        snapshot_store.save(self.name, self.config, self.capability_snapshot())
+        await self.hibernate()
+
+    async def _ensure_started(self) -> None:
+        """Spawns an on-demand server's replicas if it is currently hibernating."""
+        if not self.on_demand or self.is_active:
+            return
+        async with self._start_lock:
+            if self.is_active:
+                return
+            logger.info(f"Waking on-demand server '{self.name}'...")
+            if self._replicas:
+                await self._stop_replicas()
+            try:
+                await self._start_replicas()
+            except Exception:
+                await self._stop_replicas()
+                raise
+            self._last_used = time.monotonic()
+            self._idle_task = asyncio.create_task(self._watch_idle())
+
+    async def _watch_idle(self) -> None:
+        """Hibernates the server once no call has used it for idle_timeout seconds."""
+        while self.is_active:
+            idle_for = time.monotonic() - self._last_used
+            if (
+                idle_for >= self.idle_timeout
+                and self._in_flight() == 0
+                and not self._subscriptions
+            ):
+                logger.info(
+                    f"On-demand server '{self.name}' idle for {idle_for:.1f}s, hibernating."
+                )
+                if await self.hibernate():
+                    return
+                # A call started before the replicas could be stopped
+                continue
+            await asyncio.sleep(
+                max(self.idle_timeout - idle_for, min(self.idle_timeout, 1.0))
+            )
+
+    async def hibernate(self) -> bool:
+        """Stops the upstream replicas but keeps the cached capabilities.
+
+        Returns:
+            True if the replicas were stopped, False if a call was in flight.
+        """
+        async with self._start_lock:
+            if self._in_flight() > 0:
+                return False
+            await self._stop_replicas()
+        if self._idle_task is not None and self._idle_task is not asyncio.current_task():
+            self._idle_task.cancel()
+        self._idle_task = None
+        return True
+
+    def _in_flight(self) -> int:
+        return sum(replica.in_flight for replica in self._replicas)
+
+    # --- Supervision ---
+
+    async def remove_replica(self, replica: UpstreamSession) -> None:
+        """Drops a broken replica from the pool and makes sure it is stopped."""
+        if replica in self._replicas:
+            self._replicas.remove(replica)
+        await replica.stop()
+
+    async def restart(self) -> None:
+        """Replaces all replicas with fresh ones, keeping the cached capabilities."""
+        async with self._start_lock:
+            await self._stop_replicas()
+            try:
+                await self._start_replicas()
+            except Exception:
+                await self._stop_replicas()
+                raise
+
+    async def replenish(self) -> int:
+        """Starts replicas until the pool is back at its minimum size.
+
+        Returns:
+            The number of replicas started.
+        """
+        started = 0
+        while len(self._replicas) < self.pool_min:
+            replica = self._new_replica()
+            try:
+                await replica.start()
+            except Exception as e:
+                logger.warning(f"Failed to replace replica '{replica.label}': {e}")
+                break
+            self._replicas.append(replica)
+            started += 1
+        await self._sync_subscriptions()
+        return started
+
     async def _fetch_initial_capabilities(self):
         """Fetches and stores the initial lists of tools, resources, and prompts."""
         if not self.session:
@@ -126,37 +596,38 @@ class Server:
 
         try:
             # Fetch tools, resources, prompts simultaneously
-            tools_res, resources_res, prompts_res = await asyncio.gather(
-                self.session.list_tools(),
-                self.session.list_resources(),
-                self.session.list_prompts(),
+            session = self.session
+            tools, resources, prompts, templates = await asyncio.gather(
+                self._list_all(session, "tools"),
+                self._list_all(session, "resources"),
+                self._list_all(session, "prompts"),
+                self._list_resource_templates(session),
                 return_exceptions=True,
             )
 
             # Process Tools
-            if isinstance(tools_res, Exception):
-                logger.debug(f"Failed to list tools for {self.name}: {tools_res}")
+            if isinstance(tools, Exception):
+                logger.debug(f"Failed to list tools for {self.name}: {tools}")
                 self._tools = []
             else:
-                self._tools = self._extract_list(tools_res, "tools", types.Tool)
+                self._tools = tools
 
             # Process Resources
-            if isinstance(resources_res, Exception):
-                logger.debug(
-                    f"Failed to list resources for {self.name}: {resources_res}"
-                )
+            if isinstance(resources, Exception):
+                logger.debug(f"Failed to list resources for {self.name}: {resources}")
                 self._resources = []
             else:
-                self._resources = self._extract_list(
-                    resources_res, "resources", types.Resource
-                )
+                self._resources = resources
+            self._resource_templates = (
+                [] if isinstance(templates, Exception) else templates
+            )
 
             # Process Prompts
-            if isinstance(prompts_res, Exception):
-                logger.debug(f"Failed to list prompts for {self.name}: {prompts_res}")
+            if isinstance(prompts, Exception):
+                logger.debug(f"Failed to list prompts for {self.name}: {prompts}")
                 self._prompts = []
             else:
-                self._prompts = self._extract_list(prompts_res, "prompts", types.Prompt)
+                self._prompts = prompts
 
             logger.info(
                 f"Fetched initial capabilities for {self.name}: "
@@ -171,6 +642,49 @@ class Server:
                 exc_info=True,
             )
             self._tools, self._resources, self._prompts = [], [], []
+            self._resource_templates = []
+
+    async def _list_resource_templates(
+        self, session: ClientSession
+    ) -> List[types.ResourceTemplate]:
+        """Lists resource templates, treating servers without them as having none."""
+        capabilities = self._server_info.capabilities if self._server_info else None
+        if capabilities is not None and capabilities.resources is None:
+            return []
+        try:
+            return await self._list_all(session, "resourceTemplates")
+        except Exception as e:
+            logger.debug(f"Failed to list resource templates for {self.name}: {e}")
+            return []
+
+    async def _list_all(self, session: ClientSession, attribute_name: str) -> List[Any]:
+        """Fetches every page of an upstream list by following nextCursor.
+
+        Args:
+            session: The upstream session to list from.
+            attribute_name: The list's result field, a key of UPSTREAM_LISTS.
+        """
+        request_type, method, result_type, expected_type = UPSTREAM_LISTS[
+            attribute_name
+        ]
+        items: List[Any] = []
+        cursors: Set[str] = set()
+        cursor: Optional[str] = None
+        while True:
+            result = await session.send_request(
+                list_request(request_type, method, cursor), result_type
+            )
+            items.extend(self._extract_list(result, attribute_name, expected_type))
+            cursor = getattr(result, "nextCursor", None)
+            if not cursor:
+                return items
+            if cursor in cursors or len(cursors) >= MAX_LIST_PAGES:
+                logger.warning(
+                    f"Stopped paginating {attribute_name} of {self.name} after "
+                    f"{len(cursors) + 1} pages: cursor repeated or page limit reached."
+                )
+                return items
+            cursors.add(cursor)
 
     def _extract_list(
         self, result: Any, attribute_name: str, expected_type: type
@@ -196,22 +710,106 @@ class Server:
             )
             return []
 
+    async def _stop_replicas(self) -> None:
+        """Stops all upstream replicas and closes their client sessions."""
+        if self._grow_task is not None:
+            self._grow_task.cancel()
+            self._grow_task = None
+        replicas, self._replicas = self._replicas, []
+        await asyncio.gather(
+            *(replica.stop() for replica in replicas), return_exceptions=True
+        )
+
     async def stop(self) -> None:
-        """Stops the underlying MCP server process and closes the client session."""
+        """Stops all upstream replicas and clears the cached capabilities."""
         logger.info(f"Stopping proxied server: {self.name}...")
-        await self._exit_stack.aclose()
-        self._session = None
-        self._client_cm = None
+        if self._boot_task is not None and self._boot_task is not asyncio.current_task():
+            self._boot_task.cancel()
+            self._boot_task = None
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+            self._idle_task = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        await self._stop_replicas()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
         self._server_info = None  # Clear server info on stop
         self._tools, self._resources, self._prompts = [], [], []  # Clear cached caps
+        self._resource_templates = []
+        self._subscriptions.clear()
+        self._subscription_session = None
         logger.info(f"Proxied server '{self.name}' stopped.")
 
+    # --- Replica Dispatch ---
+
+    def _least_loaded_replica(self) -> UpstreamSession:
+        """Picks the active replica with the fewest calls in flight."""
+        active = [replica for replica in self._replicas if replica.is_active]
+        if not active:
+            raise RuntimeError(f"Server '{self.name}' session not started.")
+        replica = min(active, key=lambda r: r.in_flight)
+        # Every replica is busy: add one in the background if the pool allows it.
+        if (
+            replica.in_flight > 0
+            and len(self._replicas) < self.pool_max
+            and self._grow_task is None
+        ):
+            self._grow_task = asyncio.create_task(self._grow_pool())
+        return replica
+
+    async def _grow_pool(self) -> None:
+        """Starts one additional replica."""
+        replica = self._new_replica()
+        try:
+            await replica.start()
+            self._replicas.append(replica)
+            logger.info(
+                f"Grew pool for '{self.name}' to {len(self._replicas)} replicas."
+            )
+        except Exception as e:
+            logger.warning(f"Failed to grow pool for '{self.name}': {e}")
+        finally:
+            self._grow_task = None
+
+    @asynccontextmanager
+    async def _dispatch(self) -> AsyncIterator[ClientSession]:
+        """Checks out the least-loaded replica's session for a single call,
+        waking the server first if it is hibernating.
+
+        Raises:
+            CircuitOpenError: If the server is down and being restarted.
+            OverloadedError: If max_concurrency calls are running and the
+                admission queue is full.
+        """
+        self.circuit.check()
+        if self.is_starting:
+            await self.wait_started()
+        await self._ensure_started()
+        self._last_used = time.monotonic()
+        try:
+            async with self.admission.admit():
+                async with self._least_loaded_replica().track() as session:
+                    yield session
+        finally:
+            self._last_used = time.monotonic()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Returns pool sizing and per-replica in-flight counts."""
+        return {
+            "min": self.pool_min,
+            "max": self.pool_max,
+            "replicas": [replica.stats() for replica in self._replicas],
+        }
+
     # --- MCP Interaction Methods (called by dynamic handlers) ---
 
     async def list_prompts(self) -> List[types.Prompt]:
         """Lists available prompts from the proxied server (uses cached list)."""
-        # Return the cached list fetched during startup/refresh
-        # For full dynamic support (listChanged), this would need to re-fetch
+        # Return the cached list fetched during startup, kept current by
+        # listChanged notifications from the upstream server
         return self._prompts
 
     async def get_prompt(
@@ -225,7 +823,8 @@ class Server:
         logger.info(f"Getting prompt {self.name}/{name} with arguments {arguments}")
 
         # Use original arguments for the actual call
-        result = await self.session.get_prompt(name, arguments=arguments)
+        async with self._dispatch() as session:
+            result = await session.get_prompt(name, arguments=arguments)
 
         # Sanitize Response
         # Note: sanitize_response is designed generically. Ensure it handles GetPromptResult.
@@ -283,32 +882,115 @@ class Server:
         """Lists available resources from the proxied server (uses cached list)."""
         return self._resources
 
+    async def list_resource_templates(self) -> List[types.ResourceTemplate]:
+        """Lists available resource templates from the proxied server (uses cached list)."""
+        return self._resource_templates
+
     async def read_resource(
         self,
         plugin_manager: PluginManager,
         uri: str,
         mcp_context: Optional[Context] = None,
-    ) -> Tuple[bytes, Optional[str]]:
-        """Reads a resource from the proxied server after processing through plugins."""
+    ) -> types.ReadResourceResult:
+        """Reads a resource from the proxied server after processing through plugins.
+
+        Every item of the result is passed to the response plugins separately,
+        as the (bytes, mime_type) pair they expect for resources. Items of at
+        least resource_spill_threshold bytes are spilled to a memory-mapped
+        temp file as soon as they arrive and passed as (SpilledBody,
+        mime_type) instead, so the plugins scan them in windows and the
+        response is rebuilt from the file.
+        """
         # No request args to sanitize for read_resource itself
 
-        content, mime_type = await self.session.read_resource(uri)
+        async with self._dispatch() as session:
+            result = await session.read_resource(AnyUrl(uri))
 
-        # Sanitize the response content using the dedicated function
-        sanitized_content, sanitized_mime_type = await sanitize_resource_read(
-            plugin_manager=plugin_manager,
-            server_name=self.name,
-            uri=uri,
-            content=content,
-            mime_type=mime_type,
-            mcp_context=mcp_context,  # Pass gateway context
+        # Keep only the envelope so each item's content can be freed once spilled
+        items, result = list(result.contents), result.model_copy(
+            update={"contents": []}
+        )
+        contents = []
+        while items:
+            item = items.pop(0)
+            content, mime_type = contents_to_body(item, self.resource_spill_threshold)
+            sanitized_content = content
+            if isinstance(content, SpilledBody):
+                item = strip_contents(item)
+            try:
+                # Sanitize the response content using the dedicated function
+                sanitized_content, sanitized_mime_type = await sanitize_resource_read(
+                    plugin_manager=plugin_manager,
+                    server_name=self.name,
+                    uri=uri,
+                    content=content,
+                    mime_type=mime_type,
+                    mcp_context=mcp_context,  # Pass gateway context
+                )
+                contents.append(
+                    contents_from_bytes(item, sanitized_content, sanitized_mime_type)
+                )
+            finally:
+                for body in (content, sanitized_content):
+                    if isinstance(body, SpilledBody):
+                        body.close()
+        return result.model_copy(update={"contents": contents})
+
+    async def subscribe_resource(self, uri: str) -> None:
+        """Subscribes to updates of an upstream resource.
+
+        All subscriptions are held by one replica's session. They are renewed
+        whenever that session is replaced, and keep an on-demand server awake.
+        """
+        self.circuit.check()
+        if self.is_starting:
+            await self.wait_started()
+        await self._ensure_started()
+        await self._sync_subscriptions()
+        await self.session.subscribe_resource(AnyUrl(uri))
+        self._subscription_session = self.session
+        self._subscriptions.add(uri)
+
+    async def unsubscribe_resource(self, uri: str) -> None:
+        """Drops the subscription to an upstream resource."""
+        self._subscriptions.discard(uri)
+        session = self._subscription_session
+        if session is not None and self.is_active:
+            await session.unsubscribe_resource(AnyUrl(uri))
+        self._last_used = time.monotonic()
+
+    async def _sync_subscriptions(self) -> None:
+        """Renews the subscriptions on the primary session if the session that
+        held them is gone, for example after a restart or reconnect."""
+        if not self._subscriptions or not self.is_active:
+            return
+        session = self.session
+        if session is self._subscription_session:
+            return
+        self._subscription_session = session
+        for uri in list(self._subscriptions):
+            try:
+                await session.subscribe_resource(AnyUrl(uri))
+            except Exception as e:
+                logger.warning(
+                    f"Failed to renew subscription to {uri} of '{self.name}': {e}"
+                )
+        logger.info(
+            f"Renewed {len(self._subscriptions)} resource subscriptions of '{self.name}'."
         )
-        return sanitized_content, sanitized_mime_type
 
     async def list_tools(self) -> List[types.Tool]:
         """Lists available tools from the proxied server (uses cached list)."""
         return self._tools
 
+    def tool_timeout(self, name: str) -> Optional[float]:
+        """Returns the timeout for a tool: its tool_timeouts entry, else the server's."""
+        return self.tool_timeouts.get(name, self.timeout)
+
+    def cache_ttl(self, name: str) -> Optional[float]:
+        """Returns how long results of a tool may be cached, or None if they may not."""
+        return self.tool_cache_ttls.get(name)
+
     async def call_tool(
         self,
         plugin_manager: PluginManager,
@@ -316,7 +998,43 @@ class Server:
         arguments: Optional[Dict[str, Any]] = None,
         mcp_context: Optional[Context] = None,
     ) -> types.CallToolResult:
-        """Calls a tool on the proxied server after processing args and result through plugins."""
+        """Calls a tool on the proxied server after processing args and result through plugins.
+
+        The tool's timeout covers the whole call: request plugins, queueing,
+        the upstream call and response plugins. With coalesce_calls enabled,
+        concurrent calls sending identical arguments upstream share a single
+        upstream request; each caller still runs the plugins with its own MCP
+        context and times out on its own, without failing the shared request
+        for the other callers.
+
+        Raises:
+            ToolTimeoutError: If the call does not complete within the timeout.
+        """
+        timeout = self.tool_timeout(name)
+        if timeout is None:
+            return await self._call_tool(plugin_manager, name, arguments, mcp_context)
+
+        deadline = time.monotonic() + timeout
+        try:
+            return await asyncio.wait_for(
+                self._call_tool(plugin_manager, name, arguments, mcp_context, deadline),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            self.timed_out_calls += 1
+            logger.warning(
+                f"Tool call {self.name}/{name} timed out after {timeout:g}s."
+            )
+            raise ToolTimeoutError(self.name, name, timeout)
+
+    async def _call_tool(
+        self,
+        plugin_manager: PluginManager,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        mcp_context: Optional[Context],
+        deadline: Optional[float] = None,
+    ) -> types.CallToolResult:
         logger.debug(f"Calling tool {self.name}/{name}")
         # 1. Sanitize request arguments
         sanitized_args = await sanitize_tool_call_args(
@@ -325,6 +1043,7 @@ class Server:
             tool_name=name,
             arguments=arguments,
             mcp_context=mcp_context,  # Pass gateway context
+            deadline=deadline,
         )
 
         if sanitized_args is None:
@@ -338,7 +1057,13 @@ class Server:
             )
 
         # 2. Call the tool with sanitized arguments
-        result = await self.session.call_tool(name, arguments=sanitized_args)
+        if self.coalesce_calls:
+            result = await self._flights.do(
+                tool_call_key(self.name, name, sanitized_args),
+                functools.partial(self._send_tool_call, name, sanitized_args),
+            )
+        else:
+            result = await self._send_tool_call(name, sanitized_args)
 
         # 3. Sanitize the response result
         # Pass original request arguments for context if needed by plugins
@@ -349,10 +1074,56 @@ class Server:
             result=result,
             request_arguments=arguments,  # Pass original args for context
             mcp_context=mcp_context,  # Pass gateway context
+            deadline=deadline,
         )
 
         return sanitized_result
 
+    async def _send_tool_call(
+        self, name: str, arguments: Optional[Dict[str, Any]]
+    ) -> types.CallToolResult:
+        """Sends a tools/call request to the least-loaded replica.
+
+        A remote server that no longer knows the gateway's session, e.g. after
+        it restarted, rejects the call without running it; the replica is then
+        reconnected and the call sent once more.
+        """
+        async with self._dispatch() as session:
+            try:
+                return await self._call_tool_on(session, name, arguments)
+            except McpError as e:
+                if e.error.code != SESSION_TERMINATED:
+                    raise
+        await self.reconnect_session(session)
+        async with self._dispatch() as session:
+            return await self._call_tool_on(session, name, arguments)
+
+    async def _call_tool_on(
+        self,
+        session: ClientSession,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+    ) -> types.CallToolResult:
+        request_id = next_request_id(session)
+        try:
+            return await session.call_tool(name, arguments=arguments)
+        except asyncio.CancelledError:
+            # Timed out or abandoned by the client: stop the upstream work too
+            await cancel_request(session, request_id, "Request cancelled by MCP gateway")
+            raise
+
+    async def reconnect_session(self, session: ClientSession) -> None:
+        """Reconnects the replica owning session, unless another call already did."""
+        async with self._start_lock:
+            for replica in self._replicas:
+                if replica._session is session:
+                    logger.warning(
+                        f"Upstream '{replica.label}' dropped its session, reconnecting."
+                    )
+                    await replica.reconnect()
+                    break
+        await self._sync_subscriptions()
+
     async def get_capabilities(self) -> Optional[types.ServerCapabilities]:
         """Gets the capabilities of the proxied server from the stored InitializeResult."""
         if self._server_info is None:
@@ -377,22 +1148,210 @@ class GetewayContext:
 
     proxied_servers: Dict[str, Server] = field(default_factory=dict)
     plugin_manager: Optional[PluginManager] = None
+    snapshot_store: Optional[CapabilitySnapshotStore] = None
+    result_cache: Optional[ToolResultCache] = None
+    resource_cache: Optional[ResourceCache] = None
+    downstream: Optional[DownstreamSessions] = None
+    startup: Optional[StartupTracker] = None
+    supervisors: Dict[str, ServerSupervisor] = field(default_factory=dict)
+    # Servers still starting in the background
+    startup_tasks: Dict[str, asyncio.Task] = field(default_factory=dict)
+    # Items per page of the gateway's list responses, None for a single page
+    list_page_size: Optional[int] = None
+    # Most calls accepted by one batch_call_tools request
+    batch_max_calls: int = DEFAULT_BATCH_MAX_CALLS
+    # Routes gateway resource URIs to proxied_servers
+    resource_router: Optional[ResourceRouter] = None
+    resource_subscriptions: ResourceSubscriptions = field(
+        default_factory=ResourceSubscriptions
+    )
     # Store dynamic capability handlers/metadata on the gateway context
     # Using FastMCP internal attributes is fragile, store here instead.
     # gateway_tools: Dict[str, Dict[str, Any]] = field(default_factory=dict) # For future use
     # gateway_prompts: Dict[str, Dict[str, Any]] = field(default_factory=dict) # For future use
     # gateway_resources: Dict[str, Dict[str, Any]] = field(default_factory=dict) # For future use
 
+    def __post_init__(self) -> None:
+        if self.resource_router is None:
+            self.resource_router = ResourceRouter(self.proxied_servers)
+
 
 # --- Dynamic Capability Registration ---
 
 
+def tool_error_result(
+    message: str, details: Optional[Dict[str, Any]] = None
+) -> types.CallToolResult:
+    """Builds the CallToolResult returned to clients when the gateway fails a call.
+
+    Args:
+        message: Human readable error text.
+        details: Optional machine readable error description, sent as ``_meta``.
+    """
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=message)],
+        isError=True,
+        _meta=details,
+    )
+
+
+async def proxy_tool_call(
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+    name: str,
+    arguments: Optional[Dict[str, Any]],
+    mcp_context: Optional[Context] = None,
+    result_cache: Optional[ToolResultCache] = None,
+) -> types.CallToolResult:
+    """Calls a proxied tool, serving it from the result cache when allowed.
+
+    Only successful results of tools with a cache TTL are stored; they have
+    already passed the response plugins, so hits skip the plugins entirely.
+    """
+    ttl = proxied_server.cache_ttl(name)
+    if result_cache is None or not ttl:
+        return await proxied_server.call_tool(
+            plugin_manager=plugin_manager,
+            name=name,
+            arguments=arguments,
+            mcp_context=mcp_context,
+        )
+
+    key = tool_call_key(proxied_server.name, name, arguments)
+    cached = result_cache.get(key)
+    if cached is not None:
+        logger.debug(f"Result cache hit for {proxied_server.name}/{name}")
+        return cached
+    result = await proxied_server.call_tool(
+        plugin_manager=plugin_manager,
+        name=name,
+        arguments=arguments,
+        mcp_context=mcp_context,
+    )
+    if not result.isError:
+        result_cache.put(key, result, ttl)
+    return result
+
+
+async def proxy_resource_read(
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+    uri: str,
+    mcp_context: Optional[Context] = None,
+    resource_cache: Optional[ResourceCache] = None,
+) -> types.ReadResourceResult:
+    """Reads a proxied resource, serving it from the resource cache when allowed.
+
+    Reads are only cached for servers with a resource_cache_ttl. The cached
+    contents have already passed the response plugins.
+    """
+    ttl = proxied_server.resource_cache_ttl
+    if resource_cache is None or not ttl:
+        return await proxied_server.read_resource(plugin_manager, uri, mcp_context)
+
+    cached = resource_cache.get(proxied_server.name, uri)
+    if cached is not None:
+        logger.debug(f"Resource cache hit for {proxied_server.name} {uri}")
+        return cached
+    result = await proxied_server.read_resource(plugin_manager, uri, mcp_context)
+    resource_cache.put(proxied_server.name, uri, result, ttl)
+    return result
+
+
+async def execute_proxied_tool(
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+    name: str,
+    arguments: Optional[Dict[str, Any]],
+    mcp_context: Optional[Context] = None,
+    result_cache: Optional[ToolResultCache] = None,
+) -> types.CallToolResult:
+    """Runs proxy_tool_call, turning gateway failures into error results."""
+    dynamic_tool_name = f"{proxied_server.name}_{name}"
+    try:
+        return await proxy_tool_call(
+            proxied_server,
+            plugin_manager,
+            name,
+            arguments,
+            mcp_context=mcp_context,
+            result_cache=result_cache,
+        )
+    except SanitizationError as se:
+        logger.error(
+            f"Sanitization policy violation for dynamic tool '{dynamic_tool_name}': {se}"
+        )
+        return tool_error_result(f"Gateway policy violation: {se}")
+    except ToolTimeoutError as te:
+        return tool_error_result(str(te), details=te.to_dict())
+    except (CircuitOpenError, OverloadedError) as re:
+        logger.warning(f"Rejected dynamic tool '{dynamic_tool_name}': {re}")
+        return tool_error_result(str(re))
+    except Exception as e:
+        logger.error(
+            f"Error executing dynamic tool '{dynamic_tool_name}': {e}",
+            exc_info=True,
+        )
+        return tool_error_result(
+            f"Error executing dynamic tool '{dynamic_tool_name}': {e}"
+        )
+
+
+def resolve_gateway_tool(
+    proxied_servers: Dict[str, Server], tool_name: str
+) -> Tuple[Server, str]:
+    """Finds the proxied server and upstream tool behind a gateway tool name
+    (``<server>_<tool>``).
+
+    Raises:
+        ValueError: If no proxied server has such a tool.
+    """
+    for server_name, proxied_server in proxied_servers.items():
+        prefix = f"{server_name}_"
+        if tool_name.startswith(prefix):
+            upstream_name = tool_name[len(prefix) :]
+            if any(tool.name == upstream_name for tool in proxied_server._tools):
+                return proxied_server, upstream_name
+    raise ValueError(f"Unknown tool '{tool_name}'")
+
+
+async def run_batch_call(
+    context: GetewayContext,
+    tool_name: str,
+    arguments: Optional[Dict[str, Any]],
+    mcp_context: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Runs one call of a batch, returning its result or error and duration."""
+    started = time.monotonic()
+    entry: Dict[str, Any] = {"tool": tool_name}
+    try:
+        proxied_server, upstream_name = resolve_gateway_tool(
+            context.proxied_servers, tool_name
+        )
+    except ValueError as e:
+        result = tool_error_result(str(e))
+    else:
+        result = await execute_proxied_tool(
+            proxied_server,
+            context.plugin_manager,
+            upstream_name,
+            arguments,
+            mcp_context=mcp_context,
+            result_cache=context.result_cache,
+        )
+    entry["isError"] = bool(result.isError)
+    entry["result"] = result.model_dump(mode="json", by_alias=True, exclude_none=True)
+    entry["duration_seconds"] = round(time.monotonic() - started, 6)
+    return entry
+
+
 async def register_dynamic_tool(
     gateway_mcp: FastMCP,
     server_name: str,
     tool: types.Tool,
     proxied_server: Server,
     plugin_manager: PluginManager,
+    result_cache: Optional[ToolResultCache] = None,
 ):
     """Registers a dynamic tool handler directly with the FastMCP instance."""
     dynamic_tool_name = f"{server_name}_{tool.name}"
@@ -460,36 +1419,14 @@ async def register_dynamic_tool(
             logger.info(
                 f"Executing dynamic tool '{dynamic_tool_name}' (proxied from {server_name}/{tool.name})"
             )
-            try:
-                result = await proxied_server.call_tool(
-                    plugin_manager=plugin_manager,
-                    name=tool.name,
-                    arguments=tool_kwargs,
-                    mcp_context=ctx,  # Pass gateway context
-                )
-                return result
-            except SanitizationError as se:
-                logger.error(
-                    f"Sanitization policy violation for dynamic tool '{dynamic_tool_name}': {se}"
-                )
-                return types.CallToolResult(
-                    outputs=[
-                        {"type": "error", "message": f"Gateway policy violation: {se}"}
-                    ]
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error executing dynamic tool '{dynamic_tool_name}': {e}",
-                    exc_info=True,
-                )
-                return types.CallToolResult(
-                    outputs=[
-                        {
-                            "type": "error",
-                            "message": f"Error executing dynamic tool '{dynamic_tool_name}': {e}",
-                        }
-                    ]
-                )
+            return await execute_proxied_tool(
+                proxied_server,
+                plugin_manager,
+                tool.name,
+                tool_kwargs,
+                mcp_context=ctx,  # Pass gateway context
+                result_cache=result_cache,
+            )
 
         # Apply the signature to the function
         dynamic_tool_impl.__signature__ = sig
@@ -629,6 +1566,101 @@ async def register_dynamic_prompt(
         )
 
 
+def unregister_dynamic_tool(gateway_mcp: FastMCP, server_name: str, tool_name: str):
+    """Removes a dynamic tool handler from the FastMCP instance."""
+    dynamic_tool_name = f"{server_name}_{tool_name}"
+    if gateway_mcp._tool_manager._tools.pop(dynamic_tool_name, None) is not None:
+        logger.info(f"Unregistered dynamic tool '{dynamic_tool_name}'")
+
+
+def unregister_dynamic_prompt(
+    gateway_mcp: FastMCP, server_name: str, prompt_name: str
+):
+    """Removes a dynamic prompt handler from the FastMCP instance."""
+    dynamic_prompt_name = f"{server_name}_{prompt_name}"
+    if gateway_mcp._prompt_manager._prompts.pop(dynamic_prompt_name, None) is not None:
+        logger.info(f"Unregistered dynamic prompt '{dynamic_prompt_name}'")
+
+
+def diff_capabilities(old: List[Any], new: List[Any]) -> Tuple[List[Any], List[str]]:
+    """Compares two capability lists (tools or prompts) by name and definition.
+
+    Returns:
+        The new items that were added or whose definition changed, and the
+        names of old items that were removed or changed.
+    """
+    old_by_name = {item.name: item.model_dump() for item in old}
+    new_names = {item.name for item in new}
+    upserts = [item for item in new if old_by_name.get(item.name) != item.model_dump()]
+    stale = [
+        name
+        for name in old_by_name
+        if name not in new_names or any(item.name == name for item in upserts)
+    ]
+    return upserts, stale
+
+
+async def apply_capability_diff(
+    gateway_mcp: FastMCP,
+    context: GetewayContext,
+    proxied_server: Server,
+    previous: CapabilitySnapshot,
+) -> Set[str]:
+    """Updates one server's dynamic handlers from its previous capabilities to its
+    current ones, leaving handlers that did not change (and other servers) alone.
+    Connected clients are sent listChanged for each kind that changed.
+
+    Returns:
+        The kinds ("tools", "prompts", "resources") that changed.
+    """
+    server_name = proxied_server.name
+    plugin_manager = context.plugin_manager
+    tool_upserts, stale_tools = diff_capabilities(previous.tools, proxied_server._tools)
+    prompt_upserts, stale_prompts = diff_capabilities(
+        previous.prompts, proxied_server._prompts
+    )
+
+    for tool_name in stale_tools:
+        unregister_dynamic_tool(gateway_mcp, server_name, tool_name)
+    for prompt_name in stale_prompts:
+        unregister_dynamic_prompt(gateway_mcp, server_name, prompt_name)
+    for tool in tool_upserts:
+        await register_dynamic_tool(
+            gateway_mcp,
+            server_name,
+            tool,
+            proxied_server,
+            plugin_manager,
+            context.result_cache,
+        )
+    for prompt in prompt_upserts:
+        await register_dynamic_prompt(
+            gateway_mcp, server_name, prompt, proxied_server, plugin_manager
+        )
+
+    changed = set()
+    if tool_upserts or stale_tools:
+        changed.add("tools")
+    if prompt_upserts or stale_prompts:
+        changed.add("prompts")
+    # Resources are served from the server's cached lists, nothing to register
+    if [r.model_dump() for r in previous.resources] != [
+        r.model_dump() for r in proxied_server._resources
+    ] or [t.model_dump() for t in previous.resource_templates] != [
+        t.model_dump() for t in proxied_server._resource_templates
+    ]:
+        changed.add("resources")
+    if changed:
+        logger.info(
+            f"Capabilities of '{server_name}' changed: "
+            f"{len(tool_upserts)} tools and {len(prompt_upserts)} prompts (re)registered, "
+            f"{len(stale_tools)} tools and {len(stale_prompts)} prompts unregistered."
+        )
+        if context.downstream is not None:
+            await context.downstream.notify_list_changed(changed)
+    return changed
+
+
 async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayContext):
     """Fetches capabilities from proxied servers and registers them dynamically with the gateway_mcp."""
     logger.info("Dynamically registering capabilities from proxied servers...")
@@ -644,7 +1676,13 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
     registered_prompt_count = 0
 
     for server_name, proxied_server in context.proxied_servers.items():
-        if proxied_server.session:  # Only register for active sessions
+        # Only register for active sessions, or servers whose capabilities are
+        # known from a snapshot without a running process
+        if (
+            proxied_server.is_active
+            or proxied_server.on_demand
+            or proxied_server.is_starting
+        ):
             # Register tools for this server
             for tool in proxied_server._tools:  # Use cached list
                 registration_tasks.append(
@@ -654,6 +1692,7 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
                         tool,
                         proxied_server,
                         plugin_manager,
+                        context.result_cache,
                     )
                 )
                 registered_tool_count += 1
@@ -669,11 +1708,8 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
                     )
                 )
                 registered_prompt_count += 1
-            # Note: Dynamic resource registration is deferred
-            if proxied_server._resources:
-                logger.warning(
-                    f"Dynamic resource registration for server '{server_name}' is not yet implemented. Resources will not be exposed via gateway."
-                )
+            # Resources need no registration: the handlers installed by
+            # install_resource_handlers serve them from the cached lists
         else:
             logger.warning(
                 f"Skipping dynamic registration for inactive server: {server_name}"
@@ -688,9 +1724,233 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
         logger.info("No active proxied servers found or no capabilities to register.")
 
 
+def install_resource_handlers(gateway_mcp: FastMCP) -> None:
+    """Serves the resources and resource templates of every proxied server.
+
+    They are exposed as mcp-gateway://<server>/<upstream uri> and replace
+    FastMCP's own resource handlers, since the gateway has no resources of
+    its own. Reads are routed to the owning server by the context's
+    ResourceRouter and pass through the response plugins. Subscriptions are
+    shared between clients by the context's ResourceSubscriptions.
+    """
+    handlers = gateway_mcp._mcp_server.request_handlers
+
+    async def list_resources(request: types.ListResourcesRequest) -> types.ServerResult:
+        context: GetewayContext = request_ctx.get().lifespan_context
+        resources = [
+            namespace_resource(name, resource)
+            for name, proxied_server in list(context.proxied_servers.items())
+            for resource in proxied_server._resources
+        ]
+        return types.ServerResult(types.ListResourcesResult(resources=resources))
+
+    async def list_resource_templates(
+        request: types.ListResourceTemplatesRequest,
+    ) -> types.ServerResult:
+        context: GetewayContext = request_ctx.get().lifespan_context
+        templates = [
+            namespace_resource_template(name, template)
+            for name, proxied_server in list(context.proxied_servers.items())
+            for template in proxied_server._resource_templates
+        ]
+        return types.ServerResult(
+            types.ListResourceTemplatesResult(resourceTemplates=templates)
+        )
+
+    async def read_resource(request: types.ReadResourceRequest) -> types.ServerResult:
+        request_context = request_ctx.get()
+        context: GetewayContext = request_context.lifespan_context
+        proxied_server, upstream_uri = context.resource_router.route(
+            str(request.params.uri)
+        )
+        result = await proxy_resource_read(
+            proxied_server,
+            context.plugin_manager,
+            upstream_uri,
+            Context(request_context=request_context, fastmcp=gateway_mcp),
+            context.resource_cache,
+        )
+        # Report the contents under the URIs the client knows
+        contents = [
+            item.model_copy(
+                update={
+                    "uri": AnyUrl(gateway_uri(proxied_server.name, str(item.uri)))
+                }
+            )
+            for item in result.contents
+        ]
+        return types.ServerResult(result.model_copy(update={"contents": contents}))
+
+    async def subscribe(request: types.SubscribeRequest) -> types.ServerResult:
+        request_context = request_ctx.get()
+        context: GetewayContext = request_context.lifespan_context
+        proxied_server, upstream_uri = context.resource_router.route(
+            str(request.params.uri)
+        )
+        await context.resource_subscriptions.subscribe(
+            proxied_server, upstream_uri, request_context.session
+        )
+        return types.ServerResult(types.EmptyResult())
+
+    async def unsubscribe(request: types.UnsubscribeRequest) -> types.ServerResult:
+        request_context = request_ctx.get()
+        context: GetewayContext = request_context.lifespan_context
+        proxied_server, upstream_uri = context.resource_router.route(
+            str(request.params.uri)
+        )
+        await context.resource_subscriptions.unsubscribe(
+            proxied_server, upstream_uri, request_context.session
+        )
+        return types.ServerResult(types.EmptyResult())
+
+    handlers[types.ListResourcesRequest] = list_resources
+    handlers[types.ListResourceTemplatesRequest] = list_resource_templates
+    handlers[types.ReadResourceRequest] = read_resource
+    handlers[types.SubscribeRequest] = subscribe
+    handlers[types.UnsubscribeRequest] = unsubscribe
+
+    # The low-level server never advertises subscribe support by itself
+    get_capabilities = gateway_mcp._mcp_server.get_capabilities
+
+    @functools.wraps(get_capabilities)
+    def with_subscribe(*args: Any, **kwargs: Any) -> types.ServerCapabilities:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    gateway_mcp._mcp_server.get_capabilities = with_subscribe
+
+
 # --- Lifespan Management ---
 
 
+async def handle_resource_updated(
+    context: GetewayContext, proxied_server: Server, uri: str
+) -> None:
+    """Drops the cached read of an updated resource and tells its subscribers."""
+    if context.resource_cache is not None:
+        context.resource_cache.invalidate(proxied_server.name, uri)
+    await context.resource_subscriptions.publish(proxied_server, uri)
+
+
+async def handle_list_changed(
+    gateway_mcp: FastMCP,
+    context: GetewayContext,
+    proxied_server: Server,
+    previous: CapabilitySnapshot,
+    kinds: Set[str],
+) -> None:
+    """Applies a server's re-fetched capabilities after a listChanged notification."""
+    if "tools" in kinds and context.result_cache is not None:
+        # Tool behaviour may have changed along with its definition
+        context.result_cache.invalidate(proxied_server.name)
+    if "resources" in kinds and context.resource_cache is not None:
+        context.resource_cache.invalidate(proxied_server.name)
+    await apply_capability_diff(gateway_mcp, context, proxied_server, previous)
+    context.snapshot_store.save(
+        proxied_server.name, proxied_server.config, proxied_server.capability_snapshot()
+    )
+
+
+async def start_and_register(
+    gateway_mcp: FastMCP,
+    context: GetewayContext,
+    proxied_server: Server,
+    snapshot: Optional[CapabilitySnapshot] = None,
+) -> None:
+    """Starts one proxied server and exposes its capabilities as soon as it is ready.
+
+    On-demand servers only load their capabilities. A server whose handlers
+    were already registered from ``snapshot`` has them corrected to the live
+    capabilities. A server that fails or exceeds its startup_timeout is
+    stopped, its handlers are removed and it is dropped from the context.
+    """
+    name = proxied_server.name
+    previous = snapshot or CapabilitySnapshot()
+    timeout = proxied_server.startup_timeout
+    limiter = context.startup.limiter if context.startup is not None else None
+    try:
+        if proxied_server.on_demand:
+            await proxied_server.run_startup(
+                functools.partial(
+                    proxied_server.prepare_on_demand, context.snapshot_store
+                ),
+                limiter,
+            )
+        else:
+            if not proxied_server.is_starting:
+                proxied_server.start_in_background(limiter)
+            await proxied_server.wait_started()
+            # Persist capabilities for the next startup and for on-demand use
+            context.snapshot_store.save(
+                name, proxied_server.config, proxied_server.capability_snapshot()
+            )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if isinstance(e, asyncio.TimeoutError):
+            error = f"did not start within {timeout:g}s"
+            logger.error(f"Server '{name}' {error}.")
+        else:
+            error = str(e) or type(e).__name__
+            logger.error(
+                f"Failed to start server '{name}': {e}",
+                exc_info=e if logger.isEnabledFor(logging.DEBUG) else None,
+            )
+        await proxied_server.stop()
+        await apply_capability_diff(gateway_mcp, context, proxied_server, previous)
+        context.proxied_servers.pop(name, None)
+        if context.startup is not None:
+            context.startup.server_finished(
+                name, ok=False, profile=proxied_server.startup_profile, error=error
+            )
+        return
+    finally:
+        context.startup_tasks.pop(name, None)
+
+    logger.info(f"Successfully started server '{name}'.")
+    await apply_capability_diff(gateway_mcp, context, proxied_server, previous)
+    if context.startup is not None:
+        context.startup.tools_registered(name, len(proxied_server._tools))
+        context.startup.server_finished(
+            name, ok=True, profile=proxied_server.startup_profile
+        )
+
+    # Supervise the server so crashed upstreams get restarted
+    supervisor = ServerSupervisor(proxied_server)
+    supervisor.start()
+    context.supervisors[name] = supervisor
+
+
+def launch_proxied_servers(
+    gateway_mcp: FastMCP,
+    context: GetewayContext,
+    snapshots: Optional[Dict[str, CapabilitySnapshot]] = None,
+) -> None:
+    """Creates a start_and_register task for every proxied server.
+
+    Servers are queued for the startup slots in descending startup_priority,
+    keeping config order among equal priorities.
+    """
+    snapshots = snapshots or {}
+    limiter = context.startup.limiter if context.startup is not None else None
+    by_priority = sorted(
+        context.proxied_servers.items(), key=lambda item: -item[1].startup_priority
+    )
+    for name, proxied_server in by_priority:
+        if not proxied_server.on_demand:
+            # Started here rather than in the task so calls to tools registered
+            # from a snapshot wait for the server instead of failing
+            proxied_server.start_in_background(limiter)
+        context.startup_tasks[name] = asyncio.create_task(
+            start_and_register(
+                gateway_mcp, context, proxied_server, snapshots.get(name)
+            ),
+            name=f"startup-{name}",
+        )
+
+
 @asynccontextmanager
 async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
     """Manages the lifecycle of proxied MCP servers and dynamic registration."""
@@ -741,72 +2001,147 @@ async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
     else:
         logger.info("Tracing plugins DISABLED.")
 
+    # Load proxied server configs
+    proxied_server_configs = load_config(cli_args.mcp_json_path)
+    gateway_settings = load_gateway_settings(cli_args.mcp_json_path)
+
     # Initialize plugin manager with configuration
     plugin_manager = PluginManager(
-        enabled_types=enabled_plugin_types, enabled_plugins=enabled_plugins
+        enabled_types=enabled_plugin_types,
+        enabled_plugins=enabled_plugins,
+        plugin_settings=gateway_settings.get("plugins"),
+        tracing_queue=TracingQueue(
+            max_size=int(
+                gateway_settings.get("tracing_queue_size", DEFAULT_TRACING_QUEUE_SIZE)
+            ),
+            overflow=gateway_settings.get("tracing_overflow", OVERFLOW_DROP_OLDEST),
+            workers=int(
+                gateway_settings.get("tracing_workers", DEFAULT_TRACING_WORKERS)
+            ),
+            flush_timeout=float(
+                gateway_settings.get(
+                    "tracing_flush_timeout", DEFAULT_TRACING_FLUSH_TIMEOUT
+                )
+            ),
+        ),
     )
 
-    # Load proxied server configs
-    proxied_server_configs = load_config(cli_args.mcp_json_path)
+    # Load plugins run in process pools into their worker processes
+    await plugin_manager.start()
 
     # Initialize context
-    context = GetewayContext(plugin_manager=plugin_manager)
+    context = GetewayContext(
+        plugin_manager=plugin_manager,
+        snapshot_store=CapabilitySnapshotStore(gateway_settings.get("snapshot_dir")),
+        result_cache=ToolResultCache(
+            int(
+                gateway_settings.get(
+                    "result_cache_max_bytes", DEFAULT_RESULT_CACHE_MAX_BYTES
+                )
+            )
+        ),
+        resource_cache=ResourceCache(
+            max_bytes=int(
+                gateway_settings.get(
+                    "resource_cache_max_bytes", DEFAULT_RESOURCE_CACHE_MAX_BYTES
+                )
+            ),
+            spill_threshold=int(
+                gateway_settings.get(
+                    "resource_cache_spill_threshold",
+                    DEFAULT_RESOURCE_CACHE_SPILL_THRESHOLD,
+                )
+            ),
+            spill_max_bytes=int(
+                gateway_settings.get(
+                    "resource_cache_spill_max_bytes",
+                    DEFAULT_RESOURCE_CACHE_SPILL_MAX_BYTES,
+                )
+            ),
+            spill_dir=gateway_settings.get("resource_cache_dir"),
+        ),
+        downstream=downstream_sessions,
+        batch_max_calls=int(
+            gateway_settings.get("batch_max_calls", DEFAULT_BATCH_MAX_CALLS)
+        ),
+        list_page_size=_optional_int(gateway_settings.get("list_page_size")),
+    )
 
     # Create Server instances but don't start them yet
     for name, server_config in proxied_server_configs.items():
         logger.info(f"Creating client instance for proxied server: {name}")
-        proxied_server = Server(name, server_config)
+        try:
+            proxied_server = Server(name, server_config)
+        except ValueError as e:
+            logger.error(f"Invalid configuration for server '{name}': {e}")
+            continue
+        if "startup_timeout" not in server_config:
+            proxied_server.startup_timeout = float(
+                gateway_settings.get("startup_timeout", DEFAULT_STARTUP_TIMEOUT)
+            )
+        proxied_server.on_list_changed = functools.partial(
+            handle_list_changed, server, context
+        )
+        proxied_server.on_resource_updated = functools.partial(
+            handle_resource_updated, context
+        )
         context.proxied_servers[name] = proxied_server
 
-    # Start all servers concurrently
-    if context.proxied_servers:
-        logger.info("Starting all configured proxied servers...")
-        start_tasks = [
-            asyncio.create_task(server.start())
-            for server in context.proxied_servers.values()
-        ]
-        if start_tasks:
-            results = await asyncio.gather(*start_tasks, return_exceptions=True)
-            # Check results for errors during startup
-            failed_servers = []
-            for i, result in enumerate(results):
-                server_name = list(context.proxied_servers.keys())[i]
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Failed to start server '{server_name}' during gather: {result}",
-                        exc_info=result if logger.isEnabledFor(logging.DEBUG) else None,
-                    )
-                    failed_servers.append(server_name)
-                else:
-                    logger.info(f"Successfully started server '{server_name}'.")
-
-            # Remove failed servers from context so we don't try to register them
-            for name in failed_servers:
-                context.proxied_servers.pop(name, None)
-
-            logger.info("Attempted to start all configured proxied servers.")
-    else:
+    context.startup = StartupTracker(
+        len(context.proxied_servers),
+        concurrency=_optional_int(gateway_settings.get("startup_concurrency")),
+    )
+    if not context.proxied_servers:
         logger.warning(
             "No proxied MCP servers configured. Running in standalone mode (plugins still active)."
         )
 
-    # Register capabilities from proxied servers
-    await register_proxied_capabilities(server, context)
+    # Servers with a snapshot of their capabilities are registered right away
+    # and finish starting in the background
+    snapshots: Dict[str, CapabilitySnapshot] = {}
+    for name, proxied_server in context.proxied_servers.items():
+        if proxied_server.on_demand:
+            continue
+        snapshot = context.snapshot_store.load(name, proxied_server.config)
+        if snapshot is not None:
+            proxied_server.apply_snapshot(snapshot)
+            snapshots[name] = snapshot
+            await apply_capability_diff(
+                server, context, proxied_server, CapabilitySnapshot()
+            )
+            context.startup.tools_registered(name, len(snapshot.tools))
+            logger.info(
+                f"Using capability snapshot for '{name}' while it starts in the background."
+            )
+
+    # Every server starts in the background and is registered, with a
+    # listChanged notification to connected clients, as soon as it is ready
+    logger.info("Starting all configured proxied servers...")
+    launch_proxied_servers(server, context, snapshots)
 
     try:
         # Yield the context containing servers and plugin manager
         yield context
     finally:
         logger.info("MCP gateway lifespan shutting down...")
-        # Stop only the servers that were successfully started
+        for task in list(context.startup_tasks.values()):
+            task.cancel()
+        await asyncio.gather(
+            *(supervisor.stop() for supervisor in context.supervisors.values()),
+            return_exceptions=True,
+        )
+        # Stop running servers and the idle watchers of on-demand ones
         stop_tasks = [
             asyncio.create_task(server.stop())
             for name, server in context.proxied_servers.items()
-            if server._session is not None  # Check if session was ever active
+            if server.is_active or server.on_demand or server.is_starting
         ]
         if stop_tasks:
             await asyncio.gather(*stop_tasks, return_exceptions=True)
             logger.info("All active proxied servers stopped.")
+        context.resource_cache.close()
+        # Write the trace events of the last calls
+        await plugin_manager.close()
         logger.info("MCP gateway shutdown complete.")
 
 
@@ -814,6 +2149,15 @@ async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
 # Pass description and version if desired
 mcp = FastMCP("MCP Gateway", lifespan=lifespan, version="1.0.0")
 
+install_resource_handlers(mcp)
+install_pagination(
+    mcp._mcp_server, lambda context: getattr(context, "list_page_size", None)
+)
+
+# Remember connected clients so they can be told about capability changes
+downstream_sessions = DownstreamSessions()
+downstream_sessions.install(mcp._mcp_server)
+
 
 # --- Gateway's Own Capability Implementations ---
 
@@ -844,13 +2188,48 @@ async def get_metadata(ctx: Context) -> Dict[str, Any]:
             "original_prompts": [],
         }
 
-        if not server or not server.session:
+        if not server:
             server_metadata["error"] = "Server session not active or start failed"
             metadata[name] = server_metadata
             continue
 
+        supervisor = geteway_context.supervisors.get(name)
+        if supervisor:
+            server_metadata["health"] = supervisor.stats()
+
         try:
-            server_metadata["status"] = "active"
+            if server.is_active:
+                server_metadata["status"] = "active"
+            elif server.is_starting:
+                server_metadata["status"] = "starting"
+            elif server.on_demand:
+                server_metadata["status"] = "hibernating"
+            else:
+                server_metadata["status"] = "down"
+            server_metadata["pool"] = server.pool_stats()
+            server_metadata["admission"] = server.admission.stats()
+            server_metadata["timeouts"] = {
+                "timeout": server.timeout,
+                "tool_timeouts": server.tool_timeouts,
+                "timed_out_calls": server.timed_out_calls,
+            }
+            if server.coalesce_calls:
+                server_metadata["coalescing"] = server._flights.stats()
+            if geteway_context.result_cache is not None:
+                server_metadata["result_cache"] = geteway_context.result_cache.stats(
+                    name
+                )
+            if geteway_context.resource_cache is not None:
+                server_metadata["resource_cache"] = (
+                    geteway_context.resource_cache.stats(name)
+                )
+            if geteway_context.plugin_manager.tracing_queue is not None:
+                server_metadata["tracing"] = (
+                    geteway_context.plugin_manager.tracing_queue.stats(name)
+                )
+            server_metadata["resource_subscriptions"] = (
+                geteway_context.resource_subscriptions.stats(name)
+            )
             # 1. Get Capabilities
             capabilities = (
                 await server.get_capabilities()
@@ -911,6 +2290,50 @@ async def get_metadata(ctx: Context) -> Dict[str, Any]:
     return metadata
 
 
+@mcp.tool()
+async def batch_call_tools(calls: List[Dict[str, Any]], ctx: Context) -> Dict[str, Any]:
+    """Runs several proxied tool calls concurrently in one request.
+
+    Each call is {"tool": "<server>_<tool>", "arguments": {...}}, using the tool
+    names listed by the gateway. Calls go through the same plugins, caches and
+    per-server concurrency limits as individual calls. Results are returned
+    in the order of the calls, each with its own error flag and duration.
+    """
+    geteway_context: GetewayContext = ctx.request_context.lifespan_context
+    if len(calls) > geteway_context.batch_max_calls:
+        raise ValueError(
+            f"A batch may contain at most {geteway_context.batch_max_calls} calls, "
+            f"got {len(calls)}"
+        )
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(
+            run_batch_call(
+                geteway_context,
+                str(call.get("tool", "")),
+                call.get("arguments") or {},
+                mcp_context=ctx,
+            )
+            for call in calls
+        )
+    )
+    return {
+        "results": list(results),
+        "errors": sum(1 for result in results if result["isError"]),
+        "duration_seconds": round(time.monotonic() - started, 6),
+    }
+
+
+@mcp.tool()
+async def get_startup_report(ctx: Context) -> Dict[str, Any]:
+    """Reports how long each proxied server took to start, split into time spent
+    waiting for a startup slot, spawning, initializing and fetching capabilities."""
+    geteway_context: GetewayContext = ctx.request_context.lifespan_context
+    if geteway_context.startup is None:
+        return {"status": "not_started"}
+    return geteway_context.startup.report()
+
+
 # --- Argument Parsing & Main ---
 def parse_args(args=None):
     """Parses command-line arguments."""
@@ -946,6 +2369,30 @@ def parse_args(args=None):
         const="all",
         default=[],
     )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="How clients connect to the gateway. With 'sse' or 'streamable-http' every client shares one set of upstream servers.",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Address to listen on with an HTTP transport",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on with an HTTP transport",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of gateway processes sharing the listening socket with an HTTP transport",
+    )
     if args is None:
         args = sys.argv[1:]
 
@@ -970,7 +2417,43 @@ def main():
     cli_args = parse_args()
 
     logger.info("Starting MCP gateway server directly...")
-    mcp.run()
+    if cli_args.transport == "stdio":
+        if cli_args.workers > 1:
+            logger.warning("--workers is ignored with the stdio transport.")
+        mcp.run()
+        return
+
+    mcp.settings.host = cli_args.host
+    mcp.settings.port = cli_args.port
+    if cli_args.workers > 1:
+        if cli_args.transport != "streamable-http":
+            raise SystemExit(
+                "--workers requires --transport streamable-http: an SSE session "
+                "is bound to the worker that accepted its stream."
+            )
+        listener = bind_socket(cli_args.host, cli_args.port)
+        logger.info(
+            f"Starting {cli_args.workers} gateway workers on "
+            f"{cli_args.host}:{cli_args.port}..."
+        )
+        WorkerSupervisor(
+            run_worker, cli_args.workers, [listener], args=(sys.argv[1:],)
+        ).run()
+    else:
+        asyncio.run(serve_http(mcp, cli_args.transport))
+
+
+def run_worker(worker_index: int, sockets: List[Any], argv: List[str]) -> None:
+    """Entry point of a worker process started by --workers."""
+    global cli_args
+    cli_args = parse_args(argv)
+    mcp.settings.host = cli_args.host
+    mcp.settings.port = cli_args.port
+    # Consecutive requests of a client may reach different workers, so no
+    # worker can keep per-client session state
+    mcp.settings.stateless_http = True
+    logger.info(f"Gateway worker {worker_index} serving {cli_args.transport}...")
+    asyncio.run(serve_http(mcp, cli_args.transport, sockets=sockets))
 
 
 if __name__ == "__main__":
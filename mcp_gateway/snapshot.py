@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mcp import types
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_DIR = Path.home() / ".cache" / "mcp-gateway" / "snapshots"
+
+# Only the keys that determine which process is launched affect its capabilities;
+# tuning options such as pool_size must not invalidate a snapshot.
+_IDENTITY_KEYS = ("command", "args", "env")
+# Identify remote servers; only hashed when set so existing snapshots stay valid
+_REMOTE_IDENTITY_KEYS = ("url", "transport")
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Returns a stable hash of the parts of a server config that identify it."""
+    identity = {key: config.get(key) for key in _IDENTITY_KEYS}
+    identity.update(
+        {key: config[key] for key in _REMOTE_IDENTITY_KEYS if key in config}
+    )
+    encoded = json.dumps(identity, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class CapabilitySnapshot:
+    """Capabilities of a proxied server as last fetched from a live session."""
+
+    server_info: Optional[types.InitializeResult] = None
+    tools: List[types.Tool] = field(default_factory=list)
+    resources: List[types.Resource] = field(default_factory=list)
+    resource_templates: List[types.ResourceTemplate] = field(default_factory=list)
+    prompts: List[types.Prompt] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the snapshot to a JSON-serializable dictionary."""
+        return {
+            "server_info": (
+                self.server_info.model_dump(mode="json") if self.server_info else None
+            ),
+            "tools": [tool.model_dump(mode="json") for tool in self.tools],
+            "resources": [res.model_dump(mode="json") for res in self.resources],
+            "resource_templates": [
+                template.model_dump(mode="json") for template in self.resource_templates
+            ],
+            "prompts": [prompt.model_dump(mode="json") for prompt in self.prompts],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CapabilitySnapshot":
+        """Build a snapshot from the output of ``to_dict``."""
+        server_info = data.get("server_info")
+        return cls(
+            server_info=(
+                types.InitializeResult.model_validate(server_info)
+                if server_info
+                else None
+            ),
+            tools=[types.Tool.model_validate(t) for t in data.get("tools", [])],
+            resources=[
+                types.Resource.model_validate(r) for r in data.get("resources", [])
+            ],
+            resource_templates=[
+                types.ResourceTemplate.model_validate(t)
+                for t in data.get("resource_templates", [])
+            ],
+            prompts=[types.Prompt.model_validate(p) for p in data.get("prompts", [])],
+        )
+
+
+class CapabilitySnapshotStore:
+    """Persists capability snapshots as one JSON file per proxied server."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initializes the store.
+
+        Args:
+            directory: Directory holding the snapshot files
+                (default: ~/.cache/mcp-gateway/snapshots).
+        """
+        self.directory = (
+            Path(directory).expanduser() if directory else DEFAULT_SNAPSHOT_DIR
+        )
+
+    def _path(self, server_name: str) -> Path:
+        return self.directory / f"{server_name}.json"
+
+    def load(
+        self, server_name: str, config: Dict[str, Any]
+    ) -> Optional[CapabilitySnapshot]:
+        """Returns the stored snapshot for a server, or None if missing or stale."""
+        path = self._path(server_name)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("config_hash") != config_hash(config):
+                logger.info(
+                    f"Capability snapshot for '{server_name}' is stale (config changed)."
+                )
+                return None
+            return CapabilitySnapshot.from_dict(data)
+        except Exception as e:
+            logger.warning(
+                f"Failed to read capability snapshot for '{server_name}' from {path}: {e}"
+            )
+            return None
+
+    def save(
+        self, server_name: str, config: Dict[str, Any], snapshot: CapabilitySnapshot
+    ) -> None:
+        """Writes a server's snapshot atomically. Failures are logged, not raised."""
+        path = self._path(server_name)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            data = {"config_hash": config_hash(config), **snapshot.to_dict()}
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+            logger.debug(f"Saved capability snapshot for '{server_name}' to {path}")
+        except Exception as e:
+            logger.warning(
+                f"Failed to save capability snapshot for '{server_name}' to {path}: {e}"
+            )
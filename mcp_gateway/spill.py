@@ -0,0 +1,165 @@
+import base64
+import codecs
+import logging
+import mmap
+import tempfile
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Resource bodies of at least this many bytes are spilled to a temp file (8 MiB)
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024
+# Bytes of a spilled body decoded and scanned at a time (1 MiB)
+DEFAULT_SCAN_WINDOW = 1024 * 1024
+
+# Whitespace a window may be cut at, so no token is split between windows
+_CUT_CHARACTERS = (" ", "\n", "\t", "\r")
+
+
+class SpilledBody:
+    """A resource body kept in an anonymous temp file and read through mmap.
+
+    Large resource reads are passed through the response plugins as a
+    ``(SpilledBody, mime_type)`` pair instead of ``(bytes, mime_type)``, so
+    that plugins can scan them a window at a time without holding a full
+    copy in memory. The file is deleted when the body is closed.
+    """
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile(prefix="mcp-gateway-body-")
+        self._map: Optional[mmap.mmap] = None
+        self.size = 0
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[bytes]) -> "SpilledBody":
+        """Writes the given chunks to a new spilled body."""
+        body = cls()
+        try:
+            for chunk in chunks:
+                body._file.write(chunk)
+                body.size += len(chunk)
+            body._file.flush()
+        except BaseException:
+            body.close()
+            raise
+        return body
+
+    @classmethod
+    def from_text(cls, text: str, window: int = DEFAULT_SCAN_WINDOW) -> "SpilledBody":
+        """Spills text as UTF-8, encoding one window at a time."""
+        return cls.from_chunks(
+            text[start : start + window].encode("utf-8")
+            for start in range(0, len(text), window)
+        )
+
+    @classmethod
+    def from_base64(cls, data: str, window: int = DEFAULT_SCAN_WINDOW) -> "SpilledBody":
+        """Spills base64 data decoded, one window at a time."""
+        window -= window % 4
+        return cls.from_chunks(
+            base64.b64decode(data[start : start + window])
+            for start in range(0, len(data), window)
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def buffer(self) -> memoryview:
+        """The body's bytes, mapped from the file rather than read into memory."""
+        if self.size == 0:
+            return memoryview(b"")
+        if self._map is None:
+            self._map = mmap.mmap(
+                self._file.fileno(), self.size, access=mmap.ACCESS_READ
+            )
+        return memoryview(self._map)
+
+    def chunks(self, window: int = DEFAULT_SCAN_WINDOW) -> Iterator[bytes]:
+        """Yields the body's bytes a window at a time."""
+        buffer = self.buffer
+        for start in range(0, self.size, window):
+            yield bytes(buffer[start : start + window])
+
+    def text_windows(self, window: int = DEFAULT_SCAN_WINDOW) -> Iterator[str]:
+        """Yields the body decoded as UTF-8 in windows of about window bytes.
+
+        Windows end at whitespace whenever there is any, so that secrets and
+        other tokens a guardrail looks for are never split between two
+        windows. Invalid UTF-8 is replaced, as when decoding the whole body.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        for chunk in self.chunks(window):
+            text = pending + decoder.decode(chunk)
+            cut = max(text.rfind(c) for c in _CUT_CHARACTERS) + 1
+            if cut <= 0 or len(text) - cut > window:
+                # No whitespace to cut at: fall back to a hard cut
+                cut = len(text)
+            pending = text[cut:]
+            if cut:
+                yield text[:cut]
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    def read_bytes(self) -> bytes:
+        """Returns the whole body as bytes."""
+        return bytes(self.buffer)
+
+    def read_text(self) -> str:
+        """Returns the whole body decoded as UTF-8."""
+        return "".join(self.text_windows())
+
+    def read_base64(self, window: int = DEFAULT_SCAN_WINDOW) -> str:
+        """Returns the whole body base64 encoded."""
+        window -= window % 3
+        return "".join(
+            base64.b64encode(chunk).decode("ascii") for chunk in self.chunks(window)
+        )
+
+    def close(self) -> None:
+        """Unmaps the body and deletes its file."""
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # A caller still holds a view of the map; it goes with the file
+                pass
+            self._map = None
+        self._file.close()
+
+
+def rewrite_text(
+    body: SpilledBody,
+    transform: Callable[[str], str],
+    window: int = DEFAULT_SCAN_WINDOW,
+) -> Tuple[SpilledBody, bool]:
+    """Applies a text transform to a spilled body one window at a time.
+
+    Returns:
+        (body, changed): A new spilled body holding the transformed text and
+        True, or the given body and False if the transform changed nothing.
+    """
+    changed = False
+
+    def transformed() -> Iterator[bytes]:
+        nonlocal changed
+        for text in body.text_windows(window):
+            result = transform(text)
+            if result != text:
+                changed = True
+            yield result.encode("utf-8")
+
+    rewritten = SpilledBody.from_chunks(transformed())
+    if not changed:
+        rewritten.close()
+        return body, False
+    return rewritten, True
+
+
+def is_text_mime_type(mime_type: Optional[str]) -> bool:
+    """Whether guardrails treat content of this MIME type as text."""
+    return bool(mime_type) and (
+        "text" in mime_type or "json" in mime_type or "xml" in mime_type
+    )
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a proxied server may take to start before it is given up on
+DEFAULT_STARTUP_TIMEOUT = 120.0
+
+# Startup phases reported per server, in the order they happen
+STARTUP_PHASES = ("queued", "spawn", "initialize", "capabilities")
+
+
+class StartupTracker:
+    """Measures how quickly the gateway's proxied servers become usable.
+
+    Records the time until the first proxied tool is registered, the time
+    until every server has either finished starting or failed, and how long
+    each server spent in every startup phase.
+    """
+
+    def __init__(self, server_count: int, concurrency: Optional[int] = None):
+        """Initializes the tracker.
+
+        Args:
+            server_count: Number of proxied servers being started.
+            concurrency: Maximum number of servers starting at once, or None
+                for no limit.
+        """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(
+                f"startup_concurrency must be at least 1, got {concurrency}"
+            )
+        self.started_at = time.monotonic()
+        self.server_count = server_count
+        self.concurrency = concurrency
+        # Servers hold a slot while they start; None means unlimited
+        self.limiter: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(concurrency) if concurrency is not None else None
+        )
+        self.ready = 0
+        self.failed = 0
+        self.servers: Dict[str, Dict[str, Any]] = {}
+        self.time_to_first_tool: Optional[float] = None
+        self.time_to_all_tools: Optional[float] = None
+        if server_count == 0:
+            self.time_to_all_tools = 0.0
+
+    def tools_registered(self, server_name: str, tool_count: int) -> None:
+        """Records that a server's tools were exposed to clients."""
+        if tool_count and self.time_to_first_tool is None:
+            self.time_to_first_tool = time.monotonic() - self.started_at
+            logger.info(
+                f"Startup: first tools available after {self.time_to_first_tool:.2f}s "
+                f"(server '{server_name}')."
+            )
+
+    def server_finished(
+        self,
+        server_name: str,
+        ok: bool,
+        profile: Optional[Dict[str, Optional[float]]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Records that a server finished starting (ok) or was given up on.
+
+        Args:
+            server_name: Name of the proxied server.
+            ok: Whether the server started.
+            profile: Seconds spent per phase, keyed "<phase>_seconds".
+            error: Why the server failed to start.
+        """
+        if ok:
+            self.ready += 1
+        else:
+            self.failed += 1
+        entry: Dict[str, Any] = {
+            "status": "ready" if ok else "failed",
+            "finished_after_seconds": _round(time.monotonic() - self.started_at),
+        }
+        for phase in STARTUP_PHASES:
+            entry[f"{phase}_seconds"] = _round((profile or {}).get(f"{phase}_seconds"))
+        if error is not None:
+            entry["error"] = error
+        self.servers[server_name] = entry
+
+        if self.ready + self.failed == self.server_count:
+            self.time_to_all_tools = time.monotonic() - self.started_at
+            logger.info(
+                f"Startup: all tools available after {self.time_to_all_tools:.2f}s "
+                f"({self.ready} servers ready, {self.failed} failed)."
+            )
+            self._log_report()
+
+    def _log_report(self) -> None:
+        """Writes one line per server with its startup phase timings."""
+        for name, entry in sorted(
+            self.servers.items(), key=lambda item: item[1]["finished_after_seconds"]
+        ):
+            phases = ", ".join(
+                f"{phase} {entry[f'{phase}_seconds']:.2f}s"
+                for phase in STARTUP_PHASES
+                if entry[f"{phase}_seconds"] is not None
+            )
+            logger.info(
+                f"Startup report: '{name}' {entry['status']} after "
+                f"{entry['finished_after_seconds']:.2f}s ({phases or 'no phases timed'})"
+                + (f": {entry['error']}" if "error" in entry else "")
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the startup metrics for metadata reporting."""
+        return {
+            "servers": self.server_count,
+            "ready": self.ready,
+            "failed": self.failed,
+            "time_to_first_tool": self.time_to_first_tool,
+            "time_to_all_tools": self.time_to_all_tools,
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """Returns the overall metrics and the per-server phase timings."""
+        return {
+            **self.stats(),
+            "concurrency": self.concurrency,
+            "per_server": dict(self.servers),
+        }
+
+
+def _round(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds, 3) if seconds is not None else None
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from pydantic import AnyUrl
+
+from mcp_gateway.resources import gateway_uri
+
+if TYPE_CHECKING:
+    from mcp_gateway.server import Server
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceSubscriptions:
+    """Shares upstream resource subscriptions between downstream clients.
+
+    The gateway holds at most one upstream ``resources/subscribe`` per server
+    and URI, however many clients subscribed to it. Every
+    ``resources/updated`` from upstream is sent to all subscribed clients,
+    and the upstream subscription is dropped once the last client has
+    unsubscribed or gone away.
+    """
+
+    def __init__(self) -> None:
+        # (server name, upstream uri) -> subscribed client sessions
+        self._subscribers: Dict[Tuple[str, str], "weakref.WeakSet[Any]"] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    def _lock(self, key: Tuple[str, str]) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    def subscriber_count(self, server_name: str, uri: str) -> int:
+        """Returns the number of clients subscribed to an upstream resource."""
+        return len(self._subscribers.get((server_name, uri), ()))
+
+    def stats(self, server_name: str) -> Dict[str, int]:
+        """Returns a server's number of upstream and of client subscriptions."""
+        subscribers = [
+            sessions
+            for (name, _), sessions in self._subscribers.items()
+            if name == server_name
+        ]
+        return {
+            "upstream_subscriptions": len(subscribers),
+            "client_subscriptions": sum(len(s) for s in subscribers),
+        }
+
+    async def subscribe(self, server: "Server", uri: str, session: Any) -> None:
+        """Subscribes a client session to an upstream resource.
+
+        Only the first subscriber causes an upstream subscribe.
+
+        Raises:
+            Exception: Whatever the upstream subscribe raised; the client is
+                not subscribed then.
+        """
+        key = (server.name, uri)
+        async with self._lock(key):
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                await server.subscribe_resource(uri)
+                subscribers = self._subscribers[key] = weakref.WeakSet()
+                logger.info(f"Subscribed to resource {uri} of '{server.name}'.")
+            subscribers.add(session)
+
+    async def unsubscribe(self, server: "Server", uri: str, session: Any) -> None:
+        """Unsubscribes a client session, dropping the upstream subscription
+        when it was the last subscriber."""
+        key = (server.name, uri)
+        async with self._lock(key):
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                return
+            subscribers.discard(session)
+            if not subscribers:
+                await self._release(server, key)
+
+    async def _release(self, server: "Server", key: Tuple[str, str]) -> None:
+        """Drops the upstream subscription of key. Must hold key's lock."""
+        self._subscribers.pop(key, None)
+        try:
+            await server.unsubscribe_resource(key[1])
+            logger.info(f"Unsubscribed from resource {key[1]} of '{server.name}'.")
+        except Exception as e:
+            logger.warning(
+                f"Failed to unsubscribe from resource {key[1]} of '{server.name}': {e}"
+            )
+
+    async def publish(self, server: "Server", uri: str) -> int:
+        """Sends a resources/updated for an upstream resource to its subscribers.
+
+        Sessions that can no longer be written to are unsubscribed.
+
+        Returns:
+            The number of clients notified.
+        """
+        key = (server.name, uri)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return 0
+        notified = 0
+        updated_uri = AnyUrl(gateway_uri(server.name, uri))
+        for session in list(subscribers):
+            try:
+                await session.send_resource_updated(updated_uri)
+                notified += 1
+            except Exception as e:
+                logger.debug(f"Dropping subscriber that failed to notify: {e!r}")
+                subscribers.discard(session)
+        if not subscribers:
+            # Every subscriber went away without unsubscribing
+            async with self._lock(key):
+                if self._subscribers.get(key) is subscribers and not subscribers:
+                    await self._release(server, key)
+        logger.debug(f"Sent update of {uri} from '{server.name}' to {notified} clients.")
+        return notified
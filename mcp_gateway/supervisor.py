@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from mcp_gateway.server import Server
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+DEFAULT_HEALTH_CHECK_TIMEOUT = 5.0
+DEFAULT_RESTART_BACKOFF_INITIAL = 0.5
+DEFAULT_RESTART_BACKOFF_MAX = 60.0
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the server's circuit is open."""
+
+    pass
+
+
+class CircuitBreaker:
+    """Tracks whether calls to a proxied server should be attempted at all.
+
+    The circuit is ``closed`` while the server is healthy, ``open`` while it is
+    down (calls fail fast) and ``half_open`` while a restart is being probed.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, server_name: str):
+        self.server_name = server_name
+        self.state = self.CLOSED
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def open(self, reason: str) -> None:
+        """Opens the circuit so calls fail fast."""
+        if self.state == self.CLOSED:
+            logger.warning(f"Circuit for '{self.server_name}' opened: {reason}")
+            self.opened_at = time.time()
+        self.state = self.OPEN
+        self.last_error = reason
+
+    def half_open(self) -> None:
+        """Marks the circuit as probing a restarted server."""
+        self.state = self.HALF_OPEN
+
+    def close(self) -> None:
+        """Closes the circuit after a successful probe."""
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for '{self.server_name}' closed.")
+        self.state = self.CLOSED
+        self.opened_at = None
+
+    def check(self) -> None:
+        """Raises CircuitOpenError unless the circuit is closed."""
+        if self.state != self.CLOSED:
+            raise CircuitOpenError(
+                f"Server '{self.server_name}' is unavailable (circuit {self.state}): "
+                f"{self.last_error}"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the circuit state for metadata reporting."""
+        return {
+            "state": self.state,
+            "opened_at": self.opened_at,
+            "last_error": self.last_error,
+        }
+
+
+def backoff_delay(attempt: int, initial: float, maximum: float) -> float:
+    """Exponential backoff with full jitter for the given (zero-based) attempt."""
+    return random.uniform(0, min(maximum, initial * (2**attempt)))
+
+
+class ServerSupervisor:
+    """Watches a proxied server's replicas and restarts the ones that die.
+
+    Broken replicas are detected through upstream EOF (reported immediately by
+    the replica) and through periodic MCP pings. A server with no healthy
+    replica left has its circuit opened and is restarted with jittered
+    exponential backoff; the circuit closes once a probe ping succeeds.
+    """
+
+    def __init__(self, server: "Server"):
+        """Initializes the supervisor from the server's config.
+
+        Config options:
+        - health_check_interval: Seconds between pings (default: 30)
+        - health_check_timeout: Seconds to wait for a ping (default: 5)
+        - restart_backoff_initial: First restart delay ceiling (default: 0.5)
+        - restart_backoff_max: Maximum restart delay (default: 60)
+        """
+        self.server = server
+        config = server.config
+        self.interval = float(
+            config.get("health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL)
+        )
+        self.timeout = float(
+            config.get("health_check_timeout", DEFAULT_HEALTH_CHECK_TIMEOUT)
+        )
+        self.backoff_initial = float(
+            config.get("restart_backoff_initial", DEFAULT_RESTART_BACKOFF_INITIAL)
+        )
+        self.backoff_max = float(
+            config.get("restart_backoff_max", DEFAULT_RESTART_BACKOFF_MAX)
+        )
+        self.restarts = 0
+        self.failed_restarts = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Starts the background monitor task."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._monitor(), name=f"supervisor-{self.server.name}"
+            )
+
+    async def stop(self) -> None:
+        """Stops the background monitor task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _monitor(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.server.replica_closed.wait(), timeout=self.interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self.server.replica_closed.clear()
+            try:
+                await self.check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Supervisor check for '{self.server.name}' failed: {e}",
+                    exc_info=True,
+                )
+
+    async def check(self) -> None:
+        """Runs one health check pass and restarts the server if needed."""
+        server = self.server
+        if server.is_starting:
+            # Replicas still booting in the background would fail their pings
+            return
+        replicas = server.replicas
+        if not replicas:
+            # Never started or hibernating on-demand server: nothing to supervise
+            return
+
+        results = await asyncio.gather(
+            *(replica.ping(self.timeout) for replica in replicas)
+        )
+        broken = [replica for replica, ok in zip(replicas, results) if not ok]
+        for replica in broken:
+            logger.warning(f"Removing broken upstream session '{replica.label}'.")
+            await server.remove_replica(replica)
+
+        if server.is_active:
+            if len(server.replicas) < server.pool_min:
+                self.restarts += await server.replenish()
+            return
+        if server.on_demand:
+            # The next call wakes the server again, no restart needed
+            logger.info(f"On-demand server '{server.name}' went down, left hibernating.")
+            return
+
+        server.circuit.open(f"all upstream sessions of '{server.name}' are down")
+        await self._restart()
+
+    async def _restart(self) -> None:
+        """Restarts the server with backoff until a probe succeeds."""
+        server = self.server
+        attempt = 0
+        while True:
+            delay = backoff_delay(attempt, self.backoff_initial, self.backoff_max)
+            logger.info(
+                f"Restarting server '{server.name}' in {delay:.2f}s (attempt {attempt + 1})."
+            )
+            await asyncio.sleep(delay)
+            server.circuit.half_open()
+            try:
+                await server.restart()
+                if not await server.replicas[0].ping(self.timeout):
+                    raise RuntimeError("probe ping failed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed_restarts += 1
+                server.circuit.open(f"restart failed: {e}")
+                attempt += 1
+                continue
+            self.restarts += 1
+            server.circuit.close()
+            logger.info(f"Server '{server.name}' restarted successfully.")
+            return
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns restart counters and circuit state for metadata reporting."""
+        return {
+            "restarts": self.restarts,
+            "failed_restarts": self.failed_restarts,
+            "circuit": self.server.circuit.stats(),
+        }
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import socket
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, List, Optional
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel import Server as LowLevelServer
+
+logger = logging.getLogger(__name__)
+
+# Downstream transports the gateway can serve
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+
+class SharedLifespan:
+    """Runs a server lifespan once for any number of concurrent downstream sessions.
+
+    The low-level MCP server enters its lifespan for every connection it serves,
+    which over SSE or streamable HTTP would start a separate set of upstream
+    servers per client. The wrapped lifespan is entered by the first user and
+    exited when the last one leaves; everyone in between gets the same context.
+    """
+
+    def __init__(self, lifespan: Callable[[Any], AsyncContextManager[Any]]):
+        self._lifespan = lifespan
+        self._lock = asyncio.Lock()
+        self._stack: Optional[AsyncExitStack] = None
+        self._context: Any = None
+        self.users = 0
+
+    @asynccontextmanager
+    async def __call__(self, app: Any) -> AsyncIterator[Any]:
+        async with self._lock:
+            if self.users == 0:
+                stack = AsyncExitStack()
+                self._context = await stack.enter_async_context(self._lifespan(app))
+                self._stack = stack
+            self.users += 1
+        try:
+            yield self._context
+        finally:
+            async with self._lock:
+                self.users -= 1
+                if self.users == 0 and self._stack is not None:
+                    stack, self._stack = self._stack, None
+                    self._context = None
+                    await stack.aclose()
+
+
+def share_lifespan(lowlevel_server: LowLevelServer) -> SharedLifespan:
+    """Makes every session of lowlevel_server share a single lifespan context."""
+    if isinstance(lowlevel_server.lifespan, SharedLifespan):
+        return lowlevel_server.lifespan
+    shared = SharedLifespan(lowlevel_server.lifespan)
+    lowlevel_server.lifespan = shared
+    return shared
+
+
+def http_app(gateway_mcp: FastMCP, transport: str) -> Any:
+    """Builds the Starlette app serving gateway_mcp over SSE or streamable HTTP.
+
+    The gateway's lifespan is held open for as long as the app runs, so upstream
+    servers are started once and shared by every connected client rather than
+    started and stopped with each connection.
+    """
+    if transport == "sse":
+        app = gateway_mcp.sse_app()
+    elif transport == "streamable-http":
+        app = gateway_mcp.streamable_http_app()
+    else:
+        raise ValueError(f"Unsupported HTTP transport: {transport}")
+
+    shared = share_lifespan(gateway_mcp._mcp_server)
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        async with shared(gateway_mcp._mcp_server):
+            async with app_lifespan(app):
+                yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+async def serve_http(
+    gateway_mcp: FastMCP,
+    transport: str,
+    sockets: Optional[List[socket.socket]] = None,
+) -> None:
+    """Serves gateway_mcp over HTTP on its configured host and port.
+
+    Args:
+        gateway_mcp: The gateway server.
+        transport: "sse" or "streamable-http".
+        sockets: Already bound listening sockets to serve on instead of binding
+            the configured host and port.
+    """
+    import uvicorn
+
+    config = uvicorn.Config(
+        http_app(gateway_mcp, transport),
+        host=gateway_mcp.settings.host,
+        port=gateway_mcp.settings.port,
+        log_level=gateway_mcp.settings.log_level.lower(),
+    )
+    logger.info(
+        f"Serving MCP gateway over {transport} on "
+        f"{gateway_mcp.settings.host}:{gateway_mcp.settings.port}"
+    )
+    await uvicorn.Server(config).serve(sockets=sockets)
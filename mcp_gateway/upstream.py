@@ -0,0 +1,316 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import anyio
+import httpx
+from mcp import ClientSession, StdioServerParameters, types
+from mcp.client.stdio import stdio_client
+
+from mcp_gateway.remote import is_remote, remote_connect
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code used to fail requests pending on a connection that closed
+CONNECTION_CLOSED = -32000
+# Error code mcp's streamable HTTP client reports when the server no longer
+# knows the session (HTTP 404), e.g. after the server restarted
+SESSION_TERMINATED = 32600
+# Seconds to wait for a cancellation notification to be written upstream
+CANCEL_NOTIFY_TIMEOUT = 1.0
+
+
+def next_request_id(session: ClientSession) -> int:
+    """Returns the JSON-RPC id the session will assign to its next request.
+
+    Must be read right before sending the request, with no await in between.
+    """
+    return session._request_id
+
+
+async def cancel_request(
+    session: ClientSession, request_id: types.RequestId, reason: str
+) -> None:
+    """Tells the upstream server to stop working on a request the gateway abandoned.
+
+    ClientSession stops waiting for the response when the calling task is
+    cancelled but does not notify the server, which would keep running it.
+    """
+    notification = types.ClientNotification(
+        types.CancelledNotification(
+            method="notifications/cancelled",
+            params=types.CancelledNotificationParams(
+                requestId=request_id, reason=reason
+            ),
+        )
+    )
+    try:
+        await asyncio.wait_for(
+            session.send_notification(notification), CANCEL_NOTIFY_TIMEOUT
+        )
+    except Exception as e:
+        logger.debug(f"Failed to send cancellation for request {request_id}: {e!r}")
+
+
+class UpstreamSession:
+    """A single connection to a proxied MCP server: one stdio child process, or
+    one streamable HTTP/SSE session with a remote server configured by url.
+
+    The transport and ClientSession contexts are entered and exited inside a
+    dedicated task owned by this object, so the connection can be stopped from
+    any task without tripping anyio's cancel-scope ownership checks.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        config: Dict[str, Any],
+        index: int = 0,
+        on_close: Optional[Callable[["UpstreamSession"], None]] = None,
+        on_notification: Optional[
+            Callable[["UpstreamSession", types.ServerNotification], None]
+        ] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initializes the upstream session.
+
+        Args:
+            server_name: Name of the proxied server this session belongs to.
+            config: The server configuration dictionary (command, args, env).
+            index: Position of this replica within the server's pool.
+            on_close: Called when an established connection ends without stop()
+                being requested (upstream EOF or transport error).
+            on_notification: Called with every notification the upstream server
+                sends. Runs inside the session's receive loop, so it must not
+                wait on requests to the same session.
+            http_client: Pooled HTTP client for remote servers, shared with the
+                server's other replicas.
+        """
+        self.server_name = server_name
+        self.config = config
+        self.index = index
+        self.on_close = on_close
+        self.on_notification = on_notification
+        self.http_client = http_client
+        self.in_flight = 0
+        self.total_calls = 0
+        # Seconds spent spawning the process and in the initialize handshake
+        self.spawn_time: Optional[float] = None
+        self.initialize_time: Optional[float] = None
+        self._session: Optional[ClientSession] = None
+        # Set as soon as the session exists, before initialize() completes
+        self._client: Optional[ClientSession] = None
+        self._server_info: Optional[types.InitializeResult] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+        self._eof = False
+
+    @property
+    def label(self) -> str:
+        """Human readable identifier used in logs."""
+        return f"{self.server_name}#{self.index}"
+
+    @property
+    def session(self) -> ClientSession:
+        """Returns the active ClientSession, raising an error if not started."""
+        if self._session is None:
+            raise RuntimeError(f"Upstream session '{self.label}' not started.")
+        return self._session
+
+    @property
+    def server_info(self) -> Optional[types.InitializeResult]:
+        """The InitializeResult reported by the upstream server."""
+        return self._server_info
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the session is initialized and its task is still running."""
+        return (
+            self._session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    def _server_params(self) -> StdioServerParameters:
+        return StdioServerParameters(
+            command=self.config.get("command", ""),
+            args=self.config.get("args", []),
+            env=self.config.get("env", None),
+        )
+
+    def _open_transport(self) -> Any:
+        """Returns the context manager yielding the connection's read/write streams."""
+        if is_remote(self.config):
+            return remote_connect(self.config, self.http_client)
+        return stdio_client(self._server_params())
+
+    async def start(self) -> types.InitializeResult:
+        """Connects to the upstream server, spawning its process unless it is
+        remote, and performs the MCP initialize handshake."""
+        if self._task is not None and not self._task.done():
+            logger.warning(f"Upstream session '{self.label}' already started.")
+            return self._server_info
+
+        self._stop_event = asyncio.Event()
+        started: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(
+            self._run(started), name=f"upstream-{self.label}"
+        )
+        try:
+            return await started
+        except BaseException:
+            await self.stop()
+            raise
+
+    async def _run(self, started: asyncio.Future) -> None:
+        """Owns the transport and session contexts for the lifetime of the connection."""
+        try:
+            async with AsyncExitStack() as stack:
+                spawn_started = time.monotonic()
+                read, write = await stack.enter_async_context(self._open_transport())
+                self.spawn_time = time.monotonic() - spawn_started
+                # Relay upstream messages through our own stream so EOF is observable
+                relay_send, relay_receive = anyio.create_memory_object_stream(0)
+                task_group = await stack.enter_async_context(
+                    anyio.create_task_group()
+                )
+                stack.callback(task_group.cancel_scope.cancel)
+                task_group.start_soon(self._relay, read, relay_send)
+
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        relay_receive, write, message_handler=self._handle_message
+                    )
+                )
+                self._client = session
+                initialize_started = time.monotonic()
+                server_info = await session.initialize()
+                self.initialize_time = time.monotonic() - initialize_started
+                self._session = session
+                self._server_info = server_info
+                logger.info(f"Upstream session '{self.label}' initialized.")
+                if not started.done():
+                    started.set_result(server_info)
+                await self._stop_event.wait()
+        except asyncio.CancelledError:
+            if not started.done():
+                started.cancel()
+            raise
+        except Exception as e:
+            if not started.done():
+                started.set_exception(e)
+            else:
+                self._eof = True
+                logger.error(
+                    f"Upstream session '{self.label}' terminated with error: {e}",
+                    exc_info=True,
+                )
+                if self._client is not None:
+                    await self._fail_pending_requests(self._client)
+        finally:
+            self._session = None
+            self._client = None
+            if self._eof and started.done() and self.on_close is not None:
+                self.on_close(self)
+
+    async def _handle_message(self, message: Any) -> None:
+        """Passes upstream notifications to the on_notification callback."""
+        if isinstance(message, types.ServerNotification) and self.on_notification:
+            try:
+                self.on_notification(self, message)
+            except Exception as e:
+                logger.error(
+                    f"Error handling notification from '{self.label}': {e}",
+                    exc_info=True,
+                )
+
+    async def _relay(self, source: Any, sink: Any) -> None:
+        """Forwards upstream messages to the session and flags EOF when they stop."""
+        async with sink:
+            async for message in source:
+                await sink.send(message)
+        if not self._stop_event.is_set():
+            logger.warning(f"Upstream session '{self.label}' reached EOF, closing.")
+            self._eof = True
+            if self._client is not None:
+                await self._fail_pending_requests(self._client)
+            self._stop_event.set()
+
+    async def _fail_pending_requests(self, session: ClientSession) -> None:
+        """Answers every request still waiting on a closed connection with an error.
+
+        ClientSession does not do this itself, so without it callers would wait
+        forever for responses that can no longer arrive.
+        """
+        error = types.ErrorData(
+            code=CONNECTION_CLOSED,
+            message=f"Connection to upstream '{self.label}' closed",
+        )
+        for request_id, stream in list(session._response_streams.items()):
+            try:
+                await stream.send(
+                    types.JSONRPCError(jsonrpc="2.0", id=request_id, error=error)
+                )
+            except Exception:
+                pass
+
+    async def ping(self, timeout: float) -> bool:
+        """Sends an MCP ping, returning False if it fails or exceeds the timeout."""
+        if not self.is_active:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Ping to upstream session '{self.label}' failed: {e!r}")
+            return False
+
+    async def stop(self) -> None:
+        """Closes the client session and terminates the upstream process."""
+        task = self._task
+        if task is None:
+            return
+        self._stop_event.set()
+        if self._session is None:
+            # Still spawning or initializing: the stop event is not awaited yet
+            task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Error while stopping upstream session '{self.label}': {e}")
+        finally:
+            self._task = None
+            self._session = None
+            self._server_info = None
+
+    async def reconnect(self) -> types.InitializeResult:
+        """Replaces the connection with a fresh one, e.g. after the upstream
+        server dropped the session."""
+        logger.info(f"Reconnecting upstream session '{self.label}'...")
+        await self.stop()
+        return await self.start()
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[ClientSession]:
+        """Counts a call as in flight on this session for the duration of the block."""
+        session = self.session
+        self.in_flight += 1
+        self.total_calls += 1
+        try:
+            yield session
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns load counters for this session."""
+        return {
+            "index": self.index,
+            "active": self.is_active,
+            "eof": self._eof,
+            "in_flight": self.in_flight,
+            "total_calls": self.total_calls,
+        }
@@ -0,0 +1,168 @@
+import logging
+import multiprocessing
+import signal
+import socket
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+from mcp_gateway.supervisor import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for exited workers
+WORKER_CHECK_INTERVAL = 0.5
+# Backoff before restarting a worker that exited, in seconds
+DEFAULT_WORKER_BACKOFF_INITIAL = 0.5
+DEFAULT_WORKER_BACKOFF_MAX = 30.0
+# A worker that ran this long before exiting resets its backoff
+WORKER_STABLE_AFTER = 30.0
+# Seconds workers get to shut down before they are killed
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Binds the listening socket that all workers accept connections on."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+class _Worker:
+    def __init__(self, index: int):
+        self.index = index
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.started_at = 0.0
+        self.failures = 0
+        self.restart_at: Optional[float] = None
+
+
+class WorkerSupervisor:
+    """Runs gateway worker processes and restarts the ones that exit.
+
+    Workers are started with the spawn method, so each one imports the gateway
+    afresh and owns its own upstream servers, and all of them serve the same
+    listening sockets. A worker that exits is restarted with jittered
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., None],
+        worker_count: int,
+        sockets: List[socket.socket],
+        args: Sequence[Any] = (),
+        backoff_initial: float = DEFAULT_WORKER_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_WORKER_BACKOFF_MAX,
+    ):
+        """Initializes the supervisor.
+
+        Args:
+            target: Importable function run in each worker as
+                ``target(worker_index, sockets, *args)``.
+            worker_count: Number of worker processes to keep running.
+            sockets: Bound listening sockets shared by the workers.
+            args: Extra arguments passed to target.
+            backoff_initial: Base delay before restarting an exited worker.
+            backoff_max: Upper bound of the restart delay.
+        """
+        if worker_count < 1:
+            raise ValueError(f"workers must be at least 1, got {worker_count}")
+        self.target = target
+        self.sockets = sockets
+        self.args = tuple(args)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.restarts = 0
+        self._workers = [_Worker(index) for index in range(worker_count)]
+        self._context = multiprocessing.get_context("spawn")
+        self._should_exit = False
+
+    @property
+    def pids(self) -> List[Optional[int]]:
+        """Process ids of the workers, None for a worker waiting to restart."""
+        return [
+            worker.process.pid if worker.process is not None else None
+            for worker in self._workers
+        ]
+
+    def _spawn(self, worker: _Worker) -> None:
+        process = self._context.Process(
+            target=self.target,
+            args=(worker.index, self.sockets, *self.args),
+            name=f"mcp-gateway-worker-{worker.index}",
+        )
+        process.start()
+        worker.process = process
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+        logger.info(f"Started gateway worker {worker.index} (pid {process.pid}).")
+
+    def start(self) -> None:
+        """Starts every worker process."""
+        for worker in self._workers:
+            self._spawn(worker)
+
+    def check(self) -> int:
+        """Schedules restarts for exited workers and starts the ones that are due.
+
+        Returns:
+            The number of workers restarted.
+        """
+        now = time.monotonic()
+        restarted = 0
+        for worker in self._workers:
+            process = worker.process
+            if process is not None and not process.is_alive():
+                if now - worker.started_at >= WORKER_STABLE_AFTER:
+                    worker.failures = 0
+                delay = backoff_delay(
+                    worker.failures, self.backoff_initial, self.backoff_max
+                )
+                worker.failures += 1
+                worker.process = None
+                worker.restart_at = now + delay
+                logger.warning(
+                    f"Gateway worker {worker.index} (pid {process.pid}) exited with "
+                    f"code {process.exitcode}, restarting in {delay:.2f}s."
+                )
+            if worker.process is None and worker.restart_at is not None:
+                if now >= worker.restart_at:
+                    self._spawn(worker)
+                    self.restarts += 1
+                    restarted += 1
+        return restarted
+
+    def stop(self) -> None:
+        """Asks every worker to shut down, killing the ones that do not."""
+        processes = [w.process for w in self._workers if w.process is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Killing gateway worker pid {process.pid}.")
+                process.kill()
+                process.join()
+        for worker in self._workers:
+            worker.process = None
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        self._should_exit = True
+
+    def run(self) -> None:
+        """Starts the workers and supervises them until SIGINT or SIGTERM."""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self._handle_signal)
+        self.start()
+        try:
+            while not self._should_exit:
+                time.sleep(WORKER_CHECK_INTERVAL)
+                self.check()
+        finally:
+            logger.info("Stopping gateway workers...")
+            self.stop()
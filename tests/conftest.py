@@ -0,0 +1,11 @@
+import os
+import sys
+from typing import Any, Dict
+
+# Stand-in upstream MCP server launched over stdio by the server tests
+UPSTREAM_SCRIPT = os.path.join(os.path.dirname(__file__), "upstream_server.py")
+
+
+def upstream_config(**extra: Any) -> Dict[str, Any]:
+    """Builds a server config that launches the stand-in upstream server."""
+    return {"command": sys.executable, "args": [UPSTREAM_SCRIPT], **extra}
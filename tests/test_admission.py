@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from mcp_gateway.admission import AdmissionController, OverloadedError
+
+
+async def hold_slot(controller: AdmissionController, release: asyncio.Event) -> None:
+    """Occupies an admission slot until the release event is set."""
+    async with controller.admit():
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_queue_are_rejected() -> None:
+    """With one slot and a queue of one, a third concurrent call is rejected."""
+    controller = AdmissionController("srv", max_concurrency=1, max_queue=1)
+    release = asyncio.Event()
+
+    running = asyncio.create_task(hold_slot(controller, release))
+    queued = asyncio.create_task(hold_slot(controller, release))
+    await asyncio.sleep(0.01)
+    assert controller.active == 1
+    assert controller.queued == 1
+
+    with pytest.raises(OverloadedError, match="overloaded"):
+        async with controller.admit():
+            pass
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+    stats = controller.stats()
+    assert stats["rejected"] == 1
+    assert stats["active"] == 0 and stats["queued"] == 0
+    assert stats["queue_wait"]["count"] == 2
+    assert stats["execution"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_recorded_separately() -> None:
+    """Time spent waiting for a slot is not counted as execution time."""
+    controller = AdmissionController("srv", max_concurrency=1)
+
+    async def work(seconds: float) -> None:
+        async with controller.admit():
+            await asyncio.sleep(seconds)
+
+    await asyncio.gather(work(0.2), work(0.0))
+
+    stats = controller.stats()
+    assert stats["queue_wait"]["max_ms"] >= 150
+    assert stats["execution"]["max_ms"] >= 150
+    assert stats["execution"]["max_ms"] < 400
+
+
+def test_unlimited_by_default() -> None:
+    """Without max_concurrency nothing is ever queued or rejected."""
+    controller = AdmissionController("srv")
+    assert controller.stats()["max_concurrency"] is None
+    with pytest.raises(ValueError):
+        AdmissionController("srv", max_concurrency=0)
@@ -0,0 +1,96 @@
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import (
+    GetewayContext,
+    Server,
+    batch_call_tools,
+    resolve_gateway_tool,
+)
+from tests.conftest import upstream_config
+
+
+def tool_context(context: GetewayContext) -> Any:
+    """Stands in for the FastMCP Context the gateway tools receive."""
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context=context))
+
+
+def test_resolve_gateway_tool_handles_underscored_server_names() -> None:
+    plain = Server("up", upstream_config())
+    underscored = Server("up_x", upstream_config())
+    plain._tools = [SimpleNamespace(name="x_echo")]
+    underscored._tools = [SimpleNamespace(name="echo")]
+    servers = {"up": plain, "up_x": underscored}
+
+    assert resolve_gateway_tool(servers, "up_x_echo") == (plain, "x_echo")
+    del plain._tools[0]
+    assert resolve_gateway_tool(servers, "up_x_echo") == (underscored, "echo")
+    with pytest.raises(ValueError):
+        resolve_gateway_tool(servers, "up_missing")
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently_in_order() -> None:
+    server = Server("up", upstream_config(pool_size={"min": 1, "max": 1}))
+    context = GetewayContext(
+        proxied_servers={"up": server}, plugin_manager=PluginManager()
+    )
+    await server.start()
+    try:
+        started = time.monotonic()
+        report = await batch_call_tools(
+            [
+                {"tool": "up_sleep", "arguments": {"seconds": 0.5}},
+                {"tool": "up_echo", "arguments": {"text": "first"}},
+                {"tool": "up_nope", "arguments": {}},
+                {"tool": "up_sleep", "arguments": {"seconds": 0.5}},
+                {"tool": "up_echo", "arguments": {"text": "last"}},
+            ],
+            tool_context(context),
+        )
+        assert time.monotonic() - started < 1.0
+
+        results = report["results"]
+        assert [r["tool"] for r in results] == [
+            "up_sleep",
+            "up_echo",
+            "up_nope",
+            "up_sleep",
+            "up_echo",
+        ]
+        assert results[1]["result"]["content"][0]["text"] == "first"
+        assert results[4]["result"]["content"][0]["text"] == "last"
+        assert results[2]["isError"]
+        assert "Unknown tool" in results[2]["result"]["content"][0]["text"]
+        assert report["errors"] == 1
+        assert results[0]["duration_seconds"] >= 0.5
+        assert results[1]["duration_seconds"] < 0.5
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_server_admission_limits() -> None:
+    """Calls beyond a server's max_concurrency and max_queue fail individually."""
+    server = Server("up", upstream_config(max_concurrency=1, max_queue=1))
+    context = GetewayContext(
+        proxied_servers={"up": server},
+        plugin_manager=PluginManager(),
+        batch_max_calls=3,
+    )
+    await server.start()
+    try:
+        report = await batch_call_tools(
+            [{"tool": "up_sleep", "arguments": {"seconds": 0.2}}] * 3,
+            tool_context(context),
+        )
+        assert [r["isError"] for r in report["results"]].count(True) == 1
+
+        with pytest.raises(ValueError):
+            await batch_call_tools([{"tool": "up_pid"}] * 4, tool_context(context))
+    finally:
+        await server.stop()
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from mcp_gateway.coalesce import SingleFlight
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server, ToolTimeoutError
+from tests.conftest import upstream_config
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run() -> None:
+    """Callers with the same key share one call and its result."""
+    flights = SingleFlight()
+    runs = 0
+
+    async def call() -> str:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.1)
+        return "result"
+
+    results = await asyncio.gather(*(flights.do("key", call) for _ in range(5)))
+    assert results == ["result"] * 5
+    assert runs == 1
+    assert flights.stats() == {"started": 1, "coalesced": 4, "in_flight": 0}
+
+    # Once finished, the next call runs again
+    await flights.do("key", call)
+    assert runs == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared() -> None:
+    """Every waiter receives the shared call's exception."""
+    flights = SingleFlight()
+
+    async def call() -> None:
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(flights.do("key", call) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancellation_is_per_waiter() -> None:
+    """A cancelled waiter leaves the shared call running for the others; it is
+    only cancelled when the last waiter goes away."""
+    flights = SingleFlight()
+    release = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def call() -> str:
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    first = asyncio.create_task(flights.do("key", call))
+    second = asyncio.create_task(flights.do("key", call))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert not cancelled.is_set()
+    release.set()
+    assert await second == "done"
+
+    release.clear()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(flights.do("other", call), 0.05)
+    await asyncio.sleep(0.01)
+    assert cancelled.is_set()
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_server_coalesces_identical_tool_calls() -> None:
+    """Identical concurrent calls reach the upstream server once."""
+    server = Server("coalesced", upstream_config(coalesce_calls=True))
+    await server.start()
+    try:
+        manager = PluginManager()
+        results = await asyncio.gather(
+            *(server.call_tool(manager, "sleep", {"seconds": 0.3}) for _ in range(4)),
+            server.call_tool(manager, "sleep", {"seconds": 0.2}),
+        )
+        assert len({r.content[0].text for r in results}) == 1
+        assert server.replicas[0].total_calls == 2
+        assert server._flights.stats()["coalesced"] == 3
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_time_out_on_their_own() -> None:
+    """A caller timing out leaves the shared upstream request to a caller that
+    joined later and still has time left."""
+    server = Server(
+        "coalesced",
+        upstream_config(coalesce_calls=True, tool_timeouts={"sleep": 0.6}),
+    )
+    await server.start()
+    try:
+        manager = PluginManager()
+        first = asyncio.create_task(
+            server.call_tool(manager, "sleep", {"seconds": 0.8})
+        )
+        await asyncio.sleep(0.3)
+        second = asyncio.create_task(
+            server.call_tool(manager, "sleep", {"seconds": 0.8})
+        )
+        with pytest.raises(ToolTimeoutError):
+            await first
+        assert (await second).content[0].text
+        assert server.replicas[0].total_calls == 1
+        assert server.timed_out_calls == 1
+    finally:
+        await server.stop()
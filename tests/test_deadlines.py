@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server, ToolTimeoutError
+from tests.conftest import upstream_config
+
+
+class BudgetRecordingGuardrail(GuardrailPlugin):
+    """Records the remaining budget it sees and optionally spends some of it."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.seen_budgets: List[Optional[float]] = []
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        self.seen_budgets.append(context.remaining_time())
+        await asyncio.sleep(self.delay)
+        return context.arguments
+
+    async def process_response(self, context: PluginContext) -> Any:
+        self.seen_budgets.append(context.remaining_time())
+        return context.response
+
+
+def manager_with(plugin: GuardrailPlugin) -> PluginManager:
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [plugin]
+    return manager
+
+
+def test_tool_timeout_resolution() -> None:
+    """Per-tool timeouts override the server-wide timeout."""
+    server = Server("srv", upstream_config(timeout=5, tool_timeouts={"sleep": 1.5}))
+    assert server.tool_timeout("sleep") == 1.5
+    assert server.tool_timeout("echo") == 5.0
+    assert Server("srv", upstream_config()).tool_timeout("echo") is None
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_upstream_call(tmp_path) -> None:
+    """An expired deadline fails the call and sends a cancellation upstream."""
+    server = Server("slow", upstream_config(tool_timeouts={"sleep_marking_cancel": 0.5}))
+    marker = tmp_path / "cancelled"
+    await server.start()
+    try:
+        started = time.monotonic()
+        with pytest.raises(ToolTimeoutError) as exc_info:
+            await server.call_tool(
+                PluginManager(),
+                "sleep_marking_cancel",
+                {"seconds": 10, "marker": str(marker)},
+            )
+        assert time.monotonic() - started < 2
+        assert exc_info.value.to_dict()["error"] == "timeout"
+        assert server.timed_out_calls == 1
+
+        for _ in range(50):
+            if marker.exists():
+                break
+            await asyncio.sleep(0.05)
+        assert marker.read_text() == "cancelled"
+        assert server._in_flight() == 0
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_deadline_covers_guardrails_and_exposes_budget() -> None:
+    """Plugins see the shrinking budget and their own time counts against it."""
+    plugin = BudgetRecordingGuardrail()
+    server = Server("budget", upstream_config(timeout=5))
+    await server.start()
+    try:
+        await server.call_tool(manager_with(plugin), "echo", {"text": "hi"})
+        request_budget, response_budget = plugin.seen_budgets
+        assert 0 < response_budget <= request_budget <= 5
+
+        slow_plugin = BudgetRecordingGuardrail(delay=1.0)
+        server.tool_timeouts["echo"] = 0.3
+        with pytest.raises(ToolTimeoutError):
+            await server.call_tool(manager_with(slow_plugin), "echo", {"text": "hi"})
+    finally:
+        await server.stop()
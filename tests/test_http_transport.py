@@ -0,0 +1,105 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import pytest
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.server.fastmcp import FastMCP
+from mcp_gateway import server as gateway_server
+from mcp_gateway.transport import SharedLifespan, serve_http, share_lifespan
+from tests.conftest import UPSTREAM_SCRIPT
+
+
+@pytest.mark.asyncio
+async def test_shared_lifespan_enters_once_for_concurrent_users() -> None:
+    """Overlapping users share one context; it is torn down after the last leaves."""
+    events: List[str] = []
+
+    @asynccontextmanager
+    async def lifespan(app: object) -> AsyncIterator[dict]:
+        events.append("enter")
+        yield {"shared": True}
+        events.append("exit")
+
+    shared = SharedLifespan(lifespan)
+    async with shared(None) as first:
+        async with shared(None) as second:
+            assert first is second
+            assert shared.users == 2
+        assert events == ["enter"]
+    assert events == ["enter", "exit"]
+
+    async with shared(None):
+        pass
+    assert events == ["enter", "exit", "enter", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_http_clients_share_upstream_servers(tmp_path, monkeypatch) -> None:
+    """Two streamable HTTP clients reach the same upstream process through one
+    gateway lifespan."""
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "mcp-gateway": {
+                        "snapshot_dir": str(tmp_path / "snapshots"),
+                        "servers": {
+                            "up": {"command": sys.executable, "args": [UPSTREAM_SCRIPT]}
+                        },
+                    }
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(
+        gateway_server,
+        "cli_args",
+        gateway_server.parse_args(["--mcp-json-path", str(config_path)]),
+    )
+    gateway = FastMCP("test gateway", lifespan=gateway_server.lifespan)
+    shared = share_lifespan(gateway._mcp_server)
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    url = f"http://127.0.0.1:{listener.getsockname()[1]}/mcp"
+    serving = asyncio.create_task(
+        serve_http(gateway, "streamable-http", sockets=[listener])
+    )
+
+    async def upstream_pid() -> str:
+        async with streamablehttp_client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                for _ in range(100):
+                    tools = await session.list_tools()
+                    if "up_pid" in {tool.name for tool in tools.tools}:
+                        break
+                    await asyncio.sleep(0.1)
+                result = await session.call_tool("up_pid", {})
+                # Proxied tools return the upstream CallToolResult as JSON text
+                return json.loads(result.content[0].text)["content"][0]["text"]
+
+    try:
+        for _ in range(100):
+            if shared.users:
+                break
+            await asyncio.sleep(0.05)
+        pids = await asyncio.wait_for(
+            asyncio.gather(upstream_pid(), upstream_pid()), timeout=30
+        )
+        assert pids[0] == pids[1]
+        assert int(pids[0]) != os.getpid()
+        # Only the app itself holds the lifespan once the clients are gone
+        assert shared.users == 1
+    finally:
+        serving.cancel()
+        await asyncio.gather(serving, return_exceptions=True)
+        listener.close()
@@ -0,0 +1,103 @@
+import asyncio
+import functools
+from typing import List
+
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp_gateway.downstream import DownstreamSessions
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import (
+    GetewayContext,
+    Server,
+    handle_list_changed,
+    register_proxied_capabilities,
+)
+from mcp_gateway.snapshot import CapabilitySnapshotStore
+from tests.conftest import upstream_config
+
+
+class RecordingSession:
+    """Stands in for a downstream ServerSession and records notifications."""
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def send_tool_list_changed(self) -> None:
+        self.sent.append("tools")
+
+    async def send_prompt_list_changed(self) -> None:
+        self.sent.append("prompts")
+
+    async def send_resource_list_changed(self) -> None:
+        self.sent.append("resources")
+
+
+class ClosedSession(RecordingSession):
+    async def send_tool_list_changed(self) -> None:
+        raise ConnectionError("closed")
+
+
+@pytest.mark.asyncio
+async def test_notify_list_changed_drops_dead_sessions() -> None:
+    """Live sessions get every requested kind; failing sessions are forgotten."""
+    downstream = DownstreamSessions()
+    live, closed = RecordingSession(), ClosedSession()
+    downstream.add(live)
+    downstream.add(closed)
+
+    await downstream.notify_list_changed({"prompts", "tools"})
+    assert live.sent == ["tools", "prompts"]
+    assert len(downstream) == 1
+
+
+def test_install_advertises_list_changed() -> None:
+    """The gateway's initialization options announce listChanged support."""
+    gateway = FastMCP("test gateway")
+    DownstreamSessions().install(gateway._mcp_server)
+    capabilities = gateway._mcp_server.create_initialization_options().capabilities
+    assert capabilities.tools.listChanged
+    assert capabilities.prompts.listChanged
+
+
+@pytest.mark.asyncio
+async def test_upstream_tool_list_change_updates_only_that_server(tmp_path) -> None:
+    """A tools/list_changed from one upstream registers its new tool and notifies
+    clients, without re-registering the other server's handlers."""
+    gateway = FastMCP("test gateway")
+    downstream = DownstreamSessions()
+    client = RecordingSession()
+    downstream.add(client)
+    context = GetewayContext(
+        plugin_manager=PluginManager(),
+        snapshot_store=CapabilitySnapshotStore(str(tmp_path)),
+        downstream=downstream,
+    )
+    changed = Server("changing", upstream_config())
+    other = Server("other", upstream_config())
+    for server in (changed, other):
+        server.on_list_changed = functools.partial(handle_list_changed, gateway, context)
+        context.proxied_servers[server.name] = server
+    await asyncio.gather(changed.start(), other.start())
+    try:
+        await register_proxied_capabilities(gateway, context)
+        other_handler = gateway._tool_manager.get_tool("other_echo")
+
+        result = await changed.call_tool(PluginManager(), "add_tool", {"name": "extra"})
+        assert result.content[0].text == "extra"
+        for _ in range(50):
+            if client.sent:
+                break
+            await asyncio.sleep(0.05)
+
+        assert client.sent == ["tools"]
+        assert "extra" in {tool.name for tool in await changed.list_tools()}
+        tool_names = {tool.name for tool in await gateway.list_tools()}
+        assert "changing_extra" in tool_names
+        assert "other_extra" not in tool_names
+        assert gateway._tool_manager.get_tool("other_echo") is other_handler
+
+        saved = context.snapshot_store.load("changing", changed.config)
+        assert "extra" in {tool.name for tool in saved.tools}
+    finally:
+        await asyncio.gather(changed.stop(), other.stop())
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server
+from mcp_gateway.snapshot import CapabilitySnapshotStore
+from tests.conftest import upstream_config
+
+
+@pytest.mark.asyncio
+async def test_on_demand_server_wakes_and_hibernates(tmp_path) -> None:
+    """An on-demand server fetches once, then spawns per use and stops when idle."""
+    store = CapabilitySnapshotStore(str(tmp_path))
+    config = upstream_config(on_demand=True, idle_timeout=0.5)
+    server = Server("lazy", config)
+    plugin_manager = PluginManager()
+
+    # No snapshot yet: the server is started once and hibernated again
+    await server.prepare_on_demand(store)
+    assert not server.is_active
+    assert (tmp_path / "lazy.json").is_file()
+    assert {tool.name for tool in await server.list_tools()} >= {"echo", "sleep"}
+
+    # With a snapshot, a fresh instance knows its tools without spawning
+    server = Server("lazy", config)
+    await server.prepare_on_demand(store)
+    assert not server.is_active
+    assert {tool.name for tool in await server.list_tools()} >= {"echo", "sleep"}
+
+    try:
+        result = await server.call_tool(plugin_manager, "echo", {"text": "hi"})
+        assert result.content[0].text == "hi"
+        assert server.is_active
+
+        await asyncio.sleep(2.0)
+        assert not server.is_active
+        assert server._tools, "Capabilities must survive hibernation"
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_watch_retries_when_a_call_beats_hibernation(tmp_path) -> None:
+    """A call starting between the idle check and hibernate() does not leave
+    the server running for good."""
+    server = Server("lazy", upstream_config(on_demand=True, idle_timeout=0.3))
+    await server.prepare_on_demand(CapabilitySnapshotStore(str(tmp_path)))
+    try:
+        await server.call_tool(PluginManager(), "echo", {"text": "hi"})
+        assert server.is_active
+
+        # Idle at the watcher's check, busy once hibernate() holds the lock
+        in_flight = iter([0, 1])
+        server._in_flight = lambda: next(in_flight, 0)
+        await asyncio.sleep(2.0)
+        assert not server.is_active
+    finally:
+        await server.stop()
+
+
+def test_snapshot_is_invalidated_by_config_change(tmp_path) -> None:
+    """A snapshot only applies to the command line it was taken from."""
+    store = CapabilitySnapshotStore(str(tmp_path))
+    config = upstream_config()
+    server = Server("snap", config)
+    store.save("snap", config, server.capability_snapshot())
+
+    assert store.load("snap", {**config, "pool_size": 3}) is not None
+    assert store.load("snap", {**config, "args": ["other.py"]}) is None
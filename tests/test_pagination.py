@@ -0,0 +1,92 @@
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp_gateway.pagination import install_pagination, paginate
+from mcp_gateway.server import GetewayContext, Server
+from tests.conftest import UPSTREAM_SCRIPT
+
+
+def tool(name: str) -> types.Tool:
+    return types.Tool(name=name, inputSchema={"type": "object"})
+
+
+def test_cursor_survives_catalog_changes() -> None:
+    """Items added or removed before the cursor do not shift the next page."""
+    items = [tool(name) for name in "acegi"]
+    key = lambda item: item.name  # noqa: E731
+    page, cursor = paginate(items, key, None, 2)
+    assert [item.name for item in page] == ["a", "c"]
+
+    changed = [tool("b")] + [item for item in items if item.name != "a"]
+    page, cursor = paginate(changed, key, cursor, 2)
+    assert [item.name for item in page] == ["e", "g"]
+    page, cursor = paginate(changed, key, cursor, 2)
+    assert [item.name for item in page] == ["i"] and cursor is None
+
+    with pytest.raises(McpError):
+        paginate(items, key, "%%%", 2)
+
+
+class PagingSession:
+    """Stands in for an upstream ClientSession serving tools in pages."""
+
+    def __init__(self) -> None:
+        self.pages = {None: (["a", "b"], "1"), "1": (["c"], "2"), "2": (["d"], None)}
+        self.requested: List[Optional[str]] = []
+
+    async def send_request(self, request: Any, result_type: type) -> Any:
+        assert result_type is types.ListToolsResult
+        cursor = request.root.cursor
+        self.requested.append(cursor)
+        names, next_cursor = self.pages[cursor]
+        return types.ListToolsResult(
+            tools=[tool(name) for name in names], nextCursor=next_cursor
+        )
+
+
+@pytest.mark.asyncio
+async def test_upstream_lists_follow_next_cursor() -> None:
+    server = Server("up", {"command": sys.executable, "args": [UPSTREAM_SCRIPT]})
+    session = PagingSession()
+
+    tools = await server._list_all(session, "tools")
+    assert [t.name for t in tools] == ["a", "b", "c", "d"]
+    assert session.requested == [None, "1", "2"]
+
+    # A server that keeps returning the same cursor does not loop forever
+    session.pages["2"] = (["d"], "1")
+    tools = await server._list_all(session, "tools")
+    assert [t.name for t in tools] == ["a", "b", "c", "d"]
+    assert session.requested[3:] == [None, "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_gateway_lists_are_paginated() -> None:
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[GetewayContext]:
+        yield GetewayContext(list_page_size=2)
+
+    gateway = FastMCP("test gateway", lifespan=lifespan)
+    for name in ("e", "b", "d", "a", "c"):
+        gateway.add_tool(lambda: "", name=name, description=name)
+    install_pagination(gateway._mcp_server, lambda context: context.list_page_size)
+
+    async with create_connected_server_and_client_session(
+        gateway._mcp_server
+    ) as client:
+        pages = []
+        cursor = None
+        for _ in range(5):
+            result = await client.list_tools(cursor)
+            pages.append([t.name for t in result.tools])
+            cursor = result.nextCursor
+            if cursor is None:
+                break
+    assert pages == [["a", "b"], ["c", "d"], ["e"]]
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import pytest
+
+from mcp import types
+from mcp_gateway.plugins.base import (
+    EXECUTION_THREAD,
+    GuardrailPlugin,
+    PluginContext,
+)
+from mcp_gateway.plugins.executor import PluginExecutor
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.spill import SpilledBody
+
+
+class BusyGuardrail(GuardrailPlugin):
+    """Holds its thread for a while, like a large regex or NLP scan."""
+
+    execution_mode = EXECUTION_THREAD
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return context.arguments
+
+    def process_response(self, context: PluginContext) -> Any:
+        time.sleep(0.3)
+        return context.response + " checked"
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_keeps_the_event_loop_free() -> None:
+    plugin = BusyGuardrail()
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [plugin]
+    manager._executors[plugin] = PluginExecutor(plugin, plugin.execution_mode)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        response = await manager.process_response(
+            PluginContext("srv", "tool", "fetch", response="ok")
+        )
+    finally:
+        ticker.cancel()
+        await manager.close()
+    assert response == "ok checked"
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_process_mode_runs_prewarmed_plugin_in_workers() -> None:
+    manager = PluginManager(
+        enabled_types=[GuardrailPlugin.plugin_type],
+        enabled_plugins={GuardrailPlugin.plugin_type: ["basic"]},
+        plugin_settings={
+            "basic": {
+                "execution": "process",
+                "workers": 2,
+                "config": {
+                    "custom_token_regexes": {
+                        "pw": {"regex": "hunter2", "replacement": "<PW>"}
+                    }
+                },
+            }
+        },
+    )
+    await manager.start()
+    try:
+        # Every worker process was started and loaded the plugin up front
+        (executor,) = manager._executors.values()
+        assert len(executor._processes._processes) == 2
+
+        # The worker processes loaded the plugin with its config
+        result = await manager.process_response(
+            PluginContext(
+                "srv",
+                "tool",
+                "fetch",
+                response=types.CallToolResult(
+                    content=[types.TextContent(type="text", text="pw: hunter2")]
+                ),
+            )
+        )
+        assert result.content[0].text == "pw: <PW>"
+
+        # A response the plugin lets through comes back as the same object
+        clean = types.CallToolResult(
+            content=[types.TextContent(type="text", text="nothing here")]
+        )
+        assert (
+            await manager.process_response(
+                PluginContext("srv", "tool", "fetch", response=clean)
+            )
+            is clean
+        )
+
+        # Spilled bodies cannot be sent to a process and are scanned in a thread
+        body = SpilledBody.from_text("pw: hunter2")
+        try:
+            sanitized, mime_type = await manager.process_response(
+                PluginContext(
+                    "srv", "resource", "test://doc", response=(body, "text/plain")
+                )
+            )
+            assert sanitized.read_text() == "pw: <PW>"
+            sanitized.close()
+        finally:
+            body.close()
+    finally:
+        await manager.close()
@@ -0,0 +1,243 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from mcp import types
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext, TracingPlugin
+from mcp_gateway.plugins import manager as manager_module
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.plugins.policy import PluginPolicy
+
+
+class RecordingTracer(TracingPlugin):
+    """Records what it observes; only traces the "search" tool."""
+
+    def __init__(self, seen: List[str]) -> None:
+        self.seen = seen
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def applies_to(
+        self, server_name: str, capability_type: str, capability_name: str
+    ) -> bool:
+        return capability_name == "search"
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        self.seen.append(f"trace request {context.arguments}")
+        return {"ignored": True}
+
+    async def process_response(self, context: PluginContext) -> Any:
+        self.seen.append(f"trace response {context.response}")
+        return "ignored"
+
+
+class AppendingGuardrail(GuardrailPlugin):
+    """Appends its tag to the arguments and response; blocks "forbidden"."""
+
+    def __init__(self, tag: str, seen: List[str]) -> None:
+        self.tag = tag
+        self.seen = seen
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        self.seen.append(f"{self.tag} request")
+        if context.capability_name == "forbidden":
+            return None
+        return {"q": context.arguments["q"] + self.tag}
+
+    def process_response(self, context: PluginContext) -> Any:
+        self.seen.append(f"{self.tag} response")
+        return context.response + self.tag
+
+
+def make_manager(seen: List[str]) -> PluginManager:
+    manager = PluginManager()
+    manager._plugins[TracingPlugin.plugin_type] = [RecordingTracer(seen)]
+    manager._plugins[GuardrailPlugin.plugin_type] = [
+        AppendingGuardrail("1", seen),
+        AppendingGuardrail("2", seen),
+    ]
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_stages_in_order() -> None:
+    seen: List[str] = []
+    manager = make_manager(seen)
+
+    arguments = await manager.process_request(
+        PluginContext("srv", "tool", "search", arguments={"q": "x"})
+    )
+    response = await manager.process_response(
+        PluginContext("srv", "tool", "search", arguments=arguments, response="r")
+    )
+    assert arguments == {"q": "x12"}
+    assert response == "r12"
+    assert seen == [
+        "trace request {'q': 'x'}",
+        "1 request",
+        "2 request",
+        "1 response",
+        "2 response",
+        "trace response r12",
+    ]
+
+    seen.clear()
+    assert (
+        await manager.process_request(
+            PluginContext("srv", "tool", "forbidden", arguments={"q": "x"})
+        )
+        is None
+    )
+    assert seen == ["1 request"]
+
+
+@pytest.mark.asyncio
+async def test_pipelines_are_compiled_once_per_route() -> None:
+    seen: List[str] = []
+    manager = make_manager(seen)
+    for _ in range(3):
+        await manager.process_request(
+            PluginContext("srv", "tool", "fetch", arguments={"q": ""})
+        )
+    assert len(manager._pipelines) == 1
+    pipeline = manager._pipelines[("srv", "tool", "fetch")]
+    # The tracer does not apply to "fetch", so only the guardrails remain
+    assert pipeline.request.tracers == ()
+    assert [stage.name for stage in pipeline.request.rewriters] == [
+        "AppendingGuardrail",
+        "AppendingGuardrail",
+    ]
+    assert [stage.is_async for stage in pipeline.request.rewriters] == [True, True]
+    assert "trace" not in " ".join(seen)
+
+    empty = PluginManager()
+    context = PluginContext("srv", "tool", "fetch", arguments={"q": ""})
+    assert await empty.process_request(context) is context.arguments
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_pipelines_are_evicted(monkeypatch) -> None:
+    monkeypatch.setattr(manager_module, "MAX_COMPILED_PIPELINES", 2)
+    manager = make_manager([])
+    for uri in ("test://a", "test://b", "test://a", "test://c"):
+        await manager.process_response(
+            PluginContext("srv", "resource", uri, response="ok")
+        )
+    assert list(manager._pipelines) == [
+        ("srv", "resource", "test://a"),
+        ("srv", "resource", "test://c"),
+    ]
+
+
+def test_plugin_policies_match_routes_with_globs() -> None:
+    policy = PluginPolicy.from_config(
+        "presidio",
+        {
+            "include": [{"server": ["web-*", "search"]}],
+            "exclude": [{"capability_type": "tool", "name": "bulk_*"}],
+        },
+    )
+    assert policy.allows("web-1", "tool", "fetch")
+    assert policy.allows("search", "resource", "bulk_export")
+    assert not policy.allows("web-1", "tool", "bulk_export")
+    assert not policy.allows("internal", "tool", "fetch")
+
+    with pytest.raises(ValueError):
+        PluginPolicy.from_config("presidio", {"include": [{"sever": "web-*"}]})
+    with pytest.raises(ValueError):
+        PluginPolicy.from_config("presidio", {"exclude": {"server": "web-*"}})
+
+
+@pytest.mark.asyncio
+async def test_plugin_settings_configure_and_scope_plugins() -> None:
+    manager = PluginManager(
+        enabled_types=[GuardrailPlugin.plugin_type],
+        enabled_plugins={GuardrailPlugin.plugin_type: ["basic"]},
+        plugin_settings={
+            "Basic": {
+                "config": {
+                    "custom_token_regexes": {
+                        "pw": {"regex": "hunter2", "replacement": "<PW>"}
+                    }
+                },
+                "exclude": [{"server": "internal-*"}],
+            }
+        },
+    )
+    result = types.CallToolResult(
+        content=[types.TextContent(type="text", text="pw: hunter2")]
+    )
+
+    sanitized = await manager.process_response(
+        PluginContext("web", "tool", "fetch", response=result)
+    )
+    assert sanitized.content[0].text == "pw: <PW>"
+
+    untouched = await manager.process_response(
+        PluginContext("internal-db", "tool", "query", response=result)
+    )
+    assert untouched is result
+    assert manager._pipeline("internal-db", "tool", "query").response.empty
+
+
+class SlowDetector(GuardrailPlugin):
+    """A detect-only guardrail taking a while; blocks responses containing "bad"."""
+
+    detect_only = True
+
+    def __init__(self, delay: float, seen: List[str]) -> None:
+        self.delay = delay
+        self.seen = seen
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return context.arguments
+
+    async def process_response(self, context: PluginContext) -> Any:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.seen.append(f"cancelled {self.delay}")
+            raise
+        self.seen.append(f"checked {context.response}")
+        if "bad" in context.response:
+            return f"blocked after {self.delay}"
+        return context.response
+
+
+@pytest.mark.asyncio
+async def test_detectors_run_concurrently_and_first_block_wins() -> None:
+    seen: List[str] = []
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [
+        SlowDetector(0.3, seen),
+        AppendingGuardrail("1", seen),
+        SlowDetector(0.3, seen),
+        SlowDetector(0.1, seen),
+    ]
+
+    started = time.monotonic()
+    response = await manager.process_response(
+        PluginContext("srv", "tool", "fetch", response="ok")
+    )
+    assert time.monotonic() - started < 0.5
+    # Detectors check the response only after the rewriter masked it
+    assert response == "ok1"
+    assert seen.count("checked ok1") == 3
+    assert seen.index("1 response") < seen.index("checked ok1")
+
+    seen.clear()
+    response = await manager.process_response(
+        PluginContext("srv", "tool", "fetch", response="bad")
+    )
+    assert response == "blocked after 0.1"
+    await asyncio.sleep(0)
+    assert seen.count("cancelled 0.3") == 2
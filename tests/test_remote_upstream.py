@@ -0,0 +1,108 @@
+import asyncio
+import os
+import socket
+from typing import Any, AsyncIterator, Dict, Tuple
+
+import pytest
+import pytest_asyncio
+import uvicorn
+
+from mcp.server.fastmcp import FastMCP
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server
+
+
+def make_upstream() -> FastMCP:
+    """An in-process stand-in for a remote MCP server."""
+    upstream = FastMCP("Remote Upstream")
+
+    @upstream.tool()
+    def echo(text: str) -> str:
+        """Returns the given text."""
+        return text
+
+    @upstream.tool()
+    def pid() -> str:
+        """Returns the process id of the server."""
+        return str(os.getpid())
+
+    return upstream
+
+
+@pytest_asyncio.fixture
+async def remote_upstream() -> AsyncIterator[Tuple[FastMCP, str]]:
+    """Serves a stand-in upstream over streamable HTTP on a free local port."""
+    upstream = make_upstream()
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    config = uvicorn.Config(upstream.streamable_http_app(), log_level="warning")
+    http_server = uvicorn.Server(config)
+    serving = asyncio.create_task(http_server.serve(sockets=[listener]))
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield upstream, f"http://127.0.0.1:{listener.getsockname()[1]}/mcp"
+    finally:
+        http_server.should_exit = True
+        await serving
+        listener.close()
+
+
+def remote_config(url: str, **extra: Any) -> Dict[str, Any]:
+    return {"url": url, **extra}
+
+
+def test_invalid_remote_transport_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        Server("remote", remote_config("http://example.invalid/mcp", transport="ws"))
+
+
+@pytest.mark.asyncio
+async def test_remote_replicas_share_a_pooled_client(remote_upstream) -> None:
+    """Replicas of a url server talk streamable HTTP over one keep-alive pool."""
+    _, url = remote_upstream
+    server = Server(
+        "remote",
+        remote_config(url, pool_size=2, http_pool={"max_connections": 4}),
+    )
+    await server.start()
+    try:
+        assert {tool.name for tool in server._tools} == {"echo", "pid"}
+        clients = {id(replica.http_client) for replica in server.replicas}
+        assert clients == {id(server._http_client)}
+        pool = server._http_client._transport._pool
+        assert pool._max_connections == 4
+
+        results = await asyncio.gather(
+            *(
+                server.call_tool(PluginManager(), "echo", {"text": str(i)})
+                for i in range(6)
+            )
+        )
+        assert [result.content[0].text for result in results] == [
+            str(i) for i in range(6)
+        ]
+    finally:
+        await server.stop()
+    assert server._http_client is None
+
+
+@pytest.mark.asyncio
+async def test_remote_session_loss_reconnects_transparently(remote_upstream) -> None:
+    """A call rejected because the upstream forgot the session is retried on a
+    fresh session instead of failing."""
+    upstream, url = remote_upstream
+    server = Server("remote", remote_config(url))
+    await server.start()
+    try:
+        replica = server.replicas[0]
+        old_session = replica.session
+        # Simulate the remote server restarting and losing every session
+        upstream.session_manager._server_instances.clear()
+
+        result = await server.call_tool(PluginManager(), "echo", {"text": "again"})
+        assert result.content[0].text == "again"
+        assert replica.session is not old_session
+        assert server.is_active
+    finally:
+        await server.stop()
@@ -0,0 +1,138 @@
+import base64
+import os
+import time
+from typing import Any, Dict, Optional
+
+import pytest
+
+from mcp import types
+from mcp_gateway.cache import ResourceCache
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import (
+    GetewayContext,
+    Server,
+    handle_resource_updated,
+    proxy_resource_read,
+)
+from tests.conftest import upstream_config
+
+
+def text_read(uri: str, text: str) -> types.ReadResourceResult:
+    return types.ReadResourceResult(
+        contents=[types.TextResourceContents(uri=uri, text=text)]
+    )
+
+
+def blob_read(uri: str, data: bytes) -> types.ReadResourceResult:
+    return types.ReadResourceResult(
+        contents=[
+            types.BlobResourceContents(
+                uri=uri,
+                blob=base64.b64encode(data).decode("ascii"),
+                mimeType="application/octet-stream",
+            )
+        ]
+    )
+
+
+class CountingGuardrail(GuardrailPlugin):
+    """Counts how often the response pipeline runs."""
+
+    def __init__(self) -> None:
+        self.responses = 0
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return context.arguments
+
+    def process_response(self, context: PluginContext) -> Any:
+        self.responses += 1
+        return context.response
+
+
+def test_resource_cache_round_trips_text_and_blobs(tmp_path) -> None:
+    cache = ResourceCache(spill_dir=str(tmp_path))
+    cache.put("srv", "test://a", text_read("test://a", "hello"), ttl=60)
+    cache.put("srv", "test://b", blob_read("test://b", b"\x00\x01"), ttl=60)
+
+    assert cache.get("srv", "test://a") == text_read("test://a", "hello")
+    assert cache.get("srv", "test://b") == blob_read("test://b", b"\x00\x01")
+    assert cache.get("other", "test://a") is None
+    assert cache.stats("srv")["hits"] == 2
+
+
+def test_resource_cache_expires_and_invalidates(tmp_path) -> None:
+    cache = ResourceCache(spill_dir=str(tmp_path))
+    cache.put("srv", "test://a", text_read("test://a", "a"), ttl=0.05)
+    cache.put("srv", "test://b", text_read("test://b", "b"), ttl=60)
+    time.sleep(0.1)
+    assert cache.get("srv", "test://a") is None
+    assert cache.stats("srv")["expirations"] == 1
+
+    cache.invalidate("srv", "test://b")
+    assert cache.get("srv", "test://b") is None
+    assert cache.memory_bytes == 0
+
+
+def test_resource_cache_spills_and_shares_large_bodies(tmp_path) -> None:
+    """Bodies above the threshold live on disk, once per distinct content."""
+    cache = ResourceCache(max_bytes=100, spill_threshold=10, spill_dir=str(tmp_path))
+    big = b"x" * 1000
+    cache.put("srv", "test://one", blob_read("test://one", big), ttl=60)
+    cache.put("other", "test://two", blob_read("test://two", big), ttl=60)
+
+    assert cache.memory_bytes == 0
+    assert cache.spilled_bytes == 1000
+    spill_files = [f for _, _, files in os.walk(tmp_path) for f in files]
+    assert len(spill_files) == 1
+    assert cache.get("other", "test://two") == blob_read("test://two", big)
+
+    cache.invalidate("srv")
+    assert cache.spilled_bytes == 1000
+    cache.close()
+    assert cache.spilled_bytes == 0
+    assert not any(files for _, _, files in os.walk(tmp_path))
+
+
+def test_resource_cache_evicts_least_recently_read(tmp_path) -> None:
+    cache = ResourceCache(max_bytes=10, spill_threshold=100, spill_dir=str(tmp_path))
+    cache.put("srv", "test://a", text_read("test://a", "aaaa"), ttl=60)
+    cache.put("srv", "test://b", text_read("test://b", "bbbb"), ttl=60)
+    assert cache.get("srv", "test://a") is not None
+    cache.put("srv", "test://c", text_read("test://c", "cccc"), ttl=60)
+
+    assert cache.get("srv", "test://b") is None
+    assert cache.get("srv", "test://a") is not None
+    assert cache.stats("srv")["evictions"] == 1
+    assert cache.memory_bytes == 8
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_skip_upstream_and_plugins(tmp_path) -> None:
+    """Reads within the TTL are served from the cache until the resource is
+    reported as updated."""
+    server = Server("up", upstream_config(resource_cache_ttl=60))
+    guardrail = CountingGuardrail()
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [guardrail]
+    context = GetewayContext(resource_cache=ResourceCache(spill_dir=str(tmp_path)))
+    await server.start()
+    try:
+        for _ in range(3):
+            result = await proxy_resource_read(
+                server, manager, "test://doc", resource_cache=context.resource_cache
+            )
+            assert result.contents[0].text == "The password is hunter2"
+        assert guardrail.responses == 1
+
+        await handle_resource_updated(context, server, "test://doc")
+        await proxy_resource_read(
+            server, manager, "test://doc", resource_cache=context.resource_cache
+        )
+        assert guardrail.responses == 2
+    finally:
+        await server.stop()
+        context.resource_cache.close()
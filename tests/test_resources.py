@@ -0,0 +1,127 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp_gateway import server as gateway_server
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.resources import (
+    RESOURCE_NOT_FOUND,
+    ResourceRouter,
+    gateway_uri,
+    split_gateway_uri,
+)
+from mcp_gateway.server import Server
+from mcp_gateway.snapshot import CapabilitySnapshot
+from tests.conftest import upstream_config
+
+
+class RedactingGuardrail(GuardrailPlugin):
+    """Redacts a fixed word from resource contents."""
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return context.arguments
+
+    async def process_response(self, context: PluginContext) -> Any:
+        content, mime_type = context.response
+        return content.replace(b"hunter2", b"[REDACTED]"), mime_type
+
+
+def test_router_splits_on_the_server_prefix() -> None:
+    servers = {"files": "files-server"}
+    router = ResourceRouter(servers)
+    uri = gateway_uri("files", "file:///tmp/a.txt")
+    assert split_gateway_uri(uri) == ("files", "file:///tmp/a.txt")
+    assert router.route(uri) == ("files-server", "file:///tmp/a.txt")
+
+    for unknown in (gateway_uri("other", "x://y"), "file:///tmp/a.txt"):
+        with pytest.raises(McpError) as exc_info:
+            router.route(unknown)
+        assert exc_info.value.error.code == RESOURCE_NOT_FOUND
+
+    # Servers added later are routed without rebuilding the router
+    servers["late"] = "late-server"
+    assert router.route(gateway_uri("late", "x://y"))[0] == "late-server"
+
+
+@pytest.mark.asyncio
+async def test_read_resource_is_sanitized_per_item() -> None:
+    server = Server("up", upstream_config())
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [RedactingGuardrail()]
+    await server.start()
+    try:
+        assert [str(r.uri) for r in server._resources] == ["test://doc"]
+        assert [t.uriTemplate for t in server._resource_templates] == [
+            "test://items/{item_id}"
+        ]
+        result = await server.read_resource(manager, "test://doc")
+        assert result.contents[0].text == "The password is [REDACTED]"
+        assert result.contents[0].mimeType == "text/plain"
+
+        snapshot = CapabilitySnapshot.from_dict(
+            json.loads(json.dumps(server.capability_snapshot().to_dict()))
+        )
+        assert snapshot.resource_templates == server._resource_templates
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_gateway_lists_and_reads_namespaced_resources(
+    tmp_path, monkeypatch
+) -> None:
+    """Clients see every upstream resource under mcp-gateway://<server>/ and
+    can read resources and template instances through those URIs."""
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "mcp-gateway": {
+                        "snapshot_dir": str(tmp_path / "snapshots"),
+                        "servers": {"up": upstream_config()},
+                    }
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(
+        gateway_server,
+        "cli_args",
+        gateway_server.parse_args(["--mcp-json-path", str(config_path)]),
+    )
+    gateway = FastMCP("test gateway", lifespan=gateway_server.lifespan)
+    gateway_server.install_resource_handlers(gateway)
+
+    async with create_connected_server_and_client_session(
+        gateway._mcp_server
+    ) as client:
+        # Wait for the upstream to finish starting in the background
+        for _ in range(100):
+            resources = (await client.list_resources()).resources
+            if resources:
+                break
+            await asyncio.sleep(0.1)
+        assert [str(r.uri) for r in resources] == ["mcp-gateway://up/test://doc"]
+        assert resources[0].name == "up_doc"
+
+        templates = (await client.list_resource_templates()).resourceTemplates
+        assert [t.uriTemplate for t in templates] == [
+            "mcp-gateway://up/test://items/{item_id}"
+        ]
+
+        read = await client.read_resource("mcp-gateway://up/test://items/7")
+        assert read.contents[0].text == "item 7"
+        assert str(read.contents[0].uri) == "mcp-gateway://up/test://items/7"
+
+        with pytest.raises(McpError):
+            await client.read_resource("mcp-gateway://missing/test://doc")
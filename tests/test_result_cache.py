@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+import pytest
+
+from mcp import types
+from mcp_gateway.cache import ToolResultCache, canonicalize_arguments, tool_call_key
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server, proxy_tool_call
+from tests.conftest import upstream_config
+
+
+def text_result(text: str) -> types.CallToolResult:
+    return types.CallToolResult(content=[types.TextContent(type="text", text=text)])
+
+
+class CountingGuardrail(GuardrailPlugin):
+    """Counts how often the response pipeline runs."""
+
+    def __init__(self) -> None:
+        self.responses = 0
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return context.arguments
+
+    def process_response(self, context: PluginContext) -> Any:
+        self.responses += 1
+        return context.response
+
+
+def test_canonical_arguments_ignore_key_order() -> None:
+    """Argument dicts that differ only in key order share a cache key."""
+    assert canonicalize_arguments({"a": 1, "b": {"y": 2, "x": 3}}) == (
+        canonicalize_arguments({"b": {"x": 3, "y": 2}, "a": 1})
+    )
+    assert tool_call_key("s", "t", None) == tool_call_key("s", "t", {})
+
+
+@pytest.mark.asyncio
+async def test_hits_misses_and_expiry() -> None:
+    """Entries are served until their TTL passes."""
+    cache = ToolResultCache()
+    key = tool_call_key("srv", "tool", {"q": 1})
+    assert cache.get(key) is None
+
+    cache.put(key, text_result("value"), ttl=0.1)
+    assert cache.get(key).content[0].text == "value"
+
+    await asyncio.sleep(0.15)
+    assert cache.get(key) is None
+
+    stats = cache.stats("srv")
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+
+
+def test_lru_eviction_by_size() -> None:
+    """The least recently used entry is evicted once the byte budget is exceeded."""
+    entry_size = len(text_result("x" * 100).model_dump_json(by_alias=True))
+    cache = ToolResultCache(max_bytes=entry_size * 2)
+    first, second, third = (tool_call_key("srv", "t", {"n": n}) for n in range(3))
+
+    cache.put(first, text_result("x" * 100), ttl=60)
+    cache.put(second, text_result("y" * 100), ttl=60)
+    cache.get(first)  # first is now the most recently used
+    cache.put(third, text_result("z" * 100), ttl=60)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.get(third) is not None
+    assert cache.stats("srv")["evictions"] == 1
+    assert cache.total_bytes <= cache.max_bytes
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_skips_upstream_and_guardrails() -> None:
+    """Only tools with a TTL are cached, and hits bypass the plugin pipeline."""
+    guardrail = CountingGuardrail()
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [guardrail]
+    cache = ToolResultCache()
+    server = Server("cached", upstream_config(tool_cache_ttls={"echo": 60}))
+    await server.start()
+    try:
+        for _ in range(3):
+            result = await proxy_tool_call(
+                server, manager, "echo", {"text": "hi"}, result_cache=cache
+            )
+            assert result.content[0].text == "hi"
+        assert guardrail.responses == 1
+        assert server.replicas[0].total_calls == 1
+
+        # pid has no TTL and always reaches the upstream server
+        for _ in range(2):
+            await proxy_tool_call(server, manager, "pid", {}, result_cache=cache)
+        assert guardrail.responses == 3
+
+        stats = cache.stats("cached")
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+    finally:
+        await server.stop()
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from mcp import types
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server, _parse_pool_size
+from tests.conftest import upstream_config
+
+
+def result_text(result: types.CallToolResult) -> str:
+    """Returns the text of the first content item of a tool result."""
+    return result.content[0].text
+
+
+def test_parse_pool_size() -> None:
+    """pool_size accepts None, an int or a min/max dict."""
+    assert _parse_pool_size("s", None) == (1, 1)
+    assert _parse_pool_size("s", 3) == (3, 3)
+    assert _parse_pool_size("s", {"min": 1, "max": 4}) == (1, 4)
+    assert _parse_pool_size("s", {"min": 2}) == (2, 2)
+    with pytest.raises(ValueError):
+        _parse_pool_size("s", {"min": 3, "max": 2})
+    with pytest.raises(ValueError):
+        _parse_pool_size("s", 0)
+
+
+@pytest.mark.asyncio
+async def test_pool_dispatches_to_least_loaded_replica() -> None:
+    """Concurrent calls are spread across replicas and capabilities are shared."""
+    server = Server("pool", upstream_config(pool_size=2))
+    plugin_manager = PluginManager()
+    await server.start()
+    try:
+        assert len(server.pool_stats()["replicas"]) == 2
+        assert {tool.name for tool in await server.list_tools()} >= {"echo", "sleep"}
+
+        results = await asyncio.gather(
+            *(
+                server.call_tool(plugin_manager, "sleep", {"seconds": 0.3})
+                for _ in range(2)
+            )
+        )
+        pids = {result_text(result) for result in results}
+        assert len(pids) == 2
+
+        stats = server.pool_stats()
+        assert [replica["in_flight"] for replica in stats["replicas"]] == [0, 0]
+        assert [replica["total_calls"] for replica in stats["replicas"]] == [1, 1]
+    finally:
+        await server.stop()
+    assert not server.is_active
+
+
+@pytest.mark.asyncio
+async def test_pool_grows_up_to_max_under_load() -> None:
+    """A busy pool adds replicas in the background, but never beyond max."""
+    server = Server("elastic", upstream_config(pool_size={"min": 1, "max": 2}))
+    plugin_manager = PluginManager()
+    await server.start()
+    try:
+        assert len(server.pool_stats()["replicas"]) == 1
+        # Calls held open far longer than a replica takes to spawn
+        calls = [
+            asyncio.create_task(
+                server.call_tool(plugin_manager, "sleep", {"seconds": 60})
+            )
+            for _ in range(3)
+        ]
+        try:
+            deadline = asyncio.get_running_loop().time() + 30
+            while len(server.pool_stats()["replicas"]) < 2:
+                assert asyncio.get_running_loop().time() < deadline
+                await asyncio.sleep(0.05)
+            # With both replicas busy, more calls do not grow it beyond max
+            calls += [
+                asyncio.create_task(
+                    server.call_tool(plugin_manager, "sleep", {"seconds": 60})
+                )
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.5)
+            assert server._grow_task is None
+            assert len(server.pool_stats()["replicas"]) == 2
+        finally:
+            for call in calls:
+                call.cancel()
+            await asyncio.gather(*calls, return_exceptions=True)
+    finally:
+        await server.stop()
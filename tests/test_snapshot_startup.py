@@ -0,0 +1,73 @@
+
+import pytest
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import (
+    GetewayContext,
+    Server,
+    diff_capabilities,
+    register_proxied_capabilities,
+    start_and_register,
+)
+from mcp_gateway.snapshot import CapabilitySnapshot, CapabilitySnapshotStore
+from tests.conftest import upstream_config
+
+
+def make_tool(name: str, description: str = "") -> types.Tool:
+    return types.Tool(
+        name=name, description=description, inputSchema={"type": "object"}
+    )
+
+
+def test_diff_capabilities() -> None:
+    """Added and changed items are re-registered; removed and changed ones dropped."""
+    old = [make_tool("same"), make_tool("changed", "v1"), make_tool("removed")]
+    new = [make_tool("same"), make_tool("changed", "v2"), make_tool("added")]
+    upserts, stale = diff_capabilities(old, new)
+    assert sorted(tool.name for tool in upserts) == ["added", "changed"]
+    assert sorted(stale) == ["changed", "removed"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_registers_before_start_and_applies_diff(tmp_path) -> None:
+    """Tools from a stale snapshot are exposed at once and corrected after the
+    live fetch, while calls made during startup wait for the server."""
+    gateway = FastMCP("test gateway")
+    config = upstream_config()
+    snapshot = CapabilitySnapshot(
+        tools=[make_tool("echo", "outdated"), make_tool("retired")]
+    )
+    context = GetewayContext(
+        plugin_manager=PluginManager(),
+        snapshot_store=CapabilitySnapshotStore(str(tmp_path)),
+    )
+    server = Server("snap", config)
+    server.apply_snapshot(snapshot)
+    context.proxied_servers["snap"] = server
+
+    server.start_in_background()
+    assert server.is_starting
+    await register_proxied_capabilities(gateway, context)
+    registered = {tool.name for tool in await gateway.list_tools()}
+    assert {"snap_echo", "snap_retired"} <= registered
+
+    try:
+        # A call during startup waits for the server instead of failing
+        result = await server.call_tool(PluginManager(), "echo", {"text": "early"})
+        assert result.content[0].text == "early"
+
+        await start_and_register(gateway, context, server, snapshot)
+        tools = {tool.name: tool for tool in await gateway.list_tools()}
+        assert "snap_retired" not in tools
+        assert {"snap_echo", "snap_sleep", "snap_pid"} <= set(tools)
+        assert tools["snap_echo"].description != "outdated"
+
+        # The live capabilities replace the stale snapshot on disk
+        saved = context.snapshot_store.load("snap", config)
+        assert "retired" not in {tool.name for tool in saved.tools}
+    finally:
+        for supervisor in context.supervisors.values():
+            await supervisor.stop()
+        await server.stop()
@@ -0,0 +1,96 @@
+import base64
+import os
+import tracemalloc
+
+import pytest
+
+from mcp import types
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext
+from mcp_gateway.plugins.guardrails.basic import BasicGuardrailPlugin
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.resources import contents_from_bytes, contents_to_body
+from mcp_gateway.server import Server
+from mcp_gateway.spill import SpilledBody, rewrite_text
+from tests.conftest import upstream_config
+
+GITHUB_PAT = "ghp_" + "a" * 36
+
+
+def test_text_windows_do_not_split_tokens() -> None:
+    text = " ".join(f"word{i}" for i in range(1000)) + " é" * 100
+    body = SpilledBody.from_text(text)
+    try:
+        windows = list(body.text_windows(window=64))
+        assert "".join(windows) == text
+        assert len(windows) > 1
+        assert all(w.endswith(" ") for w in windows[:-1])
+    finally:
+        body.close()
+
+
+def test_spilled_blob_round_trips() -> None:
+    data = os.urandom(10_000)
+    item = types.BlobResourceContents(
+        uri="test://blob", blob=base64.b64encode(data).decode("ascii")
+    )
+    body, _ = contents_to_body(item, spill_threshold=1000)
+    try:
+        assert isinstance(body, SpilledBody)
+        assert body.read_bytes() == data
+        assert contents_from_bytes(item, body, None) == item
+    finally:
+        body.close()
+
+
+def test_basic_guardrail_scans_spilled_body_in_windows() -> None:
+    """A secret straddling a window boundary is still found, and scanning a
+    large body only allocates a few windows' worth of memory."""
+    plugin = BasicGuardrailPlugin()
+    plugin.load({})
+    filler = "lorem ipsum " * 20_000
+    body = SpilledBody.from_text(filler + GITHUB_PAT + " " + filler)
+    context = PluginContext(
+        server_name="srv",
+        capability_type="resource",
+        capability_name="test://big",
+        response=(body, "text/plain"),
+    )
+    window = 16 * 1024
+    tracemalloc.start()
+    try:
+        sanitized, changed = rewrite_text(body, plugin._sanitize_text, window)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    try:
+        assert changed
+        assert peak < 16 * window < body.size
+        text = sanitized.read_text()
+        assert GITHUB_PAT not in text
+        assert "<GITHUB_PERSONAL_ACCESS_TOKEN>" in text
+
+        result, mime_type = plugin.process_response(context)
+        assert isinstance(result, SpilledBody) and mime_type == "text/plain"
+        assert GITHUB_PAT not in result.read_text()
+        result.close()
+    finally:
+        sanitized.close()
+        body.close()
+
+
+@pytest.mark.asyncio
+async def test_read_resource_spills_large_contents() -> None:
+    plugin = BasicGuardrailPlugin()
+    plugin.load(
+        {"custom_token_regexes": {"pw": {"regex": "hunter2", "replacement": "<PW>"}}}
+    )
+    manager = PluginManager()
+    manager._plugins[GuardrailPlugin.plugin_type] = [plugin]
+    server = Server("up", upstream_config(resource_spill_threshold=4))
+    await server.start()
+    try:
+        result = await server.read_resource(manager, "test://doc")
+        assert result.contents[0].text == "The password is <PW>"
+        assert result.contents[0].mimeType == "text/plain"
+    finally:
+        await server.stop()
@@ -0,0 +1,159 @@
+import asyncio
+import sys
+from typing import List
+
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp_gateway.downstream import DownstreamSessions
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import (
+    GetewayContext,
+    Server,
+    launch_proxied_servers,
+    start_and_register,
+)
+from mcp_gateway.snapshot import CapabilitySnapshotStore
+from mcp_gateway.startup import StartupTracker
+from tests.conftest import upstream_config
+
+
+class RecordingSession:
+    """Stands in for a downstream ServerSession and records notifications."""
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+
+    async def send_tool_list_changed(self) -> None:
+        self.sent.append("tools")
+
+    async def send_prompt_list_changed(self) -> None:
+        self.sent.append("prompts")
+
+    async def send_resource_list_changed(self) -> None:
+        self.sent.append("resources")
+
+
+@pytest.mark.asyncio
+async def test_servers_register_independently_of_a_hanging_one(tmp_path) -> None:
+    """A ready server is exposed while another hangs until its startup timeout."""
+    gateway = FastMCP("test gateway")
+    client = RecordingSession()
+    downstream = DownstreamSessions()
+    downstream.add(client)
+    context = GetewayContext(
+        plugin_manager=PluginManager(),
+        snapshot_store=CapabilitySnapshotStore(str(tmp_path)),
+        downstream=downstream,
+        startup=StartupTracker(2),
+    )
+    fast = Server("fast", upstream_config())
+    # Never answers the initialize request
+    hanging = Server(
+        "hanging",
+        {
+            "command": sys.executable,
+            "args": ["-c", "import time; time.sleep(60)"],
+            "startup_timeout": 1.5,
+        },
+    )
+    # Holds the hanging server's startup, and its timeout, until released
+    gate = asyncio.Semaphore(0)
+    hanging.start_in_background(gate)
+    for proxied_server in (fast, hanging):
+        context.proxied_servers[proxied_server.name] = proxied_server
+        context.startup_tasks[proxied_server.name] = asyncio.create_task(
+            start_and_register(gateway, context, proxied_server)
+        )
+
+    try:
+        deadline = asyncio.get_running_loop().time() + 30
+        while "fast_echo" not in {tool.name for tool in await gateway.list_tools()}:
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.05)
+        assert "hanging" in context.startup_tasks
+        assert client.sent[:1] == ["tools"]
+
+        gate.release()
+        await asyncio.wait_for(
+            asyncio.gather(*list(context.startup_tasks.values())), timeout=30
+        )
+        assert "hanging" not in context.proxied_servers
+        assert not hanging.is_active
+
+        stats = context.startup.stats()
+        assert stats["ready"] == 1 and stats["failed"] == 1
+        assert stats["time_to_first_tool"] < stats["time_to_all_tools"]
+        assert stats["time_to_all_tools"] >= 1.5
+    finally:
+        for supervisor in context.supervisors.values():
+            await supervisor.stop()
+        await asyncio.gather(fast.stop(), hanging.stop())
+
+
+@pytest.mark.asyncio
+async def test_startup_concurrency_and_priority_report(tmp_path) -> None:
+    """With one startup slot, servers start one at a time, highest priority first,
+    and the report times every phase of each."""
+    gateway = FastMCP("test gateway")
+    context = GetewayContext(
+        plugin_manager=PluginManager(),
+        snapshot_store=CapabilitySnapshotStore(str(tmp_path)),
+        startup=StartupTracker(2, concurrency=1),
+    )
+    low = Server("low", upstream_config())
+    high = Server("high", upstream_config(startup_priority=5))
+    for proxied_server in (low, high):
+        context.proxied_servers[proxied_server.name] = proxied_server
+
+    launch_proxied_servers(gateway, context)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*list(context.startup_tasks.values())), timeout=20
+        )
+        report = context.startup.report()
+        assert report["ready"] == 2 and report["concurrency"] == 1
+        first, second = report["per_server"]["high"], report["per_server"]["low"]
+        assert first["finished_after_seconds"] < second["finished_after_seconds"]
+        # The second server waited for the first one's slot
+        assert second["queued_seconds"] >= first["spawn_seconds"] + first[
+            "initialize_seconds"
+        ]
+        for entry in (first, second):
+            assert entry["status"] == "ready"
+            assert entry["initialize_seconds"] > 0
+            assert entry["capabilities_seconds"] > 0
+    finally:
+        for supervisor in context.supervisors.values():
+            await supervisor.stop()
+        await asyncio.gather(low.stop(), high.stop())
+
+
+@pytest.mark.asyncio
+async def test_server_failing_at_once_is_reported_failed(tmp_path) -> None:
+    """An upstream that exits right away fails its startup with its own error,
+    not a cancellation, and is dropped from the gateway."""
+    gateway = FastMCP("test gateway")
+    context = GetewayContext(
+        plugin_manager=PluginManager(),
+        snapshot_store=CapabilitySnapshotStore(str(tmp_path)),
+        startup=StartupTracker(1),
+    )
+    broken = Server(
+        "broken",
+        {"command": sys.executable, "args": ["-c", "import sys; sys.exit(1)"]},
+    )
+    context.proxied_servers[broken.name] = broken
+
+    launch_proxied_servers(gateway, context)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*list(context.startup_tasks.values())), timeout=20
+        )
+        assert "broken" not in context.proxied_servers
+        report = context.startup.report()
+        assert report["ready"] == 0 and report["failed"] == 1
+        assert report["per_server"]["broken"]["status"] == "failed"
+        assert report["time_to_all_tools"] is not None
+    finally:
+        await broken.stop()
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import sys
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List
+
+import pytest
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp_gateway import server as gateway_server
+from mcp_gateway.subscriptions import ResourceSubscriptions
+from mcp_gateway.transport import share_lifespan
+from tests.conftest import UPSTREAM_SCRIPT
+
+
+class FakeServer:
+    """Records the upstream subscribe and unsubscribe calls it receives."""
+
+    name = "up"
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    async def subscribe_resource(self, uri: str) -> None:
+        self.calls.append(f"subscribe {uri}")
+
+    async def unsubscribe_resource(self, uri: str) -> None:
+        self.calls.append(f"unsubscribe {uri}")
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.updated: List[str] = []
+
+    async def send_resource_updated(self, uri: Any) -> None:
+        if self.fail:
+            raise ConnectionError("closed")
+        self.updated.append(str(uri))
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_are_reference_counted() -> None:
+    server = FakeServer()
+    subscriptions = ResourceSubscriptions()
+    first, second = FakeSession(), FakeSession()
+
+    await asyncio.gather(
+        subscriptions.subscribe(server, "test://doc", first),
+        subscriptions.subscribe(server, "test://doc", second),
+    )
+    assert server.calls == ["subscribe test://doc"]
+    assert subscriptions.subscriber_count("up", "test://doc") == 2
+    assert subscriptions.stats("up")["upstream_subscriptions"] == 1
+
+    assert await subscriptions.publish(server, "test://doc") == 2
+    assert first.updated == second.updated == ["mcp-gateway://up/test://doc"]
+    assert await subscriptions.publish(server, "test://other") == 0
+
+    await subscriptions.unsubscribe(server, "test://doc", first)
+    assert server.calls == ["subscribe test://doc"]
+    await subscriptions.unsubscribe(server, "test://doc", second)
+    assert server.calls[-1] == "unsubscribe test://doc"
+    assert subscriptions.stats("up") == {
+        "upstream_subscriptions": 0,
+        "client_subscriptions": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_dead_subscribers_release_the_upstream_subscription() -> None:
+    server = FakeServer()
+    subscriptions = ResourceSubscriptions()
+    await subscriptions.subscribe(server, "test://doc", FakeSession(fail=True))
+
+    assert await subscriptions.publish(server, "test://doc") == 0
+    assert server.calls == ["subscribe test://doc", "unsubscribe test://doc"]
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_upstream_subscription(tmp_path, monkeypatch) -> None:
+    """Two clients subscribed to the same resource cause one upstream subscribe,
+    both receive its updates, and the last unsubscribe is forwarded."""
+    config_path = tmp_path / "mcp.json"
+    upstream: Dict[str, Any] = {"command": sys.executable, "args": [UPSTREAM_SCRIPT]}
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "mcp-gateway": {
+                        "snapshot_dir": str(tmp_path / "snapshots"),
+                        "servers": {"up": upstream},
+                    }
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(
+        gateway_server,
+        "cli_args",
+        gateway_server.parse_args(["--mcp-json-path", str(config_path)]),
+    )
+    gateway = FastMCP("test gateway", lifespan=gateway_server.lifespan)
+    gateway_server.install_resource_handlers(gateway)
+    share_lifespan(gateway._mcp_server)
+    capabilities = gateway._mcp_server.create_initialization_options().capabilities
+    assert capabilities.resources.subscribe
+
+    updates: List[List[str]] = [[], []]
+
+    def recorder(index: int):
+        async def handle(message: Any) -> None:
+            if isinstance(message, types.ServerNotification) and isinstance(
+                message.root, types.ResourceUpdatedNotification
+            ):
+                updates[index].append(str(message.root.params.uri))
+
+        return handle
+
+    async def upstream_log(client: Any) -> List[str]:
+        result = await client.call_tool("up_subscriptions", {})
+        text = json.loads(result.content[0].text)["content"]
+        return text[0]["text"].splitlines() if text else []
+
+    uri = "mcp-gateway://up/test://doc"
+    async with AsyncExitStack() as stack:
+        clients = [
+            await stack.enter_async_context(
+                create_connected_server_and_client_session(
+                    gateway._mcp_server, message_handler=recorder(index)
+                )
+            )
+            for index in range(2)
+        ]
+        for _ in range(100):
+            if (await clients[0].list_resources()).resources:
+                break
+            await asyncio.sleep(0.1)
+
+        for client in clients:
+            await client.subscribe_resource(uri)
+        assert await upstream_log(clients[0]) == ["subscribe test://doc"]
+
+        await clients[0].call_tool("up_touch", {"uri": "test://doc"})
+        for _ in range(100):
+            if all(updates):
+                break
+            await asyncio.sleep(0.05)
+        assert updates == [[uri], [uri]]
+
+        await clients[0].unsubscribe_resource(uri)
+        assert await upstream_log(clients[1]) == ["subscribe test://doc"]
+        await clients[1].unsubscribe_resource(uri)
+        assert await upstream_log(clients[1]) == [
+            "subscribe test://doc",
+            "unsubscribe test://doc",
+        ]
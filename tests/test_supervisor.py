@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server
+from mcp_gateway.supervisor import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ServerSupervisor,
+    backoff_delay,
+)
+from tests.conftest import upstream_config
+
+
+def test_circuit_breaker_states() -> None:
+    """An open or half-open circuit rejects calls; closing it lets them through."""
+    circuit = CircuitBreaker("srv")
+    circuit.check()
+
+    circuit.open("down")
+    with pytest.raises(CircuitOpenError):
+        circuit.check()
+    circuit.half_open()
+    with pytest.raises(CircuitOpenError):
+        circuit.check()
+
+    circuit.close()
+    circuit.check()
+    assert circuit.stats()["state"] == CircuitBreaker.CLOSED
+
+
+def test_backoff_delay_is_bounded() -> None:
+    """Jittered delays never exceed the exponential ceiling or the maximum."""
+    for attempt in range(10):
+        delay = backoff_delay(attempt, initial=0.5, maximum=4.0)
+        assert 0 <= delay <= min(4.0, 0.5 * 2**attempt)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_restarts_crashed_server() -> None:
+    """A crashed upstream fails in-flight calls fast and is restarted."""
+    server = Server(
+        "crashy",
+        upstream_config(health_check_interval=60, restart_backoff_initial=0.1),
+    )
+    plugin_manager = PluginManager()
+    await server.start()
+    supervisor = ServerSupervisor(server)
+    supervisor.start()
+    try:
+        first_pid = (await server.call_tool(plugin_manager, "pid", {})).content[0].text
+
+        with pytest.raises(Exception):
+            await asyncio.wait_for(server.call_tool(plugin_manager, "crash", {}), 5)
+
+        for _ in range(100):
+            if server.is_active and supervisor.restarts:
+                break
+            await asyncio.sleep(0.1)
+
+        assert supervisor.stats()["restarts"] == 1
+        assert supervisor.stats()["circuit"]["state"] == CircuitBreaker.CLOSED
+        second_pid = (await server.call_tool(plugin_manager, "pid", {})).content[0].text
+        assert second_pid != first_pid
+    finally:
+        await supervisor.stop()
+        await server.stop()
@@ -0,0 +1,137 @@
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from mcp import types
+from mcp_gateway.plugins.base import (
+    EXECUTION_THREAD,
+    GuardrailPlugin,
+    PluginContext,
+    TracingPlugin,
+)
+from mcp_gateway.plugins.executor import PluginExecutor
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.plugins.tracing_queue import (
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_SAMPLE,
+    TracingQueue,
+)
+
+
+class SlowTracer(TracingPlugin):
+    """Writes each event synchronously and slowly, like a database insert."""
+
+    def __init__(self) -> None:
+        self.events: List[str] = []
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        time.sleep(0.2)
+        self.events.append(f"request {context.arguments}")
+        return context.arguments
+
+    def process_response(self, context: PluginContext) -> Any:
+        time.sleep(0.2)
+        self.events.append(f"response {context.response}")
+        return context.response
+
+
+class Redactor(GuardrailPlugin):
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return {"q": "<redacted>"}
+
+    def process_response(self, context: PluginContext) -> Any:
+        return context.response
+
+
+@pytest.mark.asyncio
+async def test_tracing_runs_off_the_call_path_and_flushes_on_close() -> None:
+    tracer = SlowTracer()
+    queue = TracingQueue()
+    manager = PluginManager(tracing_queue=queue)
+    manager._plugins[TracingPlugin.plugin_type] = [tracer]
+    manager._executors[tracer] = PluginExecutor(tracer, EXECUTION_THREAD, workers=1)
+    manager._plugins[GuardrailPlugin.plugin_type] = [Redactor()]
+
+    started = time.monotonic()
+    arguments = await manager.process_request(
+        PluginContext("srv", "tool", "search", arguments={"q": "secret"})
+    )
+    await manager.process_response(
+        PluginContext("srv", "tool", "search", arguments=arguments, response="ok")
+    )
+    assert time.monotonic() - started < 0.1
+    assert arguments == {"q": "<redacted>"}
+
+    await manager.close()
+    # The request event holds the arguments as they were when it was traced
+    assert tracer.events == ["request {'q': 'secret'}", "response ok"]
+    assert queue.stats("srv") == {
+        "traced": 2,
+        "dropped": 0,
+        "pending": 0,
+        "overflow": OVERFLOW_DROP_OLDEST,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("overflow", [OVERFLOW_DROP_OLDEST, OVERFLOW_SAMPLE])
+async def test_overflow_drops_and_counts_events(overflow: str) -> None:
+    queue = TracingQueue(max_size=2, overflow=overflow)
+    written: List[int] = []
+
+    def event(i: int) -> Any:
+        async def trace() -> None:
+            written.append(i)
+
+        return trace
+
+    # Workers only get to run once the caller yields, so all but two are dropped
+    for i in range(5):
+        queue.put("srv" if i < 4 else "other", event(i))
+    await queue.close()
+
+    assert len(written) == 2
+    if overflow == OVERFLOW_DROP_OLDEST:
+        assert written == [3, 4]
+    dropped = queue.stats("srv")["dropped"] + queue.stats("other")["dropped"]
+    assert dropped == 3
+
+    queue.put("srv", event(5))
+    assert 5 not in written
+
+
+@pytest.mark.asyncio
+async def test_queued_xetrack_writes_rows_to_its_database(tmp_path: Any) -> None:
+    """xetrack's SQLite connection is only used on the thread that opened it."""
+    pytest.importorskip("xetrack")
+    from xetrack import Reader
+
+    db_path = os.path.join(tmp_path, "traces.db")
+    manager = PluginManager(
+        enabled_types=[TracingPlugin.plugin_type],
+        enabled_plugins={TracingPlugin.plugin_type: ["xetrack"]},
+        plugin_settings={"xetrack": {"config": {"db_path": db_path}}},
+        tracing_queue=TracingQueue(),
+    )
+    result = types.CallToolResult(
+        content=[
+            types.TextContent(type="text", text="first"),
+            types.TextContent(type="text", text="second"),
+        ]
+    )
+    for _ in range(3):
+        await manager.process_response(
+            PluginContext("srv", "tool", "echo", arguments={"a": 1}, response=result)
+        )
+    await manager.close()
+
+    assert manager.tracing_queue.stats("srv")["traced"] == 3
+    assert len(Reader(db=db_path).to_df()) == 6
@@ -0,0 +1,36 @@
+import os
+import time
+from typing import Any, List
+
+from mcp_gateway.workers import WorkerSupervisor, bind_socket
+
+
+def sleeping_worker(worker_index: int, sockets: List[Any], seconds: float) -> None:
+    """Worker target that just stays alive."""
+    time.sleep(seconds)
+
+
+def test_supervisor_restarts_exited_workers() -> None:
+    """A worker that dies is replaced by a new process; stop() ends them all."""
+    listener = bind_socket("127.0.0.1", 0)
+    supervisor = WorkerSupervisor(
+        sleeping_worker, 2, [listener], args=(60,), backoff_initial=0.1
+    )
+    supervisor.start()
+    try:
+        first_pids = supervisor.pids
+        assert len(set(first_pids)) == 2 and os.getpid() not in first_pids
+        supervisor._workers[0].process.kill()
+        supervisor._workers[0].process.join()
+
+        deadline = time.monotonic() + 10
+        while supervisor.restarts == 0 and time.monotonic() < deadline:
+            supervisor.check()
+            time.sleep(0.05)
+        assert supervisor.restarts == 1
+        assert supervisor.pids[0] not in (None, first_pids[0])
+        assert supervisor.pids[1] == first_pids[1]
+    finally:
+        supervisor.stop()
+        listener.close()
+    assert supervisor.pids == [None, None]
@@ -0,0 +1,107 @@
+"""A small stdio MCP server used as a stand-in upstream by the gateway tests."""
+
+import asyncio
+import os
+
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import AnyUrl
+
+mcp = FastMCP("Test Upstream")
+
+
+@mcp.tool()
+def echo(text: str) -> str:
+    """Returns the given text."""
+    return text
+
+
+@mcp.tool()
+async def sleep(seconds: float) -> str:
+    """Sleeps for the given number of seconds and returns the process id."""
+    await asyncio.sleep(seconds)
+    return str(os.getpid())
+
+
+@mcp.tool()
+async def sleep_marking_cancel(seconds: float, marker: str) -> str:
+    """Sleeps like ``sleep`` but writes to the marker file if cancelled."""
+    try:
+        await asyncio.sleep(seconds)
+    except asyncio.CancelledError:
+        with open(marker, "w") as f:
+            f.write("cancelled")
+        raise
+    return str(os.getpid())
+
+
+@mcp.tool()
+def pid() -> str:
+    """Returns the process id of this upstream server."""
+    return str(os.getpid())
+
+
+@mcp.tool()
+def crash() -> str:
+    """Terminates the upstream process without answering."""
+    os._exit(1)
+
+
+@mcp.tool()
+async def add_tool(name: str, ctx: Context) -> str:
+    """Registers a new echo-like tool and announces the change to the client."""
+
+    def added(text: str) -> str:
+        return f"{name}: {text}"
+
+    mcp.add_tool(added, name=name, description=f"Tool {name} added at runtime")
+    await ctx.session.send_tool_list_changed()
+    return name
+
+
+@mcp.prompt()
+def greeting(name: str) -> str:
+    """A greeting prompt."""
+    return f"Hello, {name}!"
+
+
+@mcp.resource("test://doc", mime_type="text/plain")
+def doc() -> str:
+    """A text document."""
+    return "The password is hunter2"
+
+
+@mcp.resource("test://items/{item_id}")
+def item(item_id: str) -> str:
+    """An item by id."""
+    return f"item {item_id}"
+
+
+# Subscribe and unsubscribe requests received, in order
+subscription_log = []
+
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe(uri) -> None:
+    subscription_log.append(f"subscribe {uri}")
+
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe(uri) -> None:
+    subscription_log.append(f"unsubscribe {uri}")
+
+
+@mcp.tool()
+def subscriptions() -> str:
+    """Returns the subscribe and unsubscribe requests received so far."""
+    return "\n".join(subscription_log)
+
+
+@mcp.tool()
+async def touch(uri: str, ctx: Context) -> str:
+    """Announces that a resource was updated."""
+    await ctx.session.send_resource_updated(AnyUrl(uri))
+    return uri
+
+
+if __name__ == "__main__":
+    mcp.run()